@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark the DNA codec: validated vs trusted dict_to_dna, and dna_to_dict.
+
+Usage: python bench/bench_codec.py [--count N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.genetics import GeneticsEngine, seeded_rng
+
+
+def best_of(repeats, func, *args):
+    """Fastest wall time of several runs"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=20000, help="DNA dicts per run")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    rng = seeded_rng(0, "bench-codec")
+    monkeys = [GeneticsEngine.generate_random_dna(generation=rng.randint(1, 12), rng=rng) for _ in range(args.count)]
+    dicts = [GeneticsEngine.dna_to_dict(dna) for dna in monkeys]
+
+    cases = [
+        ("dict_to_dna (validated)", lambda: [GeneticsEngine.dict_to_dna(d) for d in dicts]),
+        ("dict_to_dna (trusted)", lambda: [GeneticsEngine.dict_to_dna(d, trusted=True) for d in dicts]),
+        ("dna_to_dict", lambda: [GeneticsEngine.dna_to_dict(dna) for dna in monkeys]),
+    ]
+
+    print(f"🧬 DNA codec benchmark ({args.count:,} monkeys, best of {args.repeats})\n")
+    timings = {}
+    for name, func in cases:
+        timings[name] = best_of(args.repeats, func)
+        per_item = timings[name] / args.count * 1e6
+        print(f"   {name:<26} {timings[name] * 1000:8.1f}ms  {per_item:6.2f}µs/monkey")
+
+    speedup = timings["dict_to_dna (validated)"] / timings["dict_to_dna (trusted)"]
+    print(f"\n✅ Trusted decode is {speedup:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Compare evolution prompt sizes: the old full f-string vs cached prefix + delta.
+
+Counts tokens with tiktoken (o200k_base, as used by gpt-4o) when installed,
+else with the agent's ~4 characters per token estimate. "Uncached" is what
+a provider processes from scratch once the static prefix is cached; note
+that providers only cache prefixes above a minimum size (1024 tokens for
+gpt-4o and Claude Sonnet), which the prefix alone does not reach yet.
+
+Usage: python bench/bench_prompt.py [--count N] [--batch-size N]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.evolution import EvolutionAgent, estimate_tokens
+from src.genetics import TRAIT_CATALOG, GeneticsEngine, TraitCategory, seeded_rng
+from src.local_provider import LocalProvider
+from src.prompts import EVOLUTION_PREFIX, split_cached_prefix
+
+
+RARITY_DESCRIPTIONS = {
+    "common": "Basic traits",
+    "uncommon": "Special traits",
+    "rare": "Unique traits",
+    "legendary": "Ultra-rare traits",
+}
+
+
+def token_counter():
+    """(name, count function) for the best available tokenizer"""
+    try:
+        import tiktoken
+    except ImportError:
+        return "estimate (~4 chars/token)", estimate_tokens
+    encoding = tiktoken.get_encoding("o200k_base")
+    return "tiktoken o200k_base", lambda text: len(encoding.encode(text))
+
+
+def legacy_options():
+    return "\n".join(
+        f"- {category.value}: "
+        + ", ".join(value for rarity in TRAIT_CATALOG.rarities for value in TRAIT_CATALOG.pool(category, rarity))
+        for category in TraitCategory
+    )
+
+
+def legacy_levels():
+    return "\n".join(
+        f"- {rarity.value} ({TRAIT_CATALOG.probabilities[rarity]:.0%} chance): {RARITY_DESCRIPTIONS[rarity.value]}"
+        for rarity in TRAIT_CATALOG.rarities
+    )
+
+
+def legacy_prompt(dna, days):
+    """The single-monkey prompt as it was built before src.prompts"""
+    traits = {
+        cat.value: {"value": trait.value, "rarity": trait.rarity.value}
+        for cat, trait in dna.traits.items()
+    }
+    return f"""You are an AI evolution agent for ForkMonkey - a digital pet that lives on GitHub.
+
+Your task is to evolve this monkey's appearance in a subtle, aesthetically pleasing way.
+
+Current Monkey Traits:
+{json.dumps(traits, indent=2)}
+
+Context:
+- Generation: {dna.generation}
+- Days since last evolution: {days}
+- Evolution should be subtle (1-2 traits max)
+- Maintain aesthetic coherence
+- Rarer traits should change less frequently
+
+Available trait options:
+{legacy_options()}
+
+Rarity levels (from common to legendary):
+{legacy_levels()}
+
+Respond with a JSON object ONLY (no markdown formatting) indicating which traits to change:
+{{
+  "changes": [
+    {{
+      "category": "body_color",
+      "new_value": "golden",
+      "new_rarity": "uncommon",
+      "reason": "Subtle shift to warmer tone"
+    }}
+  ],
+  "evolution_story": "Your monkey is maturing, developing a golden sheen..."
+}}
+
+Keep changes minimal (0-2 traits). Consider the monkey's current aesthetic.
+The evolution_story (2-3 sentences) must mention every new trait value."""
+
+
+def legacy_batch_prompt(monkeys, days):
+    """The batch prompt as it was built before src.prompts"""
+    entries = "\n".join(
+        json.dumps({
+            "id": monkey_id,
+            "generation": dna.generation,
+            "traits": {
+                cat.value: {"value": trait.value, "rarity": trait.rarity.value}
+                for cat, trait in dna.traits.items()
+            },
+        })
+        for monkey_id, dna in monkeys
+    )
+    return f"""You are an AI evolution agent for ForkMonkey - a digital pet that lives on GitHub.
+
+Your task is to evolve each of these monkeys' appearance in a subtle, aesthetically pleasing way.
+Evolve every monkey independently.
+
+Context:
+- Days since last evolution: {days}
+- Evolution should be subtle (1-2 traits max per monkey)
+- Maintain aesthetic coherence
+- Rarer traits should change less frequently
+
+Available trait options:
+{legacy_options()}
+
+Rarity levels (from common to legendary):
+{legacy_levels()}
+
+Monkeys (one JSON object per line):
+{entries}
+
+Respond with a JSON array ONLY (no markdown formatting) with one object per monkey id:
+[
+  {{
+    "id": "m1",
+    "changes": [
+      {{
+        "category": "body_color",
+        "new_value": "golden",
+        "new_rarity": "uncommon",
+        "reason": "Subtle shift to warmer tone"
+      }}
+    ],
+    "evolution_story": "Your monkey is maturing, developing a golden sheen..."
+  }}
+]
+
+Keep changes minimal (0-2 traits per monkey). Consider each monkey's current aesthetic.
+Each evolution_story (2-3 sentences) must mention every new trait value of that monkey."""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1000, help="Monkeys to build prompts for")
+    parser.add_argument("--batch-size", type=int, default=25, help="Monkeys per batch prompt")
+    args = parser.parse_args()
+
+    tokenizer, count = token_counter()
+    rng = seeded_rng(0, "bench-prompt")
+    monkeys = [GeneticsEngine.generate_random_dna(generation=rng.randint(1, 12), rng=rng) for _ in range(args.count)]
+    agent = EvolutionAgent(provider=LocalProvider())
+    prefix = count(EVOLUTION_PREFIX)
+
+    print(f"📝 Evolution prompt sizes ({args.count:,} monkeys, {tokenizer})\n")
+    print(f"   Static prefix (cacheable): {prefix:,} tokens, {len(EVOLUTION_PREFIX):,} chars\n")
+
+    old = [count(legacy_prompt(dna, 1)) for dna in monkeys]
+    new = [agent._prompt_for(dna, 1) for dna in monkeys]
+    new_total = [count(prompt) for prompt in new]
+    new_tail = [count(split_cached_prefix(prompt)[1]) for prompt in new]
+    print("   One monkey per prompt       old      new   uncached")
+    print(f"   Tokens per prompt      {sum(old) / len(old):8.0f} {sum(new_total) / len(new):8.0f} "
+          f"{sum(new_tail) / len(new):10.0f}")
+    print(f"   Tokens for the run     {sum(old):8,} {sum(new_total):8,} {prefix + sum(new_tail):10,}")
+
+    batches = [monkeys[i:i + args.batch_size] for i in range(0, len(monkeys), args.batch_size)]
+    old_batches = new_batches = new_batch_tails = 0
+    for batch in batches:
+        tagged = [(f"m{n}", dna) for n, dna in enumerate(batch, start=1)]
+        old_batches += count(legacy_batch_prompt(tagged, 1))
+        prompt = agent._create_batch_prompt(tagged, 1)
+        new_batches += count(prompt)
+        new_batch_tails += count(split_cached_prefix(prompt)[1])
+    print(f"\n   {args.batch_size} monkeys per prompt")
+    print(f"   Tokens per prompt      {old_batches / len(batches):8.0f} {new_batches / len(batches):8.0f} "
+          f"{new_batch_tails / len(batches):10.0f}")
+    print(f"   Tokens for the run     {old_batches:8,} {new_batches:8,} {prefix + new_batch_tails:10,}")
+
+    print(f"\n✅ Single prompts {1 - sum(new_total) / sum(old):.0%} smaller, "
+          f"batch prompts {1 - new_batches / old_batches:.0%} smaller")
+
+
+if __name__ == "__main__":
+    main()
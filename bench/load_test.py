@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Load test EvolutionAgent.evolve_with_ai against the local stand-in provider.
+
+Drives evolve_with_ai from a pool of worker threads at the target
+concurrency and reports throughput, p50/p95/p99 latency and the share of
+evolutions that fell back to random because the provider failed.
+
+Usage:
+    python bench/load_test.py --requests 500 --concurrency 16 --latency 0.05
+    python bench/load_test.py --http --error-rate 0.05 --output bench/load.json
+    python bench/load_test.py --base-url http://127.0.0.1:8765   # external server
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.evolution import EvolutionAgent, GitHubProvider, without_sdk_retries
+from src.genetics import GeneticsEngine, seeded_rng
+from src.local_provider import LocalProvider, start_server
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_load(agent, monkeys, concurrency):
+    """Evolve every monkey once; returns per-call latencies and wall time"""
+
+    def evolve(dna):
+        start = time.perf_counter()
+        agent.evolve_with_ai(dna)
+        return time.perf_counter() - start
+
+    # evolve_with_ai narrates every call; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(evolve, monkeys))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def report(latencies, elapsed, fallbacks, concurrency, mode):
+    ordered = sorted(latencies)
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50) * 1000, 2),
+            "p95": round(percentile(ordered, 95) * 1000, 2),
+            "p99": round(percentile(ordered, 99) * 1000, 2),
+            "max": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        },
+        "fallbacks": fallbacks,
+        "fallback_rate": round(fallbacks / len(latencies), 4) if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EvolutionAgent load test")
+    parser.add_argument("--requests", type=int, default=200, help="evolve_with_ai calls")
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stand-in mean latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Stand-in latency spread (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Stand-in failure rate")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for monkeys and stand-in draws")
+    parser.add_argument("--http", action="store_true", help="Go through GitHubProvider and a local HTTP server")
+    parser.add_argument("--base-url", help="Use an already running OpenAI-compatible server")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    rng = seeded_rng(args.seed, "load-test")
+    monkeys = [GeneticsEngine.generate_random_dna(generation=rng.randint(1, 12), rng=rng) for _ in range(args.requests)]
+    local = LocalProvider(args.latency, args.jitter, args.error_rate, seed=args.seed)
+
+    server = None
+    if args.base_url or args.http:
+        base_url = args.base_url
+        if not base_url:
+            server, base_url = start_server(local)
+        # No hidden SDK retries, so fallbacks and latencies match the in-process run
+        provider = without_sdk_retries(GitHubProvider("local", model="local", base_url=base_url))
+        mode = f"http ({base_url})"
+    else:
+        provider, mode = local, "in-process"
+
+    print(f"🔥 Load test: {args.requests} evolutions, concurrency {args.concurrency}, {mode}\n")
+    agent = EvolutionAgent(provider=provider)
+    try:
+        latencies, elapsed = run_load(agent, monkeys, args.concurrency)
+    finally:
+        if server:
+            server.shutdown()
+
+    result = report(latencies, elapsed, agent.fallbacks, args.concurrency, mode)
+    latency = result["latency_ms"]
+    print(f"   Throughput: {result['throughput_rps']:.1f} evolutions/s")
+    print(f"   Latency:    p50 {latency['p50']:.1f}ms  p95 {latency['p95']:.1f}ms  "
+          f"p99 {latency['p99']:.1f}ms  max {latency['max']:.1f}ms")
+    print(f"   Fallbacks:  {result['fallbacks']} ({result['fallback_rate']:.1%})")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2))
+        print(f"\n✅ Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Genetics hot-path benchmarks with JSON output for diffing across commits.
+
+Times generate_random_dna, breed, evolve, dna_to_dict, dict_to_dna and
+get_rarity_score (plus the vectorized generate_many) over fixed-seed
+populations, and records peak traced memory per run.
+
+Usage:
+    python bench/run_genetics.py --output bench/results.json
+    python bench/run_genetics.py --sizes 1,1000,1000000 --cases generate_many
+    python bench/run_genetics.py --compare old.json new.json --threshold 0.15
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.genetics import GeneticsEngine, seeded_rng
+
+
+DEFAULT_SIZES = [1, 10, 100, 1000, 10000, 100000]
+FULL_SIZES = DEFAULT_SIZES + [1000000]
+MIN_ITEMS_PER_TIMING = 10000
+
+
+def _monkeys(size, seed):
+    rng = seeded_rng(seed, "population", size)
+    return [GeneticsEngine.generate_random_dna(generation=rng.randint(1, 12), rng=rng) for _ in range(size)]
+
+
+# Each case: setup(size, seed) -> state, run(state, rng) -> result
+CASES = {
+    "generate_random_dna": (
+        lambda size, seed: size,
+        lambda size, rng: [GeneticsEngine.generate_random_dna(rng=rng) for _ in range(size)],
+    ),
+    "breed": (
+        _monkeys,
+        lambda monkeys, rng: [GeneticsEngine.breed(dna, rng=rng) for dna in monkeys],
+    ),
+    "evolve": (
+        _monkeys,
+        lambda monkeys, rng: [GeneticsEngine.evolve(dna, rng=rng) for dna in monkeys],
+    ),
+    "dna_to_dict": (
+        _monkeys,
+        lambda monkeys, rng: [GeneticsEngine.dna_to_dict(dna) for dna in monkeys],
+    ),
+    "dict_to_dna": (
+        lambda size, seed: [GeneticsEngine.dna_to_dict(dna) for dna in _monkeys(size, seed)],
+        lambda dicts, rng: [GeneticsEngine.dict_to_dna(data) for data in dicts],
+    ),
+    "dict_to_dna_trusted": (
+        lambda size, seed: [GeneticsEngine.dna_to_dict(dna) for dna in _monkeys(size, seed)],
+        lambda dicts, rng: [GeneticsEngine.dict_to_dna(data, trusted=True) for data in dicts],
+    ),
+    "get_rarity_score": (
+        _monkeys,
+        lambda monkeys, rng: [dna.get_rarity_score() for dna in monkeys],
+    ),
+    "generate_many": (
+        lambda size, seed: size,
+        lambda size, rng: GeneticsEngine.generate_many(size, rng=_numpy_rng(rng)),
+    ),
+}
+
+
+def _numpy_rng(rng):
+    import numpy as np
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def measure(case, size, seed, repeats):
+    """Best wall time over repeats, plus peak traced memory of one extra run"""
+    setup, run = CASES[case]
+    state = setup(size, seed)
+
+    # Small sizes loop inside the timer so each measurement covers ~10k items
+    loops = max(1, MIN_ITEMS_PER_TIMING // size)
+    best = float("inf")
+    for attempt in range(repeats):
+        rng = seeded_rng(seed, case, size, attempt)
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(loops):
+            result = run(state, rng)
+        best = min(best, (time.perf_counter() - start) / loops)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = run(state, seeded_rng(seed, case, size, "memory"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "case": case,
+        "size": size,
+        "seconds": best,
+        "per_item_us": best / size * 1e6,
+        "peak_bytes": peak,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(cases, sizes, seed, repeats):
+    results = []
+    for case in cases:
+        for size in sizes:
+            # Large sizes are slow; one timed run is enough there
+            result = measure(case, size, seed, repeats if size <= 10000 else 1)
+            results.append(result)
+            print(f"   {case:<22} n={size:<8} {result['per_item_us']:9.2f}µs/item  "
+                  f"{result['peak_bytes'] / 1024:10.1f} KiB peak")
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare(old_file, new_file, threshold):
+    """Print per-case changes; return True if anything regressed past threshold"""
+    old = {(r["case"], r["size"]): r for r in json.loads(Path(old_file).read_text())["results"]}
+    new = {(r["case"], r["size"]): r for r in json.loads(Path(new_file).read_text())["results"]}
+
+    regressed = False
+    print(f"📊 {old_file} → {new_file} (threshold {threshold:.0%})\n")
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        time_change = after["per_item_us"] / before["per_item_us"] - 1
+        memory_change = after["peak_bytes"] / before["peak_bytes"] - 1 if before["peak_bytes"] else 0.0
+        flag = ""
+        if time_change > threshold or memory_change > threshold:
+            flag = "  ❌ regression"
+            regressed = True
+        elif time_change < -threshold:
+            flag = "  ✅ faster"
+        print(f"   {key[0]:<22} n={key[1]:<8} time {time_change:+7.1%}  memory {memory_change:+7.1%}{flag}")
+
+    for key in sorted(old.keys() ^ new.keys()):
+        print(f"   {key[0]:<22} n={key[1]:<8} only in {'old' if key in old else 'new'} results")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genetics hot-path benchmarks")
+    parser.add_argument("--sizes", help="Comma-separated population sizes (default 1..100000)")
+    parser.add_argument("--full", action="store_true", help="Include the 1M population size")
+    parser.add_argument("--cases", help=f"Comma-separated cases (default all: {', '.join(CASES)})")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for inputs and runs")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per measurement (best is kept)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change counted as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    sizes = [int(size) for size in args.sizes.split(",")] if args.sizes else (FULL_SIZES if args.full else DEFAULT_SIZES)
+    cases = args.cases.split(",") if args.cases else list(CASES)
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    print(f"⏱️  Genetics benchmarks (seed {args.seed}, sizes {sizes})\n")
+    report = run_suite(cases, sizes, args.seed, args.repeats)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,20 +11,14 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.genetics import MonkeyDNA, Trait, TraitCategory, Rarity, GeneticsEngine
+from src.genetics import MonkeyDNA, TraitCategory, Rarity, GeneticsEngine, TRAIT_CATALOG
 from src.visualizer import MonkeyVisualizer
 
 
 def find_rarity_for_trait(category: TraitCategory, value: str) -> Rarity:
-    """Look up the rarity for a trait value by searching TRAIT_POOL."""
-    trait_pool = GeneticsEngine.TRAIT_POOL.get(category, {})
-    
-    for rarity, values in trait_pool.items():
-        if value in values:
-            return rarity
-    
+    """Look up the rarity for a trait value in the trait catalog."""
     # Default to common if not found
-    return Rarity.COMMON
+    return TRAIT_CATALOG.rarity_of(category, value) or Rarity.COMMON
 
 
 def create_dna_from_traits(traits_dict: dict, entry: dict) -> MonkeyDNA:
@@ -44,21 +38,21 @@ def create_dna_from_traits(traits_dict: dict, entry: dict) -> MonkeyDNA:
         if trait_key in category_map:
             category = category_map[trait_key]
             rarity = find_rarity_for_trait(category, trait_value)
-            traits[category] = Trait(
-                category=category,
-                value=trait_value,
-                rarity=rarity,
-                gene_sequence=f"regen_{trait_value}"
-            )
+            traits[trait_key] = {
+                "value": trait_value,
+                "rarity": rarity.value,
+                "gene_sequence": f"regen_{trait_value}"
+            }
     
-    return MonkeyDNA(
-        generation=entry.get("generation", 1),
-        parent_id=None,
-        traits=traits,
-        mutation_count=entry.get("mutation_count", 0),
-        birth_timestamp=0,
-        dna_hash=entry.get("dna_hash", "")
-    )
+    # History entries are our own output, so skip validation for bulk regeneration
+    return GeneticsEngine.dict_to_dna({
+        "generation": entry.get("generation", 1),
+        "parent_id": None,
+        "traits": traits,
+        "mutation_count": entry.get("mutation_count", 0),
+        "birth_timestamp": 0,
+        "dna_hash": entry.get("dna_hash", "")
+    }, trusted=True)
 
 
 def main():
@@ -0,0 +1,198 @@
+"""
+ForkMonkey Breeding Odds
+
+Exact distribution of a child's traits and rarity score for a parent,
+following GeneticsEngine.breed step by step per category:
+
+1. 3% gen-locked roll (when the child's generation still has locked traits)
+2. otherwise 50% inherit the parent's trait, 50% a fresh _roll_rarity draw
+3. then with probability mutation_rate, _mutate_trait (70% same rarity,
+   15% one step up or down, clamped; new value uniform in that pool)
+
+Categories are independent, so the rarity score distribution is the
+convolution of the per-category point distributions.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from src.genetics import (
+    GeneticsEngine, MonkeyDNA, Rarity, TraitCategory, RARITY_POINTS, RARITY_PROBABILITIES,
+    TRAIT_CATALOG, BREED_GEN_LOCKED_CHANCE, INHERIT_CHANCE, MUTATION_KEEP_RARITY_CHANCE,
+)
+from src.rarity_stats import RarityDistribution, convolve
+
+
+RARITIES = TRAIT_CATALOG.rarities
+
+TraitKey = Tuple[str, Rarity]
+
+
+def _pool_distribution(category: TraitCategory, rarity_weights: Dict[Rarity, float]) -> Dict[TraitKey, float]:
+    """Spread each rarity's weight uniformly over its trait pool"""
+    outcome = {}
+    for rarity, weight in rarity_weights.items():
+        if weight <= 0:
+            continue
+        pool = TRAIT_CATALOG.pool(category, rarity)
+        for value in pool:
+            outcome[(value, rarity)] = outcome.get((value, rarity), 0.0) + weight / len(pool)
+    return outcome
+
+
+def _add(total: Dict[TraitKey, float], part: Dict[TraitKey, float], weight: float):
+    for key, probability in part.items():
+        total[key] = total.get(key, 0.0) + weight * probability
+
+
+def category_distribution(
+    category: TraitCategory,
+    parent_trait: TraitKey,
+    child_generation: int,
+    mutation_rate: float,
+) -> Dict[TraitKey, float]:
+    """Exact probability of each (value, rarity) for one category of the child"""
+    before = {}
+
+    locked = GeneticsEngine.get_gen_locked_traits(category, child_generation)
+    lock_chance = BREED_GEN_LOCKED_CHANCE if locked else 0.0
+    for value in locked:
+        _add(before, {(value, Rarity.LEGENDARY): 1.0}, lock_chance / len(locked))
+
+    _add(before, {parent_trait: 1.0}, (1 - lock_chance) * INHERIT_CHANCE)
+    _add(before, _pool_distribution(category, RARITY_PROBABILITIES), (1 - lock_chance) * (1 - INHERIT_CHANCE))
+
+    # Mutation only depends on the current rarity
+    rarity_weights = {}
+    shift_chance = (1 - MUTATION_KEEP_RARITY_CHANCE) / 2
+    for (_, rarity), probability in before.items():
+        r = TRAIT_CATALOG.rarity_index[rarity]
+        for target, chance in (
+            (r, MUTATION_KEEP_RARITY_CHANCE),
+            (max(0, r - 1), shift_chance),
+            (min(len(RARITIES) - 1, r + 1), shift_chance),
+        ):
+            rarity_weights[RARITIES[target]] = rarity_weights.get(RARITIES[target], 0.0) + probability * chance
+
+    after = {}
+    _add(after, before, 1 - mutation_rate)
+    _add(after, _pool_distribution(category, rarity_weights), mutation_rate)
+    return after
+
+
+class BreedingOdds:
+    """Exact child outcome distribution for one parent and mutation rate"""
+
+    def __init__(
+        self,
+        parent_hash: str,
+        child_generation: int,
+        mutation_rate: float,
+        traits: Dict[TraitCategory, Dict[TraitKey, float]],
+    ):
+        self.parent_hash = parent_hash
+        self.child_generation = child_generation
+        self.mutation_rate = mutation_rate
+        self.traits = traits
+
+        points = {0: 1.0}
+        for category in traits:
+            category_points = {}
+            for (_, rarity), probability in traits[category].items():
+                value = RARITY_POINTS[rarity]
+                category_points[value] = category_points.get(value, 0.0) + probability
+            points = convolve(points, category_points)
+        self.score = RarityDistribution(points)
+
+    def rarity_probabilities(self, category: TraitCategory) -> Dict[Rarity, float]:
+        """Chance of each rarity for one category of the child"""
+        totals = {rarity: 0.0 for rarity in RARITIES}
+        for (_, rarity), probability in self.traits[category].items():
+            totals[rarity] += probability
+        return totals
+
+    def legendary_chance(self, category: TraitCategory) -> float:
+        return self.rarity_probabilities(category)[Rarity.LEGENDARY]
+
+    def any_legendary_chance(self) -> float:
+        """Chance the child has at least one legendary trait"""
+        none = 1.0
+        for category in self.traits:
+            none *= 1 - self.legendary_chance(category)
+        return 1 - none
+
+    def expected_rarity_score(self) -> float:
+        return self.score.mean()
+
+    def to_dict(self) -> dict:
+        """Serializable form for the web dashboard"""
+        return {
+            "parent_hash": self.parent_hash,
+            "child_generation": self.child_generation,
+            "mutation_rate": self.mutation_rate,
+            "expected_rarity_score": round(self.expected_rarity_score(), 4),
+            "any_legendary_chance": round(self.any_legendary_chance(), 6),
+            "categories": {
+                category.value: {
+                    "rarities": {
+                        rarity.value: round(probability, 6)
+                        for rarity, probability in self.rarity_probabilities(category).items()
+                    },
+                    "values": {
+                        value: round(probability, 6)
+                        for (value, _), probability in sorted(
+                            outcomes.items(), key=lambda item: item[1], reverse=True
+                        )
+                    },
+                }
+                for category, outcomes in self.traits.items()
+            },
+            "rarity_score": self.score.to_dict(),
+        }
+
+
+@lru_cache(maxsize=1024)
+def _odds(
+    parent_hash: str,
+    child_generation: int,
+    mutation_rate: float,
+    parent_traits: Tuple[Tuple[TraitCategory, str, Rarity], ...],
+) -> BreedingOdds:
+    traits = {
+        category: category_distribution(category, (value, rarity), child_generation, mutation_rate)
+        for category, value, rarity in parent_traits
+    }
+    return BreedingOdds(parent_hash, child_generation, mutation_rate, traits)
+
+
+def breeding_odds(parent: MonkeyDNA, mutation_rate: float = 0.3) -> BreedingOdds:
+    """
+    Exact outcome distribution of GeneticsEngine.breed(parent, mutation_rate)
+
+    Cached per parent hash (plus generation and trait rarities, which the
+    hash does not cover) and mutation rate.
+    """
+    parent_traits = tuple(
+        (category, trait.value, trait.rarity)
+        for category, trait in parent.traits.items()
+    )
+    return _odds(parent.dna_hash, parent.generation + 1, mutation_rate, parent_traits)
+
+
+def main():
+    """Print breeding odds for a random parent"""
+    print("🍼 ForkMonkey Breeding Odds\n")
+
+    parent = GeneticsEngine.generate_random_dna()
+    odds = breeding_odds(parent)
+
+    for category in parent.traits:
+        print(f"   {category.value:<16} legendary {odds.legendary_chance(category) * 100:5.2f}%")
+    print(f"\n   Any legendary trait: {odds.any_legendary_chance() * 100:.2f}%")
+    print(f"   Expected rarity score: {odds.expected_rarity_score():.2f}")
+
+    print("\n✅ Breeding odds working!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+ForkMonkey Breeding Planner
+
+Ranks community monkeys by how good a parent they make: for every fork in
+web/community_data.json, the expected rarity score of a child bred from it
+and the chance that child has at least one legendary trait, following the
+exact model in src.breeding_odds.
+
+Both figures are sums/products over independent categories, so only the
+per-category summary (expected points, legendary chance) is needed. It
+depends on nothing but the parent trait, the child's gen-lock bucket and
+the mutation rate, and is cached on those - tens of thousands of candidates
+share a few hundred distribution computations. The top candidates are
+picked with a heap and written to web/breeding_recommendations.json.
+"""
+
+import heapq
+import json
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.breeding_odds import category_distribution
+from src.genetics import GEN_LOCK_HORIZON, RARITY_POINTS, Rarity, TraitCategory
+from src.genome import PackedGenome
+
+
+COMMUNITY_FILE = Path("web/community_data.json")
+RECOMMENDATIONS_FILE = Path("web/breeding_recommendations.json")
+
+ParentTraits = Tuple[Tuple[TraitCategory, str, Rarity], ...]
+
+
+@lru_cache(maxsize=None)
+def _category_summary(
+    category: TraitCategory,
+    value: str,
+    rarity: Rarity,
+    child_generation: int,
+    mutation_rate: float,
+) -> Tuple[float, float]:
+    """Expected rarity points and legendary chance of one child category"""
+    distribution = category_distribution(category, (value, rarity), child_generation, mutation_rate)
+    expected = sum(probability * RARITY_POINTS[r] for (_, r), probability in distribution.items())
+    legendary = sum(probability for (_, r), probability in distribution.items() if r == Rarity.LEGENDARY)
+    return expected, legendary
+
+
+def child_outlook(generation: int, traits: ParentTraits, mutation_rate: float = 0.3) -> Tuple[float, float]:
+    """
+    Expected child rarity score (0-100) and chance of any legendary trait
+
+    Same figures as breeding_odds(...).expected_rarity_score() and
+    .any_legendary_chance(), without building the full score distribution.
+    """
+    if not traits:
+        return 0.0, 0.0
+
+    # Gen-lock tables are flat from GEN_LOCK_HORIZON on, so later
+    # generations share one cache bucket
+    child_generation = min(generation + 1, GEN_LOCK_HORIZON)
+    points = 0.0
+    no_legendary = 1.0
+    for category, value, rarity in traits:
+        expected, legendary = _category_summary(category, value, rarity, child_generation, mutation_rate)
+        points += expected
+        no_legendary *= 1 - legendary
+
+    max_points = len(traits) * RARITY_POINTS[Rarity.LEGENDARY]
+    return points / max_points * 100, 1 - no_legendary
+
+
+def parent_traits(monkey: dict) -> Optional[Tuple[int, ParentTraits]]:
+    """
+    Generation and traits of a community entry, or None if it has no usable DNA
+
+    Prefers the full dna.json, then the compact DNA code, then the traits
+    summary in stats.json.
+    """
+    data = monkey.get("monkey_dna")
+    if not data and monkey.get("dna_code"):
+        try:
+            data = PackedGenome.from_code(monkey["dna_code"]).to_dict()
+        except ValueError:
+            data = None
+    if not data:
+        data = monkey.get("monkey_stats")
+    if not data or not data.get("traits"):
+        return None
+
+    try:
+        traits = tuple(
+            (TraitCategory(category), trait["value"], Rarity(trait["rarity"]))
+            for category, trait in data["traits"].items()
+        )
+        return int(data.get("generation", 1)), traits
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def rank_parents(monkeys: Iterable[dict], mutation_rate: float = 0.3, top: Optional[int] = 50) -> List[dict]:
+    """Best parents by expected child rarity, then legendary chance"""
+    candidates = []
+    for monkey in monkeys:
+        parsed = parent_traits(monkey)
+        if parsed is None:
+            continue
+        generation, traits = parsed
+        expected, legendary = child_outlook(generation, traits, mutation_rate)
+        candidates.append((expected, legendary, monkey, generation))
+
+    count = len(candidates) if top is None else top
+    best = heapq.nlargest(count, candidates, key=lambda candidate: (candidate[0], candidate[1]))
+
+    return [
+        {
+            "rank": rank,
+            "full_name": monkey.get("full_name"),
+            "url": monkey.get("url"),
+            "generation": generation,
+            "rarity_score": (monkey.get("monkey_stats") or {}).get("rarity_score"),
+            "expected_child_rarity": round(expected, 4),
+            "legendary_chance": round(legendary, 6),
+        }
+        for rank, (expected, legendary, monkey, generation) in enumerate(best, start=1)
+    ]
+
+
+def generate_recommendations(
+    monkeys: List[dict],
+    mutation_rate: float = 0.3,
+    top: Optional[int] = 50,
+    output_file: Path = RECOMMENDATIONS_FILE,
+) -> dict:
+    """Rank community monkeys and write breeding_recommendations.json"""
+    recommendations = rank_parents(monkeys, mutation_rate, top)
+    data = {
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+        "mutation_rate": mutation_rate,
+        "total_candidates": len(monkeys),
+        "recommendations": recommendations,
+    }
+
+    output_file = Path(output_file)
+    output_file.parent.mkdir(exist_ok=True)
+    with open(output_file, "w") as f:
+        json.dump(data, f, indent=2)
+
+    print(f"🍼 Generated {output_file} ({len(recommendations)} recommendations)")
+    return data
+
+
+def main():
+    """Rank the parents in web/community_data.json"""
+    print("🍼 ForkMonkey Breeding Planner\n")
+
+    if not COMMUNITY_FILE.exists():
+        print(f"❌ {COMMUNITY_FILE} not found. Run scan_community.py first.")
+        return
+
+    with open(COMMUNITY_FILE) as f:
+        monkeys = json.load(f).get("forks", [])
+
+    data = generate_recommendations(monkeys, top=10)
+    for entry in data["recommendations"]:
+        print(f"   #{entry['rank']:<3} {entry['full_name']:<45} "
+              f"child rarity {entry['expected_child_rarity']:5.1f}, "
+              f"legendary {entry['legendary_chance'] * 100:5.1f}%")
+
+    print("\n✅ Breeding planner working!")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ from src.genetics import GeneticsEngine, MonkeyDNA, TraitCategory
 from src.storage import MonkeyStorage
 from src.visualizer import MonkeyVisualizer
 from src.evolution import EvolutionAgent
+from src.rarity_stats import rarity_percentile
 
 console = Console()
 
@@ -110,7 +111,8 @@ def init(from_fork, force):
 @cli.command()
 @click.option('--ai', is_flag=True, help='Use AI-powered evolution')
 @click.option('--strength', default=0.1, help='Evolution strength (0-1)')
-def evolve(ai, strength):
+@click.option('--days', default=1, type=click.IntRange(min=1), help='Number of days to evolve')
+def evolve(ai, strength, days):
     """Evolve your monkey"""
     console.print("\n🧬 [bold cyan]Evolving monkey...[/bold cyan]\n")
     
@@ -125,7 +127,6 @@ def evolve(ai, strength):
     console.print(f"Current DNA: {dna.dna_hash}")
     console.print(f"Mutations so far: {dna.mutation_count}")
     
-    # Evolve
     # Evolve
     if ai:
         provider = os.getenv("AI_PROVIDER", "github")
@@ -133,17 +134,19 @@ def evolve(ai, strength):
         
         try:
             agent = EvolutionAgent(provider_type=provider)
-            evolved_dna = agent.evolve_with_ai(dna, days_passed=1)
-            story = agent.generate_evolution_story(dna, evolved_dna)
+            evolved_dna, story = agent.evolve_with_story(dna, days_passed=days)
         except Exception as e:
             console.print(f"[yellow]⚠️  AI evolution failed: {e}[/yellow]")
             console.print("[cyan]🎲 Falling back to random evolution...[/cyan]")
-            evolved_dna = GeneticsEngine.evolve(dna, evolution_strength=strength)
+            evolved_dna = GeneticsEngine.evolve_days(dna, days, evolution_strength=strength)
             story = "Your monkey evolved randomly!"
     else:
-        console.print(f"\n[cyan]🎲 Using random evolution (strength: {strength})...[/cyan]")
-        evolved_dna = GeneticsEngine.evolve(dna, evolution_strength=strength)
-        story = "Your monkey evolved randomly!"
+        console.print(f"\n[cyan]🎲 Using random evolution (strength: {strength}, days: {days})...[/cyan]")
+        if days == 1:
+            evolved_dna = GeneticsEngine.evolve(dna, evolution_strength=strength)
+        else:
+            evolved_dna = GeneticsEngine.evolve_days(dna, days, evolution_strength=strength)
+        story = "Your monkey evolved randomly!" if days == 1 else f"Your monkey evolved randomly over {days} days!"
     
     # Show changes
     console.print("\n[bold]Changes:[/bold]")
@@ -164,6 +167,7 @@ def evolve(ai, strength):
     # Save
     storage.save_dna_locally(evolved_dna)
     storage.save_stats(evolved_dna, age_days=0)  # TODO: calculate actual age
+    storage.save_breeding_odds(evolved_dna)
     
     # Generate new visualization
     svg = MonkeyVisualizer.generate_svg(evolved_dna)
@@ -204,19 +208,8 @@ def show():
     age_days = len(history)
     rarity = dna.get_rarity_score()
     
-    # Calculate rarity percentile (simulated based on score distribution)
-    # In reality, this would compare against community data
-    # For now, we estimate based on the score
-    if rarity >= 80:
-        percentile = 99
-    elif rarity >= 60:
-        percentile = 95
-    elif rarity >= 40:
-        percentile = 80
-    elif rarity >= 25:
-        percentile = 50
-    else:
-        percentile = 100 - int(rarity * 2)  # Lower scores = lower percentile
+    # Exact percentile against the rarity-score distribution for this generation
+    percentile = rarity_percentile(rarity, dna.generation)
     
     # Determine tier
     if rarity >= 80:
@@ -244,7 +237,7 @@ def show():
     table.add_row("Mutations", str(dna.mutation_count))
     table.add_row("Rarity Score", f"{rarity:.1f}/100")
     table.add_row("Rarity Tier", f"[{tier_color}]{tier}[/{tier_color}]")
-    table.add_row("Percentile", f"Rarer than {percentile}% of monkeys")
+    table.add_row("Percentile", f"Rarer than {percentile:.1f}% of monkeys")
     
     # Get streak info
     streak_data = storage.get_streak()
@@ -273,18 +266,12 @@ def show():
     for cat, trait in dna.traits.items():
         color = rarity_colors.get(trait.rarity.value, 'white')
         
-        # Check if this is a gen-locked trait
-        gen_locked = GeneticsEngine.get_gen_locked_traits(cat, dna.generation)
-        is_gen_locked = trait.value in gen_locked
+        # Check if this is a gen-locked trait still available to this generation
+        max_gen = GeneticsEngine.get_gen_lock_generation(cat, trait.value)
         
         special = ""
-        if is_gen_locked:
-            # Find which generation it's locked to
-            if cat in GeneticsEngine.GEN_LOCKED_TRAITS:
-                for max_gen, traits in GeneticsEngine.GEN_LOCKED_TRAITS[cat].items():
-                    if trait.value in traits:
-                        special = f"🔒 Gen 1-{max_gen} only!"
-                        break
+        if max_gen is not None and dna.generation <= max_gen:
+            special = f"🔒 Gen 1-{max_gen} only!"
         
         traits_table.add_row(
             cat.value.replace('_', ' ').title(), 
@@ -298,20 +285,13 @@ def show():
     
     # Check for extinct traits that are now unavailable
     if dna.generation > 1:
-        extinct_count = 0
-        for cat in TraitCategory:
-            locked = GeneticsEngine.get_gen_locked_traits(cat, dna.generation)
-            all_locked = []
-            if cat in GeneticsEngine.GEN_LOCKED_TRAITS:
-                for max_gen, traits in GeneticsEngine.GEN_LOCKED_TRAITS[cat].items():
-                    if dna.generation > max_gen:
-                        extinct_count += len(traits)
+        extinct_count = len(GeneticsEngine.get_extinct_traits(dna.generation))
         
         if extinct_count > 0:
             console.print(f"\n[dim]⚠️  {extinct_count} trait(s) are now extinct for your generation. Fork earlier to get them![/dim]")
     
     # Show flex message
-    console.print(f"\n[dim]💪 Flex: \"My monkey is rarer than {percentile}% of all ForkMonkeys!\"[/dim]")
+    console.print(f"\n[dim]💪 Flex: \"My monkey is rarer than {percentile:.1f}% of all ForkMonkeys!\"[/dim]")
 
 
 @cli.command()
@@ -684,20 +664,11 @@ def share_card(copy):
                 lines.append(f"{emoji_row} {trait_labels[trait_key]}: {display_value}")
     
     # Calculate percentile
-    if rarity >= 80:
-        percentile = 99
-    elif rarity >= 60:
-        percentile = 95
-    elif rarity >= 40:
-        percentile = 80
-    elif rarity >= 25:
-        percentile = 50
-    else:
-        percentile = 100 - int(rarity * 2)
+    percentile = rarity_percentile(rarity, dna.generation)
     
     lines.append("")
     lines.append(f"📈 Rarity: {rarity:.1f}/100{rarity_change}")
-    lines.append(f"🏆 Rarer than {percentile}% of monkeys!")
+    lines.append(f"🏆 Rarer than {percentile:.1f}% of monkeys!")
     lines.append(f"🧬 Gen {dna.generation} | 🔄 {dna.mutation_count} mutations")
     lines.append("")
     lines.append(f"Fork yours free: github.com/{repo}")
@@ -888,6 +859,7 @@ def leaderboard():
     table.add_column("Value", style="green")
     
     table.add_row("Rarity Score", f"{rarity:.1f}/100")
+    table.add_row("Percentile", f"Rarer than {rarity_percentile(rarity, dna.generation):.1f}% of monkeys")
     table.add_row("Generation", str(dna.generation))
     table.add_row("Mutations", str(dna.mutation_count))
     
@@ -911,5 +883,222 @@ def leaderboard():
     console.print("\n[dim]View full leaderboard at your GitHub Pages site![/dim]")
 
 
+@cli.command()
+@click.option('--mutation-rate', default=0.3, help='Breeding mutation rate (0-1)')
+def odds(mutation_rate):
+    """Show exact odds for a fork of your monkey"""
+    from src.breeding_odds import breeding_odds
+    
+    console.print("\n🍼 [bold cyan]Breeding Odds[/bold cyan]\n")
+    
+    storage = MonkeyStorage()
+    dna = storage.load_dna()
+    
+    if not dna:
+        console.print("[red]❌ No monkey found! Run 'init' first.[/red]")
+        return
+    
+    result = breeding_odds(dna, mutation_rate)
+    
+    table = Table(title=f"Gen {result.child_generation} Child (mutation rate {mutation_rate})")
+    table.add_column("Category", style="cyan")
+    table.add_column("Most Likely", style="green")
+    table.add_column("Common", style="white")
+    table.add_column("Uncommon", style="green")
+    table.add_column("Rare", style="blue")
+    table.add_column("Legendary", style="magenta")
+    
+    for cat in dna.traits:
+        (value, _), chance = max(result.traits[cat].items(), key=lambda item: item[1])
+        rarities = result.rarity_probabilities(cat)
+        table.add_row(
+            cat.value.replace('_', ' ').title(),
+            f"{value.replace('_', ' ').title()} ({chance * 100:.1f}%)",
+            *(f"{rarities[rarity] * 100:.1f}%" for rarity in rarities)
+        )
+    
+    console.print(table)
+    console.print(f"\n🦄 Chance of at least one legendary trait: [bold magenta]{result.any_legendary_chance() * 100:.1f}%[/bold magenta]")
+    console.print(f"📊 Expected rarity score: [bold]{result.expected_rarity_score():.1f}/100[/bold]")
+    console.print(f"   Your monkey: {dna.get_rarity_score():.1f}/100, "
+                  f"child beats it with {100 - result.score.percentile(dna.get_rarity_score() + 1e-6):.1f}% chance")
+    
+    storage.save_breeding_odds(dna, mutation_rate)
+
+
+@cli.command()
+@click.option('--generations', default=10, type=click.IntRange(min=1), help='Generations to grow')
+@click.option('--branching', default=3, type=click.IntRange(min=1), help='Forks per monkey per generation')
+@click.option('--shards', default=8, type=click.IntRange(min=1), help='Independent subtrees (units of parallel work)')
+@click.option('--max-width', default=2000, type=click.IntRange(min=1), help='Max monkeys kept per generation')
+@click.option('--mutation-rate', default=0.3, help='Breeding mutation rate (0-1)')
+@click.option('--strength', default=0.1, help='Evolution strength per generation (0-1)')
+@click.option('--seed', default=0, help='Random seed (same seed, same results)')
+@click.option('--workers', default=None, type=int, help='Worker processes (default: all CPUs)')
+@click.option('--output', default='monkey_data/simulation.jsonl', help='JSONL file for per-generation aggregates')
+@click.option('--random-genesis', is_flag=True, help='Start from a random monkey instead of yours')
+def simulate(generations, branching, shards, max_width, mutation_rate, strength, seed, workers, output, random_genesis):
+    """Simulate a fork tree to study trait survival"""
+    from src.genetics import GEN_LOCK_MAX_GENERATION, seeded_rng
+    from src.simulate import simulate as run_simulation
+
+    console.print("\n🌳 [bold cyan]Simulating fork tree...[/bold cyan]\n")
+    
+    genesis = None if random_genesis else MonkeyStorage().load_dna()
+    if not genesis:
+        genesis = GeneticsEngine.generate_random_dna(rng=seeded_rng(seed, "genesis-dna"))
+        console.print("[dim]Using a random genesis monkey[/dim]")
+    
+    result = run_simulation(
+        genesis,
+        generations=generations,
+        branching=branching,
+        shards=shards,
+        max_width=max_width,
+        mutation_rate=mutation_rate,
+        evolution_strength=strength,
+        seed=seed,
+        workers=workers,
+        output=Path(output),
+    )
+    
+    gen_locked = sorted({value for _, value in GEN_LOCK_MAX_GENERATION})
+    
+    table = Table(title="Generations")
+    table.add_column("Gen", style="cyan")
+    table.add_column("Monkeys", style="green")
+    table.add_column("Mean Rarity", style="yellow")
+    table.add_column("Gen-Locked Carriers", style="magenta")
+    
+    for generation, stats in result.generations.items():
+        carriers = sum(stats.trait_count(value) for value in gen_locked)
+        table.add_row(str(generation), str(stats.count), f"{stats.mean_rarity():.1f}", str(carriers))
+    
+    console.print(table)
+    
+    console.print("\n[bold]Gen-locked trait survival:[/bold]")
+    for value in gen_locked:
+        last_seen = result.last_seen(value)
+        status = f"last seen in Gen {last_seen}" if last_seen else "[red]never appeared[/red]"
+        console.print(f"  • {value}: {status}")
+    
+    console.print(f"\n[bold green]✅ {result.total_monkeys:,} monkeys in {result.elapsed:.2f}s "
+                  f"({result.monkeys_per_second:,.0f} monkeys/sec)[/bold green]")
+    console.print(f"[dim]Aggregates saved to: {output}[/dim]")
+
+
+@cli.command()
+@click.option('--community', 'community_file', default='web/community_data.json', help='Community data file to aggregate')
+@click.option('--random', 'random_count', default=0, type=click.IntRange(min=0), help='Aggregate N random monkeys instead')
+@click.option('--top', default=3, type=click.IntRange(min=1), help='Values shown per category')
+def stats(community_file, random_count, top):
+    """Show trait statistics for a population of monkeys"""
+    import json
+    from src.population import TraitStats, generate_many
+    
+    if random_count:
+        console.print(f"\n📈 [bold cyan]Statistics of {random_count:,} random monkeys[/bold cyan]\n")
+        result = generate_many(random_count).trait_stats()
+    else:
+        path = Path(community_file)
+        if not path.exists():
+            console.print(f"[red]❌ {community_file} not found! Run the community scan or use --random N.[/red]")
+            return
+        console.print(f"\n📈 [bold cyan]Community Statistics[/bold cyan] [dim]({community_file})[/dim]\n")
+        with open(path) as f:
+            forks = json.load(f).get("forks", [])
+        result = TraitStats.from_records(
+            (
+                (fork.get("monkey_stats") or {}).get("generation", 1),
+                (fork.get("monkey_stats") or {}).get("rarity_score", 0),
+                (fork.get("monkey_stats") or {}).get("traits") or (fork.get("monkey_dna") or {}).get("traits") or {},
+            )
+            for fork in forks
+        )
+    
+    if not result.count:
+        console.print("[yellow]No monkeys to aggregate.[/yellow]")
+        return
+    
+    overview = Table(title=f"{result.count:,} Monkeys")
+    overview.add_column("Stat", style="cyan")
+    overview.add_column("Value", style="green")
+    overview.add_row("Rarity Score", f"{result.score_mean:.1f} ± {result.score_std:.1f}")
+    overview.add_row("Range", f"{result.score_min:.1f} - {result.score_max:.1f}")
+    overview.add_row("Generations", ", ".join(f"Gen {gen}: {count:,}" for gen, count in result.generations().items()))
+    console.print(overview)
+    
+    table = Table(title="Traits")
+    table.add_column("Category", style="cyan")
+    table.add_column("Most Common", style="green")
+    table.add_column("Common", style="white")
+    table.add_column("Uncommon", style="green")
+    table.add_column("Rare", style="blue")
+    table.add_column("Legendary", style="magenta")
+    
+    values = result.value_distribution()
+    rarities = result.rarity_distribution()
+    for category, counts in values.items():
+        total = sum(counts.values())
+        common_values = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:top]
+        table.add_row(
+            category.replace('_', ' ').title(),
+            ", ".join(f"{value.replace('_', ' ')} ({count / total * 100:.0f}%)" for value, count in common_values),
+            *(f"{count / total * 100:.1f}%" for count in rarities[category].values())
+        )
+    
+    console.print(table)
+
+
+@cli.command()
+@click.option('--file', 'metrics_file', default=None, help='Metrics JSONL file (default: $AI_METRICS or monkey_data/ai_metrics.jsonl)')
+@click.option('--days', default=14, type=click.IntRange(min=1), help='Most recent days to show')
+def metrics(metrics_file, days):
+    """Show AI token usage, cost and latency over time"""
+    from src.metrics import DEFAULT_METRICS_FILE, daily_summary, read_records, summarize
+    
+    path = Path(metrics_file or os.getenv("AI_METRICS") or DEFAULT_METRICS_FILE)
+    records = read_records(path)
+    if not records:
+        console.print(f"[yellow]No AI metrics in {path}. Set AI_METRICS={path} when evolving with --ai.[/yellow]")
+        return
+    
+    console.print(f"\n📊 [bold cyan]AI Usage[/bold cyan] [dim]({path})[/dim]\n")
+    
+    table = Table(title=f"Last {days} Days")
+    table.add_column("Day", style="cyan", no_wrap=True)
+    table.add_column("Calls", justify="right")
+    table.add_column("Tokens In", justify="right")
+    table.add_column("Tokens Out", justify="right")
+    table.add_column("Cost", justify="right", style="green")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Cached", justify="right")
+    table.add_column("Fallbacks", style="yellow")
+    
+    def add_row(label, summary, **style):
+        table.add_row(
+            label,
+            f"{summary['calls']:,}",
+            f"{summary['prompt_tokens']:,}",
+            f"{summary['completion_tokens']:,}",
+            f"${summary['cost_usd']:.2f}",
+            f"{summary['wall_ms']['p50'] / 1000:.1f}s",
+            f"{summary['wall_ms']['p95'] / 1000:.1f}s",
+            f"{summary['cache_hit_rate']:.0%}",
+            ", ".join(f"{reason} {count}" for reason, count in summary["fallbacks"].items()) or "-",
+            **style,
+        )
+    
+    daily = list(daily_summary(records).items())[-days:]
+    for day, summary in daily:
+        add_row(day, summary)
+    shown = {day for day, _ in daily}
+    add_row("Total", summarize(r for r in records if str(r.get("ts", ""))[:10] in shown), style="bold")
+    
+    console.print(table)
+    console.print("[dim]Cost is a list-price estimate; GitHub Models calls may be free.[/dim]")
+
+
 if __name__ == "__main__":
     cli()
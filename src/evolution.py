@@ -5,13 +5,76 @@ AI-powered evolution using LLMs to make intelligent mutations.
 Supports multiple providers:
 - GitHub Models (Default)
 - Claude (Anthropic)
+- Local stand-in (offline, for load testing; see src.local_provider)
 """
 
 import os
 import json
 import abc
-from typing import Optional, Dict, Any, List
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Sequence, Tuple
 from src.genetics import MonkeyDNA, GeneticsEngine, TraitCategory
+from src.metrics import MetricsSink, annotate, fallback_reason
+from src.prompts import batch_prompt, dna_traits, evolution_prompt, monkey_delta, split_cached_prefix
+
+if TYPE_CHECKING:
+    # response_cache imports this module; the runtime import is in EvolutionAgent.__init__
+    from src.response_cache import ResponseCache
+
+
+GITHUB_MODELS_URL = "https://models.inference.ai.azure.com"
+
+# Stories from the evolution response longer than this are not reused
+MAX_REUSED_STORY_LENGTH = 600
+
+RESTED_STORY = "Your monkey rested today. No visible changes."
+
+# Batch prompt sizing (rough estimate of ~4 characters per token)
+CHARS_PER_TOKEN = 4
+BATCH_TOKEN_BUDGET = 8000
+BATCH_RESPONSE_TOKENS_PER_MONKEY = 160
+MAX_BATCH_SIZE = 25
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used to size batch prompts"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _claude_request(prompt: str) -> dict:
+    """Messages API arguments, with the static evolution prefix as a cached system block"""
+    prefix, rest = split_cached_prefix(prompt)
+    if not prefix:
+        return {"messages": [{"role": "user", "content": prompt}]}
+    return {
+        "system": [{"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}],
+        "messages": [{"role": "user", "content": rest}],
+    }
+
+
+def _chat_messages(prompt: str) -> List[dict]:
+    """Chat messages, with the static evolution prefix as a stable leading system message"""
+    prefix, rest = split_cached_prefix(prompt)
+    if not prefix:
+        return [{"role": "user", "content": prompt}]
+    return [{"role": "system", "content": prefix}, {"role": "user", "content": rest}]
+
+
+def without_sdk_retries(provider: "AIProvider") -> "AIProvider":
+    """Turn off the built-in retries of a provider's SDK clients (if any)"""
+    for attr in ("client", "async_client"):
+        if hasattr(provider, attr):
+            setattr(provider, attr, getattr(provider, attr).with_options(max_retries=0))
+    return provider
+
+
+def _with_deadline(client):
+    """SDK client whose request timeout fits the current deadline (see src.resilience)"""
+    from src.resilience import remaining_time
+    left = remaining_time()
+    return client if left is None else client.with_options(timeout=max(left, 0.001))
 
 
 class AIProvider(abc.ABC):
@@ -22,6 +85,10 @@ class AIProvider(abc.ABC):
         """Generate text response from the model"""
         pass
     
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        """Async generate_response; runs the sync call in a worker thread unless overridden"""
+        return await asyncio.to_thread(self.generate_response, prompt, max_tokens)
+    
     @abc.abstractmethod
     def name(self) -> str:
         """Provider name"""
@@ -32,15 +99,32 @@ class ClaudeProvider(AIProvider):
     """Anthropic Claude provider"""
     
     def __init__(self, api_key: str):
-        from anthropic import Anthropic
+        from anthropic import Anthropic, AsyncAnthropic
         self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)
         self.model = "claude-3-5-sonnet-20241022"
     
     def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
-        response = self.client.messages.create(
+        response = _with_deadline(self.client).messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            **_claude_request(prompt)
+        )
+        return self._text(response)
+    
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        response = await _with_deadline(self.async_client).messages.create(
             model=self.model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}]
+            **_claude_request(prompt)
+        )
+        return self._text(response)
+    
+    def _text(self, response) -> str:
+        annotate(
+            model=self.model,
+            prompt_tokens=response.usage.input_tokens,
+            completion_tokens=response.usage.output_tokens,
         )
         return response.content[0].text
     
@@ -51,20 +135,36 @@ class ClaudeProvider(AIProvider):
 class GitHubProvider(AIProvider):
     """GitHub Models provider (via OpenAI-compatible endpoint)"""
     
-    def __init__(self, token: str, model: str = "gpt-4o"):
-        from openai import OpenAI
-        self.client = OpenAI(
-            base_url="https://models.inference.ai.azure.com",
-            api_key=token,
-        )
+    def __init__(self, token: str, model: str = "gpt-4o", base_url: str = GITHUB_MODELS_URL):
+        from openai import AsyncOpenAI, OpenAI
+        self.client = OpenAI(base_url=base_url, api_key=token)
+        self.async_client = AsyncOpenAI(base_url=base_url, api_key=token)
         self.model = model
+        self.base_url = base_url
         
     def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
-        response = self.client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
+        response = _with_deadline(self.client).chat.completions.create(
+            messages=_chat_messages(prompt),
             model=self.model,
             max_tokens=max_tokens,
         )
+        return self._text(response)
+    
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        response = await _with_deadline(self.async_client).chat.completions.create(
+            messages=_chat_messages(prompt),
+            model=self.model,
+            max_tokens=max_tokens,
+        )
+        return self._text(response)
+    
+    def _text(self, response) -> str:
+        if response.usage is not None:
+            annotate(
+                model=self.model,
+                prompt_tokens=response.usage.prompt_tokens,
+                completion_tokens=response.usage.completion_tokens,
+            )
         return response.choices[0].message.content
 
     def name(self) -> str:
@@ -74,12 +174,68 @@ class GitHubProvider(AIProvider):
 class EvolutionAgent:
     """AI agent that evolves monkeys intelligently"""
     
-    def __init__(self, provider_type: str = "github", api_key: Optional[str] = None):
-        self.provider = self._setup_provider(provider_type, api_key)
+    def __init__(
+        self,
+        provider_type: str = "github",
+        api_key: Optional[str] = None,
+        provider: Optional[AIProvider] = None,
+        max_concurrency: int = 4,
+        cache: Optional["ResponseCache"] = None,
+        metrics: Optional[MetricsSink] = None,
+    ):
+        """
+        Args:
+            provider_type: "github", "claude" or "local", or a comma-separated
+                list of them to route between (ignored when provider is given)
+            api_key: Key for the provider, defaults to the environment
+            provider: Ready-made provider to use instead
+            max_concurrency: Max in-flight requests for the async batch path
+            cache: Response cache to put in front of the provider. Defaults
+                to the AI_CACHE file if set (AI_CACHE_REPLAY=1 for replay-only)
+            metrics: Sink for per-call token and latency records. Defaults
+                to counters only, plus the AI_METRICS JSONL file if set
+        """
+        self.provider = provider or self._setup_provider(provider_type, api_key)
+        self.max_concurrency = max_concurrency
+        # Evolutions that fell back to random because the provider failed
+        self.fallbacks = 0
+        # Fallbacks are counted from worker threads (evolve_many_with_ai, load tests)
+        self._fallbacks_lock = threading.Lock()
+        self.metrics = metrics or MetricsSink(os.getenv("AI_METRICS"))
+        
+        from src.response_cache import CachedProvider, ResponseCache
+        if cache is None and os.getenv("AI_CACHE"):
+            cache = ResponseCache(os.getenv("AI_CACHE"), replay_only=os.getenv("AI_CACHE_REPLAY") == "1")
+        if cache is not None:
+            self.provider = CachedProvider(self.provider, cache)
     
     def _setup_provider(self, provider_type: str, api_key: Optional[str]) -> AIProvider:
-        """Initialize the requested AI provider"""
+        """Initialize the requested AI provider(s) behind retries and a circuit breaker"""
+        names = [name.strip() for name in provider_type.split(",") if name.strip()]
+        if len(names) <= 1:
+            return self._resilient_provider(provider_type, api_key)
+        
+        from src.routing import DEFAULT_HEDGE_DELAY, RoutingProvider
+        providers = []
+        for name in names:
+            try:
+                # A single api_key cannot belong to several providers
+                providers.append(self._resilient_provider(name, None))
+            except ValueError as e:
+                print(f"⚠️  Skipping provider {name}: {e}")
+        if not providers:
+            raise ValueError(f"No usable provider in {provider_type!r}")
+        
+        hedge_delay = os.getenv("AI_HEDGE_DELAY")
+        return RoutingProvider(providers, float(hedge_delay) if hedge_delay else DEFAULT_HEDGE_DELAY)
+    
+    def _resilient_provider(self, provider_type: str, api_key: Optional[str]) -> AIProvider:
+        from src.resilience import ResilientProvider
         
+        # Retries happen in ResilientProvider, not inside the SDKs
+        return ResilientProvider(without_sdk_retries(self._create_provider(provider_type, api_key)))
+    
+    def _create_provider(self, provider_type: str, api_key: Optional[str]) -> AIProvider:
         if provider_type == "claude":
             key = api_key or os.getenv("ANTHROPIC_API_KEY")
             if not key:
@@ -92,9 +248,15 @@ class EvolutionAgent:
             if not token:
                 raise ValueError("GITHUB_TOKEN not found (required for GitHub Models)")
             
-            # Allow model selection via env env
+            # Allow model and endpoint selection via env (e.g. a local stand-in server)
             model = os.getenv("GITHUB_MODEL", "gpt-4o")
-            return GitHubProvider(token, model)
+            base_url = os.getenv("GITHUB_MODELS_BASE_URL", GITHUB_MODELS_URL)
+            return GitHubProvider(token, model, base_url)
+            
+        elif provider_type == "local":
+            # Offline stand-in for load testing, no key needed
+            from src.local_provider import LocalProvider
+            return LocalProvider(latency=float(os.getenv("LOCAL_AI_LATENCY", "0")))
             
         else:
             raise ValueError(f"Unknown provider type: {provider_type}")
@@ -105,82 +267,322 @@ class EvolutionAgent:
         """
         print(f"🧠 Evolving with {self.provider.name()}...")
         
-        # Get current traits as readable format
-        current_traits = {
-            cat.value: {
-                "value": trait.value,
-                "rarity": trait.rarity.value
-            }
-            for cat, trait in dna.traits.items()
-        }
+        prompt = self._prompt_for(dna, days_passed)
         
-        # Create prompt
-        prompt = self._create_evolution_prompt(current_traits, days_passed, dna.generation)
+        with self._track("evolution"):
+            try:
+                # Call AI
+                response_text = self.provider.generate_response(prompt)
+                return self._evolve_from_response(dna, response_text, prompt)
+                
+            except Exception as e:
+                return self._fallback_evolution(dna, e)
+    
+    def evolve_with_story(self, dna: MonkeyDNA, days_passed: int = 1) -> Tuple[MonkeyDNA, str]:
+        """
+        Evolve the monkey and narrate it, with one model call when possible
         
-        try:
-            # Call AI
-            response_text = self.provider.generate_response(prompt)
-            
-            # Parse response
-            evolution_decision = self._parse_ai_response(response_text)
+        The evolution response already carries an evolution_story. It is
+        reused when it matches the changes actually applied; otherwise a
+        second call writes the story as generate_evolution_story does.
+        """
+        print(f"🧠 Evolving with {self.provider.name()}...")
+        
+        prompt = self._prompt_for(dna, days_passed)
+        decision = {}
+        with self._track("evolution"):
+            try:
+                decision = self._parse_ai_response(self.provider.generate_response(prompt), prompt)
+                evolved = self._apply_evolution(dna, decision)
+            except Exception as e:
+                evolved = self._fallback_evolution(dna, e)
+        
+        story = self._reusable_story(decision, dna, evolved)
+        if story is None:
+            story = self.generate_evolution_story(dna, evolved)
+        return evolved, story
+    
+    async def aevolve_with_story(
+        self,
+        dna: MonkeyDNA,
+        days_passed: int = 1,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Tuple[MonkeyDNA, str]:
+        """Async evolve_with_story"""
+        prompt = self._prompt_for(dna, days_passed)
+        decision = {}
+        with self._track("evolution"):
+            try:
+                decision = self._parse_ai_response(await self._acall(prompt, 1024, semaphore), prompt)
+                evolved = self._apply_evolution(dna, decision)
+            except Exception as e:
+                evolved = self._fallback_evolution(dna, e)
+        
+        story = self._reusable_story(decision, dna, evolved)
+        if story is None:
+            story = await self.agenerate_evolution_story(dna, evolved, semaphore)
+        return evolved, story
+    
+    def _reusable_story(self, decision: dict, old_dna: MonkeyDNA, new_dna: MonkeyDNA) -> Optional[str]:
+        """
+        The response's evolution_story if it is consistent with the applied changes
+        
+        Consistent means non-empty, short, and naming every new trait value
+        (underscores may be written as spaces). Unchanged monkeys always get
+        the standard rested message, as generate_evolution_story gives them.
+        """
+        new_values = [
+            new_dna.traits[category].value
+            for category in TraitCategory
+            if old_dna.traits[category].value != new_dna.traits[category].value
+        ]
+        if not new_values:
+            return RESTED_STORY
+        
+        story = decision.get("evolution_story")
+        if not isinstance(story, str):
+            return None
+        story = story.strip()
+        if not story or len(story) > MAX_REUSED_STORY_LENGTH:
+            return None
+        
+        text = story.lower()
+        for value in new_values:
+            value = value.lower()
+            if value not in text and value.replace("_", " ") not in text:
+                return None
+        return story
+    
+    async def aevolve_with_ai(
+        self,
+        dna: MonkeyDNA,
+        days_passed: int = 1,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> MonkeyDNA:
+        """Async evolve_with_ai; the semaphore bounds concurrent provider calls"""
+        prompt = self._prompt_for(dna, days_passed)
+        
+        with self._track("evolution"):
+            try:
+                response_text = await self._acall(prompt, 1024, semaphore)
+                return self._evolve_from_response(dna, response_text, prompt)
+                
+            except Exception as e:
+                return self._fallback_evolution(dna, e)
+    
+    async def aevolve_many(
+        self,
+        dnas: Sequence[MonkeyDNA],
+        days_passed: int = 1,
+        with_story: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[MonkeyDNA, Optional[str]]]:
+        """
+        Evolve several monkeys concurrently
+        
+        Stories come from the evolution response when consistent (see
+        evolve_with_story), else from a follow-up request. Different monkeys
+        overlap; at most max_concurrency requests are in flight. Past the
+        timeout (seconds for the whole batch), remaining monkeys fall back
+        to random evolution without calling the provider.
+        Returns (evolved, story) pairs in input order.
+        """
+        from src.resilience import deadline
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(dna: MonkeyDNA) -> Tuple[MonkeyDNA, Optional[str]]:
+            if with_story:
+                return await self.aevolve_with_story(dna, days_passed, semaphore)
+            return await self.aevolve_with_ai(dna, days_passed, semaphore), None
+        
+        with deadline(timeout):
+            return list(await asyncio.gather(*(run(dna) for dna in dnas)))
+    
+    def evolve_many_with_ai(
+        self,
+        dnas: Sequence[MonkeyDNA],
+        days_passed: int = 1,
+        with_story: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[MonkeyDNA, Optional[str]]]:
+        """Blocking wrapper around aevolve_many"""
+        return asyncio.run(self.aevolve_many(dnas, days_passed, with_story, timeout))
+    
+    async def aevolve_batch(
+        self,
+        dnas: Sequence[MonkeyDNA],
+        days_passed: int = 1,
+        token_budget: int = BATCH_TOKEN_BUDGET,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[MonkeyDNA, str]]:
+        """
+        Evolve many monkeys with a few multi-monkey prompts
+        
+        Monkeys are packed into prompts (each tagged with an id) until the
+        estimated prompt plus response tokens would exceed token_budget.
+        Batches run concurrently under max_concurrency. A reply that cannot
+        be parsed is retried as two halves, and monkeys missing from a
+        partial (e.g. truncated) reply are retried on their own, down to
+        the single-monkey evolve_with_story path. timeout bounds the whole
+        run (see aevolve_many).
+        Returns (evolved, story) pairs in input order.
+        """
+        from src.resilience import deadline
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: List[Optional[Tuple[MonkeyDNA, str]]] = [None] * len(dnas)
+        
+        async def run(indices: List[int]):
+            if len(indices) == 1:
+                results[indices[0]] = await self.aevolve_with_story(dnas[indices[0]], days_passed, semaphore)
+                return
             
-            # Apply AI-suggested changes
-            evolved_dna = self._apply_evolution(dna, evolution_decision)
+            ids = {f"m{n}": i for n, i in enumerate(indices, start=1)}
+            prompt = self._create_batch_prompt(
+                [(monkey_id, dnas[i]) for monkey_id, i in ids.items()], days_passed
+            )
+            max_tokens = BATCH_RESPONSE_TOKENS_PER_MONKEY * len(indices) + 64
+            with self._track("batch", monkeys=len(indices)):
+                try:
+                    decisions = self._parse_batch_response(await self._acall(prompt, max_tokens, semaphore))
+                except Exception as e:
+                    print(f"⚠️  Batch of {len(indices)} failed: {e}")
+                    annotate(fallback=fallback_reason(e))
+                    decisions = {}
             
-            return evolved_dna
+            missing = []
+            for monkey_id, i in ids.items():
+                decision = decisions.get(monkey_id)
+                if decision is None:
+                    missing.append(i)
+                    continue
+                try:
+                    evolved = self._apply_evolution(dnas[i], decision)
+                except Exception:
+                    missing.append(i)
+                    continue
+                story = self._reusable_story(decision, dnas[i], evolved)
+                if story is None:
+                    # A follow-up call per monkey would undo the batching gain
+                    story = self._fallback_story(self._describe_changes(dnas[i], evolved))
+                results[i] = (evolved, story)
             
-        except Exception as e:
-            print(f"⚠️  AI evolution failed: {e}")
-            print("   Falling back to random evolution...")
-            return GeneticsEngine.evolve(dna, evolution_strength=0.1)
+            if not missing:
+                return
+            # Don't replay an unusable or truncated reply on the next run
+            self._forget(prompt, max_tokens)
+            if len(missing) < len(indices):
+                await run(missing)
+            else:
+                middle = len(missing) // 2
+                await asyncio.gather(run(missing[:middle]), run(missing[middle:]))
+        
+        batches = self._pack_batches(dnas, days_passed, token_budget, max_batch_size)
+        with deadline(timeout):
+            await asyncio.gather(*(run(batch) for batch in batches))
+        return results
+    
+    def evolve_batch(
+        self,
+        dnas: Sequence[MonkeyDNA],
+        days_passed: int = 1,
+        token_budget: int = BATCH_TOKEN_BUDGET,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[MonkeyDNA, str]]:
+        """Blocking wrapper around aevolve_batch"""
+        print(f"🧠 Evolving {len(dnas)} monkeys in batches with {self.provider.name()}...")
+        return asyncio.run(self.aevolve_batch(dnas, days_passed, token_budget, max_batch_size, timeout))
+    
+    def _pack_batches(
+        self,
+        dnas: Sequence[MonkeyDNA],
+        days_passed: int,
+        token_budget: int,
+        max_batch_size: int,
+    ) -> List[List[int]]:
+        """Greedily group monkey indices so each prompt + reply fits the token budget"""
+        base = estimate_tokens(self._create_batch_prompt([], days_passed))
+        batches, current, used = [], [], base
+        for i, dna in enumerate(dnas):
+            cost = estimate_tokens(self._batch_entry(f"m{len(current) + 1}", dna)) + BATCH_RESPONSE_TOKENS_PER_MONKEY
+            if current and (used + cost > token_budget or len(current) >= max_batch_size):
+                batches.append(current)
+                current, used = [], base
+            current.append(i)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _batch_entry(self, monkey_id: str, dna: MonkeyDNA) -> str:
+        """One line of the batch prompt"""
+        return monkey_delta(dna.generation, dna_traits(dna), monkey_id)
+    
+    def _create_batch_prompt(self, monkeys: List[Tuple[str, MonkeyDNA]], days: int) -> str:
+        """Create one prompt evolving several monkeys"""
+        return batch_prompt((self._batch_entry(monkey_id, dna) for monkey_id, dna in monkeys), days)
+    
+    def _parse_batch_response(self, response_text: str) -> Dict[str, dict]:
+        """Parse a batch reply into {monkey id: decision}; empty if unusable"""
+        clean_text = response_text.replace("```json", "").replace("```", "").strip()
+        start = clean_text.find('[')
+        end = clean_text.rfind(']') + 1
+        if start == -1 or end <= start:
+            return {}
+        try:
+            items = json.loads(clean_text[start:end])
+        except ValueError:
+            return {}
+        if not isinstance(items, list):
+            return {}
+        return {
+            str(item["id"]): item
+            for item in items
+            if isinstance(item, dict) and "id" in item
+        }
+    
+    async def _acall(self, prompt: str, max_tokens: int, semaphore: Optional[asyncio.Semaphore]) -> str:
+        if semaphore is None:
+            return await self.provider.agenerate_response(prompt, max_tokens=max_tokens)
+        start = time.perf_counter()
+        async with semaphore:
+            annotate(queue_ms=(time.perf_counter() - start) * 1000)
+            return await self.provider.agenerate_response(prompt, max_tokens=max_tokens)
+    
+    def _track(self, kind: str, **fields):
+        """Metrics record for one provider call (see src.metrics)"""
+        return self.metrics.track(kind, self.provider.name(), getattr(self.provider, "model", ""), **fields)
+    
+    def _prompt_for(self, dna: MonkeyDNA, days_passed: int) -> str:
+        """Evolution prompt for one monkey"""
+        return self._create_evolution_prompt(dna_traits(dna), days_passed, dna.generation)
+    
+    def _evolve_from_response(self, dna: MonkeyDNA, response_text: str, prompt: Optional[str] = None) -> MonkeyDNA:
+        """Parse the AI response and apply its changes"""
+        evolution_decision = self._parse_ai_response(response_text, prompt)
+        return self._apply_evolution(dna, evolution_decision)
+    
+    def _forget(self, prompt: str, max_tokens: int = 1024):
+        """Drop an unusable reply from the response cache, if there is one"""
+        forget = getattr(self.provider, "forget", None)
+        if forget is not None:
+            forget(prompt, max_tokens)
+    
+    def _fallback_evolution(self, dna: MonkeyDNA, error: Exception) -> MonkeyDNA:
+        with self._fallbacks_lock:
+            self.fallbacks += 1
+        annotate(fallback=fallback_reason(error))
+        print(f"⚠️  AI evolution failed: {error}")
+        print("   Falling back to random evolution...")
+        return GeneticsEngine.evolve(dna, evolution_strength=0.1)
     
     def _create_evolution_prompt(self, traits: dict, days: int, generation: int) -> str:
-        """Create prompt for AI"""
-        return f"""You are an AI evolution agent for ForkMonkey - a digital pet that lives on GitHub.
-
-Your task is to evolve this monkey's appearance in a subtle, aesthetically pleasing way.
-
-Current Monkey Traits:
-{json.dumps(traits, indent=2)}
-
-Context:
-- Generation: {generation}
-- Days since last evolution: {days}
-- Evolution should be subtle (1-2 traits max)
-- Maintain aesthetic coherence
-- Rarer traits should change less frequently
-
-Available trait options:
-- body_color: brown, tan, beige, gray, golden, silver, copper, bronze, blue, purple, green, pink, rainbow, galaxy, holographic, crystal
-- face_expression: happy, neutral, curious, sleepy, excited, mischievous, wise, cool, surprised, laughing, winking, zen, enlightened, cosmic, legendary, divine
-- accessory: none, simple_hat, bandana, bow, sunglasses, crown, headphones, monocle, laser_eyes, halo, horns, wizard_hat, golden_crown, diamond_chain, jetpack, wings
-- pattern: solid, spots, stripes, gradient, swirls, stars, hearts, diamonds, fractals, nebula, lightning, flames, aurora, quantum, cosmic_dust, void
-- background: white, blue_sky, green_grass, sunset, forest, beach, mountains, city, space, underwater, volcano, aurora, multiverse, black_hole, dimension_rift, heaven
-- special: none, sparkles, glow, shadow, aura, particles, energy, transcendent, godlike, mythical
-
-Rarity levels (from common to legendary):
-- common (60% chance): Basic traits
-- uncommon (25% chance): Special traits
-- rare (10% chance): Unique traits
-- legendary (5% chance): Ultra-rare traits
-
-Respond with a JSON object ONLY (no markdown formatting) indicating which traits to change:
-{{
-  "changes": [
-    {{
-      "category": "body_color",
-      "new_value": "golden",
-      "new_rarity": "uncommon",
-      "reason": "Subtle shift to warmer tone"
-    }}
-  ],
-  "evolution_story": "Your monkey is maturing, developing a golden sheen..."
-}}
-
-Keep changes minimal (0-2 traits). Consider the monkey's current aesthetic."""
-    
-    def _parse_ai_response(self, response_text: str) -> dict:
-        """Parse AI response"""
+        """Create prompt for AI (cached static prefix + this monkey, see src.prompts)"""
+        return evolution_prompt(traits, days, generation)
+    
+    def _parse_ai_response(self, response_text: str, prompt: Optional[str] = None) -> dict:
+        """Parse AI response; an unparseable reply to prompt is not kept in the cache"""
         try:
             # Clean up markdown code blocks if present
             clean_text = response_text.replace("```json", "").replace("```", "").strip()
@@ -194,17 +596,20 @@ Keep changes minimal (0-2 traits). Consider the monkey's current aesthetic."""
             else:
                 raise ValueError("No JSON object found")
         except Exception as e:
+            if prompt is not None:
+                self._forget(prompt)
             print(f"⚠️  Failed to parse AI response: {e}")
             print(f"Raw response: {response_text[:100]}...")
             return {"changes": [], "evolution_story": "No changes today."}
     
     def _apply_evolution(self, dna: MonkeyDNA, decision: dict) -> MonkeyDNA:
         """Apply AI-decided evolution"""
-        from src.genetics import Trait, Rarity
+        from src.genetics import Rarity
         
-        # Copy current traits
-        new_traits = {cat: trait.model_copy() for cat, trait in dna.traits.items()}
+        # Traits are immutable, so unchanged ones can be shared
+        new_traits = dict(dna.traits)
         mutations = 0
+        changed = False
         
         # Apply changes
         for change in decision.get("changes", []):
@@ -213,12 +618,10 @@ Keep changes minimal (0-2 traits). Consider the monkey's current aesthetic."""
                 new_value = change["new_value"]
                 new_rarity = Rarity(change["new_rarity"])
                 
-                # Create new trait
-                new_traits[category] = Trait(
-                    category=category,
-                    value=new_value,
-                    rarity=new_rarity
-                )
+                # Look up the (interned) new trait
+                new_trait = GeneticsEngine.get_trait(category, new_value, new_rarity)
+                changed = changed or new_trait is not new_traits.get(category)
+                new_traits[category] = new_trait
                 mutations += 1
                 
             except Exception as e:
@@ -230,14 +633,60 @@ Keep changes minimal (0-2 traits). Consider the monkey's current aesthetic."""
             parent_id=dna.parent_id,
             traits=new_traits,
             mutation_count=dna.mutation_count + mutations,
-            birth_timestamp=dna.birth_timestamp
+            birth_timestamp=dna.birth_timestamp,
+            # Keep the hash when the AI changed nothing
+            dna_hash="" if changed else dna.dna_hash
         )
         
         return evolved
     
     def generate_evolution_story(self, old_dna: MonkeyDNA, new_dna: MonkeyDNA) -> str:
         """Generate a story about the evolution"""
+        changes = self._describe_changes(old_dna, new_dna)
+        if not changes:
+            return RESTED_STORY
+        
+        prompt = self._story_prompt(changes)
+        with self._track("story"):
+            try:
+                return self._story_text(prompt, self.provider.generate_response(prompt, max_tokens=256))
+            except Exception as e:
+                annotate(fallback=fallback_reason(e))
+                return self._fallback_story(changes)
+    
+    async def agenerate_evolution_story(
+        self,
+        old_dna: MonkeyDNA,
+        new_dna: MonkeyDNA,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> str:
+        """Async generate_evolution_story"""
+        changes = self._describe_changes(old_dna, new_dna)
+        if not changes:
+            return RESTED_STORY
         
+        prompt = self._story_prompt(changes)
+        with self._track("story"):
+            try:
+                return self._story_text(prompt, await self._acall(prompt, 256, semaphore))
+            except Exception as e:
+                annotate(fallback=fallback_reason(e))
+                return self._fallback_story(changes)
+    
+    def _story_text(self, prompt: str, response_text: str) -> str:
+        """The story in a reply; an empty reply is dropped from the cache and raises"""
+        story = response_text.strip()
+        if not story:
+            self._forget(prompt, 256)
+            raise ValueError("Empty story response")
+        return story
+    
+    def _fallback_story(self, changes: List[str]) -> str:
+        if not changes:
+            return RESTED_STORY
+        return f"Your monkey evolved! Changes: {', '.join(changes)}"
+    
+    def _describe_changes(self, old_dna: MonkeyDNA, new_dna: MonkeyDNA) -> List[str]:
         changes = []
         for category in TraitCategory:
             old_trait = old_dna.traits[category]
@@ -245,21 +694,15 @@ Keep changes minimal (0-2 traits). Consider the monkey's current aesthetic."""
             
             if old_trait.value != new_trait.value:
                 changes.append(f"{category.value}: {old_trait.value} → {new_trait.value}")
-        
-        if not changes:
-            return "Your monkey rested today. No visible changes."
-        
-        prompt = f"""Generate a short, whimsical story (2-3 sentences) about a monkey's evolution.
+        return changes
+    
+    def _story_prompt(self, changes: List[str]) -> str:
+        return f"""Generate a short, whimsical story (2-3 sentences) about a monkey's evolution.
 
 Changes that occurred:
 {chr(10).join(changes)}
 
 Make it fun and engaging, like a Tamagotchi update message."""
-        
-        try:
-            return self.provider.generate_response(prompt, max_tokens=256).strip()
-        except:
-            return f"Your monkey evolved! Changes: {', '.join(changes)}"
 
 
 def main():
@@ -281,13 +724,15 @@ def main():
     print("1. Generating random monkey...")
     dna = GeneticsEngine.generate_random_dna()
     
-    print("\n2. Evolving with AI...")
-    evolved = agent.evolve_with_ai(dna, days_passed=1)
-    
-    print("\n3. Generating evolution story...")
-    story = agent.generate_evolution_story(dna, evolved)
+    print("\n2. Evolving with AI (story from the same call when possible)...")
+    evolved, story = agent.evolve_with_story(dna, days_passed=1)
     print(f"   {story}")
     
+    print("\n3. Evolving 3 monkeys concurrently...")
+    herd = [GeneticsEngine.generate_random_dna() for _ in range(3)]
+    for evolved, story in agent.evolve_many_with_ai(herd):
+        print(f"   {evolved.dna_hash}: {story}")
+    
     print("\n✅ Evolution agent working!")
 
 
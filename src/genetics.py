@@ -8,9 +8,12 @@ Inspired by CryptoKitties breeding mechanics.
 import random
 import hashlib
 import json
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Rarity(str, Enum):
@@ -21,6 +24,30 @@ class Rarity(str, Enum):
     LEGENDARY = "legendary"    # 5%
 
 
+# Points per trait used by MonkeyDNA.get_rarity_score
+RARITY_POINTS = {
+    Rarity.COMMON: 1,
+    Rarity.UNCOMMON: 2,
+    Rarity.RARE: 5,
+    Rarity.LEGENDARY: 10
+}
+
+# Chance of each rarity on a fresh roll (see GeneticsEngine._roll_rarity)
+RARITY_PROBABILITIES = {
+    Rarity.COMMON: 0.60,
+    Rarity.UNCOMMON: 0.25,
+    Rarity.RARE: 0.10,
+    Rarity.LEGENDARY: 0.05
+}
+
+# Per-draw chances of GeneticsEngine, shared by the analytical and
+# vectorized models (breeding_odds, markov, rarity_stats, population)
+RANDOM_GEN_LOCKED_CHANCE = 0.05     # generate_random_dna picks a gen-locked trait
+BREED_GEN_LOCKED_CHANCE = 0.03      # breed picks a gen-locked trait
+INHERIT_CHANCE = 0.5                # breed keeps the parent's trait
+MUTATION_KEEP_RARITY_CHANCE = 0.7   # _mutate_trait stays in the same rarity
+
+
 class TraitCategory(str, Enum):
     """Categories of monkey traits"""
     BODY_COLOR = "body_color"
@@ -31,20 +58,64 @@ class TraitCategory(str, Enum):
     SPECIAL = "special"
 
 
+# Gene sequences for every trait in the pool, filled once at import
+_GENE_SEQUENCES: Dict[Tuple[TraitCategory, str], str] = {}
+
+
+# Category order used by the DNA hash (sorted by category name)
+_HASH_ORDER = tuple(sorted(TraitCategory))
+
+
+@lru_cache(maxsize=65536)
+def _hash_gene_sequences(sequences: Tuple[Optional[str], ...]) -> str:
+    """DNA hash for gene sequences in _HASH_ORDER (None = category missing)"""
+    trait_string = "".join(
+        f"{category.value}:{sequence}"
+        for category, sequence in zip(_HASH_ORDER, sequences)
+        if sequence is not None
+    )
+    return hashlib.sha256(trait_string.encode()).hexdigest()[:16]
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """
+    Derive an independent 64-bit seed from a base seed and keys
+
+    Stable across processes and Python versions, so a simulation can hand
+    each worker or monkey its own stream (e.g. keyed by worker id or
+    dna_hash) and still reproduce the same results for the same seed.
+    """
+    material = ":".join(str(part) for part in (seed, *keys))
+    return int.from_bytes(hashlib.sha256(material.encode()).digest()[:8], "big")
+
+
+def seeded_rng(seed: int, *keys) -> random.Random:
+    """Random stream for a seed, optionally split by keys (see derive_seed)"""
+    return random.Random(derive_seed(seed, *keys))
+
+
+def gene_sequence_for(category: TraitCategory, value: str) -> str:
+    """Gene sequence for a trait value (precomputed for the trait pool)"""
+    sequence = _GENE_SEQUENCES.get((category, value))
+    if sequence is None:
+        sequence = hashlib.md5(f"{category}:{value}".encode()).hexdigest()[:8]
+    return sequence
+
+
 class Trait(BaseModel):
-    """A single genetic trait"""
+    """A single genetic trait (immutable, so instances can be shared)"""
+    model_config = ConfigDict(frozen=True)
+    
     category: TraitCategory
     value: str
     rarity: Rarity
     gene_sequence: str = Field(default="")  # Hex representation
     
     def __init__(self, **data):
-        super().__init__(**data)
-        if not self.gene_sequence:
+        if not data.get("gene_sequence") and "category" in data and "value" in data:
             # Generate gene sequence from value
-            self.gene_sequence = hashlib.md5(
-                f"{self.category}:{self.value}".encode()
-            ).hexdigest()[:8]
+            data["gene_sequence"] = gene_sequence_for(TraitCategory(data["category"]), data["value"])
+        super().__init__(**data)
 
 
 class MonkeyDNA(BaseModel):
@@ -62,23 +133,18 @@ class MonkeyDNA(BaseModel):
             self.dna_hash = self._calculate_hash()
     
     def _calculate_hash(self) -> str:
-        """Calculate unique hash for this DNA"""
-        trait_string = "".join([
-            f"{cat.value}:{trait.gene_sequence}"
-            for cat, trait in sorted(self.traits.items())
-        ])
-        return hashlib.sha256(trait_string.encode()).hexdigest()[:16]
+        """Calculate unique hash for this DNA (memoized per gene combination)"""
+        traits = self.traits
+        sequences = []
+        for category in _HASH_ORDER:
+            trait = traits.get(category)
+            sequences.append(trait.gene_sequence if trait is not None else None)
+        return _hash_gene_sequences(tuple(sequences))
     
     def get_rarity_score(self) -> float:
         """Calculate overall rarity score (0-100)"""
-        rarity_values = {
-            Rarity.COMMON: 1,
-            Rarity.UNCOMMON: 2,
-            Rarity.RARE: 5,
-            Rarity.LEGENDARY: 10
-        }
-        total = sum(rarity_values[trait.rarity] for trait in self.traits.values())
-        max_possible = len(self.traits) * rarity_values[Rarity.LEGENDARY]
+        total = sum(RARITY_POINTS[trait.rarity] for trait in self.traits.values())
+        max_possible = len(self.traits) * RARITY_POINTS[Rarity.LEGENDARY]
         return (total / max_possible) * 100 if max_possible > 0 else 0
 
 
@@ -146,202 +212,277 @@ class GeneticsEngine:
     }
     
     @classmethod
-    def get_gen_locked_traits(cls, category: TraitCategory, generation: int) -> List[str]:
-        """Get gen-locked traits available for this generation"""
-        available = []
-        if category in cls.GEN_LOCKED_TRAITS:
-            for max_gen, traits in cls.GEN_LOCKED_TRAITS[category].items():
-                if generation <= max_gen:
-                    available.extend(traits)
-        return available
+    def get_trait(cls, category: TraitCategory, value: str, rarity: Rarity) -> Trait:
+        """Get the shared Trait instance for a value (built on the fly if not in the pool)"""
+        trait = _TRAIT_REGISTRY.get((category, value, rarity))
+        if trait is None:
+            trait = Trait(category=category, value=value, rarity=rarity)
+        return trait
+    
+    @classmethod
+    def get_gen_locked_traits(cls, category: TraitCategory, generation: int) -> Tuple[str, ...]:
+        """Get gen-locked traits available for this generation (precomputed)"""
+        return _GEN_LOCKED_TABLE[category][min(max(generation, 0), GEN_LOCK_HORIZON)]
+    
+    @classmethod
+    def get_gen_lock_generation(cls, category: TraitCategory, value: str) -> Optional[int]:
+        """Last generation that can roll a gen-locked trait, or None if not gen-locked"""
+        return GEN_LOCK_MAX_GENERATION.get((category, value))
     
     @classmethod
-    def generate_random_dna(cls, generation: int = 1, parent_id: Optional[str] = None) -> MonkeyDNA:
-        """Generate completely random DNA"""
+    def get_extinct_traits(cls, generation: int) -> Tuple[Tuple[TraitCategory, str], ...]:
+        """Gen-locked (category, value) pairs no longer available at this generation"""
+        return _EXTINCT_TABLE[min(max(generation, 0), GEN_LOCK_HORIZON)]
+    
+    @classmethod
+    def generate_random_dna(
+        cls,
+        generation: int = 1,
+        parent_id: Optional[str] = None,
+        rng: Optional[random.Random] = None
+    ) -> MonkeyDNA:
+        """
+        Generate completely random DNA
+
+        Args:
+            generation: Generation number
+            parent_id: Parent's DNA hash, if any
+            rng: Random stream (defaults to the global random module)
+        """
+        rng = rng or random
         traits = {}
         
         for category in TraitCategory:
             # 5% chance to get a gen-locked trait if eligible
             gen_locked = cls.get_gen_locked_traits(category, generation)
-            if gen_locked and random.random() < 0.05:
-                value = random.choice(gen_locked)
+            if gen_locked and rng.random() < RANDOM_GEN_LOCKED_CHANCE:
+                value = rng.choice(gen_locked)
                 # Gen-locked traits are always LEGENDARY
-                traits[category] = Trait(
-                    category=category,
-                    value=value,
-                    rarity=Rarity.LEGENDARY
-                )
+                traits[category] = cls.get_trait(category, value, Rarity.LEGENDARY)
             else:
-                rarity = cls._roll_rarity()
-                available_traits = cls.TRAIT_POOL[category][rarity]
-                value = random.choice(available_traits)
+                rarity = cls._roll_rarity(rng)
+                available_traits = TRAIT_CATALOG.pool(category, rarity)
+                value = rng.choice(available_traits)
                 
-                traits[category] = Trait(
-                    category=category,
-                    value=value,
-                    rarity=rarity
-                )
+                traits[category] = cls.get_trait(category, value, rarity)
         
         return MonkeyDNA(
             generation=generation,
             parent_id=parent_id,
             traits=traits,
-            birth_timestamp=int(random.random() * 1000000)  # Mock timestamp
+            birth_timestamp=int(rng.random() * 1000000)  # Mock timestamp
         )
     
     @classmethod
-    def _roll_rarity(cls) -> Rarity:
+    def _roll_rarity(cls, rng: Optional[random.Random] = None) -> Rarity:
         """Roll for trait rarity based on probabilities"""
-        roll = random.random() * 100
-        
-        if roll < 60:
-            return Rarity.COMMON
-        elif roll < 85:
-            return Rarity.UNCOMMON
-        elif roll < 95:
-            return Rarity.RARE
-        else:
-            return Rarity.LEGENDARY
+        return TRAIT_CATALOG.roll_rarity((rng or random).random())
     
     @classmethod
-    def breed(cls, parent_dna: MonkeyDNA, mutation_rate: float = 0.3) -> MonkeyDNA:
+    def breed(
+        cls,
+        parent_dna: MonkeyDNA,
+        mutation_rate: float = 0.3,
+        rng: Optional[random.Random] = None
+    ) -> MonkeyDNA:
         """
         Create child DNA from parent with inheritance and mutations
         
         Args:
             parent_dna: Parent's DNA
             mutation_rate: Probability of mutation per trait (0-1)
+            rng: Random stream (defaults to the global random module)
         """
+        rng = rng or random
         child_generation = parent_dna.generation + 1
         child_traits = {}
         
         for category in TraitCategory:
             # Check for gen-locked traits first (3% chance for children)
             gen_locked = cls.get_gen_locked_traits(category, child_generation)
-            if gen_locked and random.random() < 0.03:
-                value = random.choice(gen_locked)
-                child_traits[category] = Trait(
-                    category=category,
-                    value=value,
-                    rarity=Rarity.LEGENDARY  # Gen-locked = legendary
-                )
-            elif random.random() < 0.5:
-                # Inherit from parent
-                parent_trait = parent_dna.traits[category]
-                # Check if parent's trait is gen-locked and still available
-                if parent_trait.value in gen_locked:
-                    # Can inherit gen-locked trait from parent!
-                    child_traits[category] = parent_trait.model_copy()
-                else:
-                    child_traits[category] = parent_trait.model_copy()
+            if gen_locked and rng.random() < BREED_GEN_LOCKED_CHANCE:
+                value = rng.choice(gen_locked)
+                # Gen-locked = legendary
+                child_traits[category] = cls.get_trait(category, value, Rarity.LEGENDARY)
+            elif rng.random() < INHERIT_CHANCE:
+                # Inherit from parent (traits are immutable, so share it).
+                # Gen-locked traits can be inherited even once extinct.
+                child_traits[category] = parent_dna.traits[category]
             else:
                 # Generate new trait
-                rarity = cls._roll_rarity()
-                available_traits = cls.TRAIT_POOL[category][rarity]
-                value = random.choice(available_traits)
+                rarity = cls._roll_rarity(rng)
+                available_traits = TRAIT_CATALOG.pool(category, rarity)
+                value = rng.choice(available_traits)
                 
-                child_traits[category] = Trait(
-                    category=category,
-                    value=value,
-                    rarity=rarity
-                )
+                child_traits[category] = cls.get_trait(category, value, rarity)
             
             # Apply mutation
-            if random.random() < mutation_rate:
-                child_traits[category] = cls._mutate_trait(child_traits[category])
+            if rng.random() < mutation_rate:
+                child_traits[category] = cls._mutate_trait(child_traits[category], rng)
         
         return MonkeyDNA(
             generation=child_generation,
             parent_id=parent_dna.dna_hash,
             traits=child_traits,
-            birth_timestamp=int(random.random() * 1000000)
+            birth_timestamp=int(rng.random() * 1000000)
         )
     
     @classmethod
-    def _mutate_trait(cls, trait: Trait) -> Trait:
+    def _mutate_trait(cls, trait: Trait, rng: Optional[random.Random] = None) -> Trait:
         """Mutate a single trait"""
+        rng = rng or random
         # 70% chance to stay in same rarity, 30% chance to shift
-        if random.random() < 0.7:
+        if rng.random() < MUTATION_KEEP_RARITY_CHANCE:
             new_rarity = trait.rarity
         else:
             # Shift rarity up or down
-            rarities = list(Rarity)
-            current_idx = rarities.index(trait.rarity)
-            shift = random.choice([-1, 1])
-            new_idx = max(0, min(len(rarities) - 1, current_idx + shift))
-            new_rarity = rarities[new_idx]
+            new_rarity = TRAIT_CATALOG.shift_rarity(trait.rarity, rng.choice((-1, 1)))
         
         # Pick new value from rarity pool
-        available_traits = cls.TRAIT_POOL[trait.category][new_rarity]
-        new_value = random.choice(available_traits)
+        available_traits = TRAIT_CATALOG.pool(trait.category, new_rarity)
+        new_value = rng.choice(available_traits)
         
-        return Trait(
-            category=trait.category,
-            value=new_value,
-            rarity=new_rarity
-        )
+        return cls.get_trait(trait.category, new_value, new_rarity)
     
     @classmethod
-    def evolve(cls, dna: MonkeyDNA, evolution_strength: float = 0.1) -> MonkeyDNA:
+    def evolve(
+        cls,
+        dna: MonkeyDNA,
+        evolution_strength: float = 0.1,
+        rng: Optional[random.Random] = None
+    ) -> MonkeyDNA:
         """
         Evolve DNA over time (daily mutations)
         
         Args:
             dna: Current DNA
             evolution_strength: Probability of change per trait (0-1)
+            rng: Random stream (defaults to the global random module)
         """
+        rng = rng or random
         evolved_traits = {}
         mutations = 0
+        changed = False
         
         for category, trait in dna.traits.items():
-            if random.random() < evolution_strength:
+            if rng.random() < evolution_strength:
                 # Evolve this trait
-                evolved_traits[category] = cls._mutate_trait(trait)
+                evolved_traits[category] = cls._mutate_trait(trait, rng)
                 mutations += 1
+                changed = changed or evolved_traits[category] is not trait
             else:
                 # Keep unchanged
-                evolved_traits[category] = trait.model_copy()
+                evolved_traits[category] = trait
         
         return MonkeyDNA(
             generation=dna.generation,
             parent_id=dna.parent_id,
             traits=evolved_traits,
             mutation_count=dna.mutation_count + mutations,
-            birth_timestamp=dna.birth_timestamp
+            birth_timestamp=dna.birth_timestamp,
+            # Same traits, same hash: skip rehashing
+            dna_hash="" if changed else dna.dna_hash
         )
     
+    @classmethod
+    def generate_many(cls, n: int, generation: int = 1, rng=None):
+        """Vectorized generate_random_dna returning a Population (see src.population)"""
+        from src.population import generate_many
+        return generate_many(n, generation=generation, rng=rng)
+
+    @classmethod
+    def breed_many(cls, parents, n: int = 1, mutation_rate: float = 0.3, rng=None):
+        """
+        Vectorized breed: n children per parent, returned as a Population
+
+        Args:
+            parents: Population or list of MonkeyDNA
+            n: Number of children per parent
+            mutation_rate: Probability of mutation per trait (0-1)
+            rng: Optional numpy.random.Generator
+        """
+        from src.population import breed_many
+        return breed_many(parents, n=n, mutation_rate=mutation_rate, rng=rng)
+
+    @classmethod
+    def evolve_many(cls, population, evolution_strength: float = 0.1, rng=None):
+        """
+        Vectorized evolve over a whole population
+
+        Args:
+            population: Population or list of MonkeyDNA
+            evolution_strength: Probability of change per trait (0-1)
+            rng: Optional numpy.random.Generator
+        """
+        from src.population import evolve_many
+        return evolve_many(population, evolution_strength=evolution_strength, rng=rng)
+
+    @classmethod
+    def evolve_days(cls, dna: MonkeyDNA, days: int, evolution_strength: float = 0.1, rng=None) -> MonkeyDNA:
+        """
+        Apply `days` daily evolutions in one step (see src.markov)
+
+        Args:
+            dna: Current DNA
+            days: Number of daily evolutions to catch up on
+            evolution_strength: Probability of change per trait per day (0-1)
+            rng: Optional numpy.random.Generator
+        """
+        from src.markov import fast_forward
+        return fast_forward(dna, days, evolution_strength=evolution_strength, rng=rng)
+
     @classmethod
     def dna_to_dict(cls, dna: MonkeyDNA) -> dict:
         """Convert DNA to dictionary for storage"""
+        traits = {}
+        points = 0
+        for trait in dna.traits.values():
+            # Interned traits have their plain-string form precomputed
+            encoded = _ENCODED_TRAITS.get(id(trait)) or _encode_trait(trait)
+            traits[encoded[0]] = {
+                "value": encoded[1],
+                "rarity": encoded[2],
+                "gene_sequence": encoded[3]
+            }
+            points += encoded[4]
+        
+        max_possible = len(traits) * RARITY_POINTS[Rarity.LEGENDARY]
         return {
             "generation": dna.generation,
             "parent_id": dna.parent_id,
             "dna_hash": dna.dna_hash,
             "mutation_count": dna.mutation_count,
             "birth_timestamp": dna.birth_timestamp,
-            "traits": {
-                cat.value: {
-                    "value": trait.value,
-                    "rarity": trait.rarity.value,
-                    "gene_sequence": trait.gene_sequence
-                }
-                for cat, trait in dna.traits.items()
-            },
-            "rarity_score": dna.get_rarity_score()
+            "traits": traits,
+            "rarity_score": (points / max_possible) * 100 if max_possible > 0 else 0
         }
     
     @classmethod
-    def dict_to_dna(cls, data: dict) -> MonkeyDNA:
-        """Convert dictionary to DNA object"""
+    def dict_to_dna(cls, data: dict, trusted: bool = False) -> MonkeyDNA:
+        """
+        Convert dictionary to DNA object
+        
+        Args:
+            data: Dictionary in the dna_to_dict format
+            trusted: Skip pydantic validation (only for files this repo
+                wrote itself, never for DNA fetched from other forks);
+                category and rarity names are still checked
+        """
+        if trusted:
+            return cls._dict_to_dna_trusted(data)
+        
         traits = {}
         for cat_str, trait_data in data["traits"].items():
             category = TraitCategory(cat_str)
-            traits[category] = Trait(
-                category=category,
-                value=trait_data["value"],
-                rarity=Rarity(trait_data["rarity"]),
-                gene_sequence=trait_data["gene_sequence"]
-            )
+            trait = cls.get_trait(category, trait_data["value"], Rarity(trait_data["rarity"]))
+            if trait.gene_sequence != trait_data["gene_sequence"]:
+                trait = Trait(
+                    category=category,
+                    value=trait_data["value"],
+                    rarity=Rarity(trait_data["rarity"]),
+                    gene_sequence=trait_data["gene_sequence"]
+                )
+            traits[category] = trait
         
         return MonkeyDNA(
             generation=data["generation"],
@@ -351,6 +492,202 @@ class GeneticsEngine:
             birth_timestamp=data.get("birth_timestamp", 0),
             dna_hash=data.get("dna_hash", "")
         )
+    
+    @classmethod
+    def _dict_to_dna_trusted(cls, data: dict) -> MonkeyDNA:
+        """dict_to_dna via model_construct and interned traits"""
+        traits = {}
+        for cat_str, trait_data in data["traits"].items():
+            value = trait_data["value"]
+            sequence = trait_data.get("gene_sequence")
+            trait = _TRAIT_REGISTRY_BY_NAME.get((cat_str, value, trait_data["rarity"]))
+            if trait is None or (sequence and trait.gene_sequence != sequence):
+                category = TraitCategory(cat_str)
+                trait = Trait.model_construct(
+                    category=category,
+                    value=value,
+                    rarity=Rarity(trait_data["rarity"]),
+                    gene_sequence=sequence or gene_sequence_for(category, value)
+                )
+            traits[trait.category] = trait
+        
+        dna = MonkeyDNA.model_construct(
+            generation=data["generation"],
+            parent_id=data.get("parent_id"),
+            traits=traits,
+            mutation_count=data.get("mutation_count", 0),
+            birth_timestamp=data.get("birth_timestamp", 0),
+            dna_hash=data.get("dna_hash", "")
+        )
+        if not dna.dna_hash:
+            dna.dna_hash = dna._calculate_hash()
+        return dna
+
+
+def _encode_trait(trait: Trait) -> Tuple[str, str, str, str, int]:
+    """Plain-string form of a trait for dna_to_dict, plus its rarity points"""
+    return (
+        trait.category.value,
+        trait.value,
+        trait.rarity.value,
+        trait.gene_sequence,
+        RARITY_POINTS[trait.rarity]
+    )
+
+
+class TraitCatalog:
+    """
+    Trait pool compiled into immutable lookup tables
+
+    Built once at import (see TRAIT_CATALOG) from GeneticsEngine.TRAIT_POOL,
+    GEN_LOCKED_TRAITS and RARITY_PROBABILITIES. Rolling, mutation, prompt
+    building and rarity lookups read these tables instead of rescanning the
+    nested pool dicts.
+    """
+
+    def __init__(
+        self,
+        trait_pool: Dict[TraitCategory, Dict[Rarity, List[str]]],
+        gen_locked: Dict[TraitCategory, Dict[int, List[str]]],
+        probabilities: Dict[Rarity, float],
+    ):
+        self.rarities: Tuple[Rarity, ...] = tuple(Rarity)
+        self.rarity_index: Mapping[Rarity, int] = MappingProxyType(
+            {rarity: index for index, rarity in enumerate(self.rarities)}
+        )
+        self.probabilities: Mapping[Rarity, float] = MappingProxyType(
+            {rarity: probabilities[rarity] for rarity in self.rarities}
+        )
+
+        # Upper bound of each rarity's slice of [0, 1), last one dropped so a
+        # roll at or past the final boundary (float drift) lands on the top
+        # rarity. Rounded so 0.6 + 0.25 compares as 0.85, not 0.8500000000000001.
+        cumulative, total = [], 0.0
+        for rarity in self.rarities[:-1]:
+            total += probabilities[rarity]
+            cumulative.append(round(total, 12))
+        self.thresholds: Tuple[float, ...] = tuple(cumulative)
+
+        pools = {}
+        values = {}
+        rarity_of = {}
+        for category in TraitCategory:
+            pools[category] = MappingProxyType({
+                rarity: tuple(trait_pool[category][rarity]) for rarity in self.rarities
+            })
+            ordered = [value for rarity in self.rarities for value in pools[category][rarity]]
+            for rarity in self.rarities:
+                for value in pools[category][rarity]:
+                    rarity_of.setdefault((category, value), rarity)
+            for locked in gen_locked.get(category, {}).values():
+                ordered.extend(locked)
+                for value in locked:
+                    rarity_of.setdefault((category, value), Rarity.LEGENDARY)
+            values[category] = tuple(ordered)
+
+        self.pools: Mapping[TraitCategory, Mapping[Rarity, Tuple[str, ...]]] = MappingProxyType(pools)
+        self.values: Mapping[TraitCategory, Tuple[str, ...]] = MappingProxyType(values)
+        self._rarity_of = rarity_of
+        self._value_index = {
+            (category, value): index
+            for category, ordered in values.items()
+            for index, value in enumerate(ordered)
+        }
+
+    def pool(self, category: TraitCategory, rarity: Rarity) -> Tuple[str, ...]:
+        """Values a fresh roll of this rarity can pick from"""
+        return self.pools[category][rarity]
+
+    def rarity_of(self, category: TraitCategory, value: str) -> Optional[Rarity]:
+        """Catalog rarity of a value (gen-locked values are legendary), None if unknown"""
+        return self._rarity_of.get((category, value))
+
+    def index_of(self, category: TraitCategory, value: str) -> Optional[int]:
+        """Position of a value in values[category], None if unknown"""
+        return self._value_index.get((category, value))
+
+    def roll_rarity(self, roll: float) -> Rarity:
+        """Map a uniform roll in [0, 1) onto a rarity"""
+        return self.rarities[bisect_right(self.thresholds, roll)]
+
+    def shift_rarity(self, rarity: Rarity, shift: int) -> Rarity:
+        """Move a rarity up or down, clamped to common..legendary"""
+        index = self.rarity_index[rarity] + shift
+        return self.rarities[max(0, min(len(self.rarities) - 1, index))]
+
+
+TRAIT_CATALOG = TraitCatalog(
+    GeneticsEngine.TRAIT_POOL, GeneticsEngine.GEN_LOCKED_TRAITS, RARITY_PROBABILITIES
+)
+
+# Stable per-category ordering of all trait values (pool values by rarity,
+# then gen-locked); positions are used as compact trait indices by
+# src.population and src.genome
+TRAIT_VALUES = TRAIT_CATALOG.values
+
+
+def _index_gen_locks():
+    """Reverse index (category, value) -> max generation, plus the lock horizon"""
+    max_generation = {}
+    for category, locks in GeneticsEngine.GEN_LOCKED_TRAITS.items():
+        for max_gen, values in locks.items():
+            for value in values:
+                max_generation[(category, value)] = max_gen
+    horizon = max(max_generation.values(), default=0) + 1
+    return max_generation, horizon
+
+
+def _build_gen_locked_tables():
+    """Available and extinct gen-locked traits for generations 0..GEN_LOCK_HORIZON"""
+    generations = range(GEN_LOCK_HORIZON + 1)
+    available = {
+        category: tuple(
+            tuple(
+                value
+                for max_gen, values in GeneticsEngine.GEN_LOCKED_TRAITS.get(category, {}).items()
+                if generation <= max_gen
+                for value in values
+            )
+            for generation in generations
+        )
+        for category in TraitCategory
+    }
+    extinct = tuple(
+        tuple(key for key, max_gen in GEN_LOCK_MAX_GENERATION.items() if generation > max_gen)
+        for generation in generations
+    )
+    return available, extinct
+
+
+# Gen-locked (category, value) -> last generation that can roll it. From
+# GEN_LOCK_HORIZON on every gen-locked trait is extinct, so later generations
+# share the last row of the lookup tables.
+GEN_LOCK_MAX_GENERATION, GEN_LOCK_HORIZON = _index_gen_locks()
+_GEN_LOCKED_TABLE, _EXTINCT_TABLE = _build_gen_locked_tables()
+
+
+def _build_trait_registry() -> Dict[Tuple[TraitCategory, str, Rarity], Trait]:
+    """Intern one Trait per (category, value, rarity) in the pool and gen-locked lists"""
+    registry = {}
+    for category, values in TRAIT_CATALOG.values.items():
+        for value in values:
+            rarity = TRAIT_CATALOG.rarity_of(category, value)
+            trait = Trait(category=category, value=value, rarity=rarity)
+            _GENE_SEQUENCES[(category, value)] = trait.gene_sequence
+            registry[(category, value, rarity)] = trait
+    return registry
+
+
+_TRAIT_REGISTRY = _build_trait_registry()
+
+# Same traits keyed by the plain strings stored in dna.json (trusted decode)
+_TRAIT_REGISTRY_BY_NAME = {
+    (category.value, value, rarity.value): trait
+    for (category, value, rarity), trait in _TRAIT_REGISTRY.items()
+}
+
+# Encoded form of each interned trait, keyed by identity (registry traits live forever)
+_ENCODED_TRAITS = {id(trait): _encode_trait(trait) for trait in _TRAIT_REGISTRY.values()}
 
 
 def main():
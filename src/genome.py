@@ -0,0 +1,316 @@
+"""
+ForkMonkey Packed Genome
+
+Compact, lossless representation of MonkeyDNA for holding community-scale
+data in memory. All six traits are packed into one integer: each category
+takes 7 bits (5-bit index into TRAIT_VALUES + 2-bit rarity), 42 bits total.
+DNA hashes are 16 hex chars and are stored as 64-bit integers.
+
+Genomes also have a versioned binary form (26 bytes, 34 with a parent),
+and a URL-safe base64 "DNA code" of that, short enough to embed in URLs:
+
+    version:u8 flags:u8 genes:u48 generation:u16 mutation_count:u32
+    birth_timestamp:u32 dna_hash:u64 [parent_id:u64 if flags & HAS_PARENT]
+"""
+
+import base64
+import re
+import struct
+from typing import Dict, NamedTuple, Optional
+
+from src.genetics import (
+    GeneticsEngine, MonkeyDNA, Rarity, TraitCategory, RARITY_POINTS, TRAIT_VALUES, gene_sequence_for
+)
+
+
+CATEGORIES = list(TraitCategory)
+RARITIES = list(Rarity)
+
+VALUE_BITS = 5
+RARITY_BITS = 2
+TRAIT_BITS = VALUE_BITS + RARITY_BITS
+TRAIT_MASK = (1 << TRAIT_BITS) - 1
+
+assert all(len(values) <= 1 << VALUE_BITS for values in TRAIT_VALUES.values()), \
+    "Trait pool outgrew the packed genome layout"
+
+_VALUE_INDEX = {
+    category: {value: i for i, value in enumerate(values)}
+    for category, values in TRAIT_VALUES.items()
+}
+_RARITY_INDEX = {rarity: i for i, rarity in enumerate(RARITIES)}
+
+# Binary format
+FORMAT_VERSION = 1
+FLAG_HAS_PARENT = 0x01
+_HEADER = struct.Struct(">BB6sHIIQ")
+_PARENT = struct.Struct(">Q")
+
+
+# Errors from packing malformed external DNA dicts (missing keys, wrong types)
+UNPACKABLE_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+_HASH_PATTERN = re.compile("[0-9a-f]{16}")
+
+
+def _hash_to_int(dna_hash: str) -> int:
+    """Store a 16-char hex hash as an int, rejecting anything lossy"""
+    if not isinstance(dna_hash, str) or not _HASH_PATTERN.fullmatch(dna_hash):
+        raise ValueError(f"Cannot pack non-canonical DNA hash: {dna_hash!r}")
+    return int(dna_hash, 16)
+
+
+class PackedGenome(NamedTuple):
+    """MonkeyDNA packed into a handful of integers"""
+    genes: int
+    generation: int
+    mutation_count: int
+    birth_timestamp: int
+    parent_id: Optional[int]
+    dna_hash: int
+
+    @staticmethod
+    def pack_traits(traits: Dict[TraitCategory, tuple]) -> int:
+        """Pack {category: (value, rarity)} into the 42-bit genes integer"""
+        genes = 0
+        for c, category in enumerate(CATEGORIES):
+            if category not in traits:
+                raise ValueError(f"Missing {category.value} trait")
+            value, rarity = traits[category]
+            try:
+                value_index = _VALUE_INDEX[category][value]
+            except KeyError:
+                raise ValueError(f"Unknown {category.value} trait: {value}")
+            field = value_index | (_RARITY_INDEX[Rarity(rarity)] << VALUE_BITS)
+            genes |= field << (c * TRAIT_BITS)
+        return genes
+
+    @classmethod
+    def from_dna(cls, dna: MonkeyDNA) -> "PackedGenome":
+        """Pack a MonkeyDNA (all traits must come from the trait pool)"""
+        for category, trait in dna.traits.items():
+            if trait.gene_sequence != gene_sequence_for(category, trait.value):
+                raise ValueError(f"Cannot pack custom gene sequence for {category.value}")
+
+        return cls(
+            genes=cls.pack_traits({cat: (t.value, t.rarity) for cat, t in dna.traits.items()}),
+            generation=dna.generation,
+            mutation_count=dna.mutation_count,
+            birth_timestamp=dna.birth_timestamp,
+            parent_id=_hash_to_int(dna.parent_id) if dna.parent_id else None,
+            dna_hash=_hash_to_int(dna.dna_hash),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PackedGenome":
+        """Pack a dna_to_dict() dictionary without building pydantic models"""
+        traits = {}
+        for cat_str, trait_data in data["traits"].items():
+            category = TraitCategory(cat_str)
+            expected = gene_sequence_for(category, trait_data["value"])
+            if trait_data.get("gene_sequence", expected) != expected:
+                raise ValueError(f"Cannot pack custom gene sequence for {cat_str}")
+            traits[category] = (trait_data["value"], trait_data["rarity"])
+
+        parent_id = data.get("parent_id")
+        return cls(
+            genes=cls.pack_traits(traits),
+            generation=data["generation"],
+            mutation_count=data.get("mutation_count", 0),
+            birth_timestamp=data.get("birth_timestamp", 0),
+            parent_id=_hash_to_int(parent_id) if parent_id else None,
+            dna_hash=_hash_to_int(data["dna_hash"]),
+        )
+
+    def to_bytes(self) -> bytes:
+        """Versioned binary encoding (see module docstring)"""
+        flags = FLAG_HAS_PARENT if self.parent_id is not None else 0
+        try:
+            data = _HEADER.pack(
+                FORMAT_VERSION,
+                flags,
+                self.genes.to_bytes(6, "big"),
+                self.generation,
+                self.mutation_count,
+                self.birth_timestamp,
+                self.dna_hash,
+            )
+            if self.parent_id is not None:
+                data += _PARENT.pack(self.parent_id)
+        except (struct.error, OverflowError) as e:
+            raise ValueError(f"Genome does not fit binary format v{FORMAT_VERSION}: {e}")
+        return data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PackedGenome":
+        """Decode to_bytes() output, validating version, length and trait indices"""
+        if len(data) < _HEADER.size:
+            raise ValueError(f"DNA data too short: {len(data)} bytes")
+        version, flags, genes, generation, mutation_count, birth_timestamp, dna_hash = \
+            _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported DNA format version: {version}")
+
+        expected = _HEADER.size + (_PARENT.size if flags & FLAG_HAS_PARENT else 0)
+        if len(data) != expected:
+            raise ValueError(f"DNA data should be {expected} bytes, got {len(data)}")
+        parent_id = _PARENT.unpack_from(data, _HEADER.size)[0] if flags & FLAG_HAS_PARENT else None
+
+        genome = cls(
+            genes=int.from_bytes(genes, "big"),
+            generation=generation,
+            mutation_count=mutation_count,
+            birth_timestamp=birth_timestamp,
+            parent_id=parent_id,
+            dna_hash=dna_hash,
+        )
+        if genome.genes >> (len(CATEGORIES) * TRAIT_BITS):
+            raise ValueError("DNA data has unused gene bits set")
+        for category in CATEGORIES:
+            if genome.trait_field(category) & ((1 << VALUE_BITS) - 1) >= len(TRAIT_VALUES[category]):
+                raise ValueError(f"DNA data has an unknown {category.value} trait")
+        return genome
+
+    def to_code(self) -> str:
+        """URL-safe base64 of to_bytes(), without padding"""
+        return base64.urlsafe_b64encode(self.to_bytes()).rstrip(b"=").decode()
+
+    @classmethod
+    def from_code(cls, code: str) -> "PackedGenome":
+        """Decode a to_code() string"""
+        try:
+            data = base64.urlsafe_b64decode(code + "=" * (-len(code) % 4))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid DNA code: {e}")
+        return cls.from_bytes(data)
+
+    def trait_field(self, category: TraitCategory) -> int:
+        """Raw 7-bit field for one category"""
+        return (self.genes >> (CATEGORIES.index(category) * TRAIT_BITS)) & TRAIT_MASK
+
+    def trait(self, category: TraitCategory) -> tuple:
+        """Unpack one category as (value, rarity)"""
+        field = self.trait_field(category)
+        value = TRAIT_VALUES[category][field & ((1 << VALUE_BITS) - 1)]
+        return value, RARITIES[field >> VALUE_BITS]
+
+    @property
+    def dna_hash_hex(self) -> str:
+        return f"{self.dna_hash:016x}"
+
+    @property
+    def parent_id_hex(self) -> Optional[str]:
+        return f"{self.parent_id:016x}" if self.parent_id is not None else None
+
+    def get_rarity_score(self) -> float:
+        """Same as MonkeyDNA.get_rarity_score"""
+        total = sum(RARITY_POINTS[self.trait(category)[1]] for category in CATEGORIES)
+        return (total / (len(CATEGORIES) * RARITY_POINTS[Rarity.LEGENDARY])) * 100
+
+    def to_dna(self) -> MonkeyDNA:
+        """Unpack into a full MonkeyDNA"""
+        traits = {}
+        for category in CATEGORIES:
+            value, rarity = self.trait(category)
+            traits[category] = GeneticsEngine.get_trait(category, value, rarity)
+
+        return MonkeyDNA(
+            generation=self.generation,
+            parent_id=self.parent_id_hex,
+            traits=traits,
+            mutation_count=self.mutation_count,
+            birth_timestamp=self.birth_timestamp,
+            dna_hash=self.dna_hash_hex,
+        )
+
+    def to_dict(self) -> dict:
+        """Unpack straight into the GeneticsEngine.dna_to_dict format"""
+        traits = {}
+        for category in CATEGORIES:
+            value, rarity = self.trait(category)
+            traits[category.value] = {
+                "value": value,
+                "rarity": rarity.value,
+                "gene_sequence": gene_sequence_for(category, value)
+            }
+
+        return {
+            "generation": self.generation,
+            "parent_id": self.parent_id_hex,
+            "dna_hash": self.dna_hash_hex,
+            "mutation_count": self.mutation_count,
+            "birth_timestamp": self.birth_timestamp,
+            "traits": traits,
+            "rarity_score": self.get_rarity_score()
+        }
+
+    def shared_traits(self, other: "PackedGenome") -> int:
+        """Number of categories where both genomes carry the same value"""
+        diff = self.genes ^ other.genes
+        value_mask = (1 << VALUE_BITS) - 1
+        return sum(
+            1 for c in range(len(CATEGORIES))
+            if (diff >> (c * TRAIT_BITS)) & value_mask == 0
+        )
+
+
+def encode_dna(dna: MonkeyDNA) -> str:
+    """DNA code for a monkey (raises ValueError for non-pool traits)"""
+    return PackedGenome.from_dna(dna).to_code()
+
+
+def decode_dna(code: str) -> MonkeyDNA:
+    """MonkeyDNA from a DNA code"""
+    return PackedGenome.from_code(code).to_dna()
+
+
+def dna_code_from_dict(data: dict) -> Optional[str]:
+    """DNA code for a dna_to_dict() dictionary, or None if it cannot be packed"""
+    try:
+        return PackedGenome.from_dict(data).to_code()
+    except UNPACKABLE_ERRORS:
+        return None
+
+
+def pack_community(community_data: dict) -> Dict[str, PackedGenome]:
+    """Pack every fork with DNA in web/community_data.json, keyed by full_name"""
+    genomes = {}
+    for fork in community_data.get("forks", []):
+        dna = fork.get("monkey_dna")
+        code = fork.get("dna_code")
+        if not dna and not code:
+            continue
+        try:
+            genomes[fork["full_name"]] = PackedGenome.from_dict(dna) if dna else PackedGenome.from_code(code)
+        except UNPACKABLE_ERRORS as e:
+            print(f"⚠️  Skipping {fork.get('full_name')}: {e}")
+    return genomes
+
+
+def main():
+    """Compare packed and pydantic memory footprints"""
+    import json
+    import sys
+    from pathlib import Path
+
+    print("🧬 ForkMonkey Packed Genome Test\n")
+
+    dna = GeneticsEngine.generate_random_dna()
+    packed = PackedGenome.from_dna(dna)
+    print(f"   Genes: {packed.genes:#013x}")
+    print(f"   Round trip: {packed.to_dna().dna_hash == dna.dna_hash}")
+    print(f"   Packed size: {sys.getsizeof(packed) + sum(sys.getsizeof(f) for f in packed)} bytes")
+    print(f"   JSON size: {len(json.dumps(GeneticsEngine.dna_to_dict(dna)))} bytes")
+    print(f"   Binary size: {len(packed.to_bytes())} bytes")
+    print(f"   DNA code: {packed.to_code()}")
+
+    community_file = Path("web/community_data.json")
+    if community_file.exists():
+        genomes = pack_community(json.loads(community_file.read_text()))
+        print(f"   Packed {len(genomes)} community monkeys")
+
+    print("\n✅ Packed genome working!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+ForkMonkey Local AI Provider
+
+Offline stand-in for the LLM providers, for load tests and CI. It answers
+the evolution, batch and story prompts of EvolutionAgent with well-formed
+responses built from the trait catalog, after a configurable latency and
+with a configurable error rate.
+
+Use it in-process (LocalProvider, or AI_PROVIDER=local) or as a small HTTP
+server speaking the OpenAI chat-completions shape, which GitHubProvider
+can be pointed at:
+
+    python -m src.local_provider --port 8765 --latency 0.2 --error-rate 0.05
+    GITHUB_MODELS_BASE_URL=http://127.0.0.1:8765 GITHUB_TOKEN=local python src/cli.py evolve --ai
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from src.evolution import AIProvider, estimate_tokens
+from src.metrics import annotate
+from src.genetics import TRAIT_CATALOG, TraitCategory
+
+
+DEFAULT_TEMPLATES = {
+    # One trait change: {category}, {value}, {value_words}, {rarity}
+    "story": "Your monkey's {category_words} shifted to {value_words} overnight. It looks delighted!",
+    # Story prompt answers: {values} lists the new trait values
+    "retold_story": "What a day! Your monkey now shows off {values}.",
+}
+
+_BATCH_ID = re.compile(r'^\{"id":\s*"([^"]+)"', re.MULTILINE)
+_STORY_CHANGE = re.compile(r"^\w+: .+ → (.+)$", re.MULTILINE)
+
+
+class LocalProviderError(RuntimeError):
+    """Injected failure (error_rate), reported like an HTTP 500"""
+    status_code = 500
+
+
+class LocalResponder:
+    """Builds plausible replies to EvolutionAgent prompts"""
+
+    def __init__(self, templates: Optional[Dict[str, str]] = None, change_chance: float = 0.8):
+        self.templates = {**DEFAULT_TEMPLATES, **(templates or {})}
+        self.change_chance = change_chance
+
+    def respond(self, prompt: str) -> str:
+        # Same prompt, same answer: keeps load tests and cached replays stable
+        rng = random.Random(hashlib.sha256(prompt.encode()).digest())
+
+        if prompt.startswith("Generate a short"):
+            values = [value.strip().replace("_", " ") for value in _STORY_CHANGE.findall(prompt)]
+            return self.templates["retold_story"].format(values=", ".join(values) or "a new look")
+
+        if "JSON array" in prompt:
+            return json.dumps([
+                {"id": monkey_id, **self._decision(rng)} for monkey_id in _BATCH_ID.findall(prompt)
+            ])
+
+        return json.dumps(self._decision(rng))
+
+    def _decision(self, rng: random.Random) -> dict:
+        if rng.random() >= self.change_chance:
+            return {"changes": [], "evolution_story": "Your monkey took it easy today."}
+
+        category = rng.choice(list(TraitCategory))
+        rarity = TRAIT_CATALOG.roll_rarity(rng.random())
+        value = rng.choice(TRAIT_CATALOG.pool(category, rarity))
+        story = self.templates["story"].format(
+            category=category.value,
+            category_words=category.value.replace("_", " "),
+            value=value,
+            value_words=value.replace("_", " "),
+            rarity=rarity.value,
+        )
+        return {
+            "changes": [{
+                "category": category.value,
+                "new_value": value,
+                "new_rarity": rarity.value,
+                "reason": "Local stand-in mutation",
+            }],
+            "evolution_story": story,
+        }
+
+
+class LocalProvider(AIProvider):
+    """In-process stand-in provider with simulated latency and failures"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        templates: Optional[Dict[str, str]] = None,
+        seed: Optional[int] = None,
+        model: str = "local",
+    ):
+        """
+        Args:
+            latency: Mean seconds per response
+            jitter: Uniform +/- spread around latency
+            error_rate: Chance each call raises LocalProviderError
+            templates: Overrides for DEFAULT_TEMPLATES
+            seed: Seed for latency and error draws
+            model: Model name reported to caches and metrics
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.responder = LocalResponder(templates)
+        self.model = model
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self) -> Tuple[float, bool]:
+        """Delay for one call and whether it fails"""
+        with self._lock:
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            failed = self._rng.random() < self.error_rate
+        return delay, failed
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        delay, failed = self._draw()
+        time.sleep(delay)
+        if failed:
+            raise LocalProviderError("Injected local provider failure")
+        return self._respond(prompt)
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        delay, failed = self._draw()
+        await asyncio.sleep(delay)
+        if failed:
+            raise LocalProviderError("Injected local provider failure")
+        return self._respond(prompt)
+
+    def _respond(self, prompt: str) -> str:
+        content = self.responder.respond(prompt)
+        # Same estimate the HTTP server reports as usage
+        annotate(model=self.model, prompt_tokens=estimate_tokens(prompt), completion_tokens=estimate_tokens(content))
+        return content
+
+    def name(self) -> str:
+        return "Local"
+
+
+def _completion(model: str, prompt: str, content: str) -> dict:
+    """OpenAI chat.completion response body"""
+    prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(content)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def make_server(provider: LocalProvider, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """HTTP server answering POST /chat/completions (and /v1/chat/completions)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip("/") not in ("/chat/completions", "/v1/chat/completions"):
+                self._reply(404, {"error": {"message": f"Unknown path {self.path}", "type": "not_found"}})
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                prompt = "\n".join(message["content"] for message in body["messages"])
+            except (ValueError, KeyError, TypeError) as e:
+                self._reply(400, {"error": {"message": f"Bad request: {e}", "type": "invalid_request_error"}})
+                return
+            try:
+                content = provider.generate_response(prompt, body.get("max_tokens", 1024))
+            except LocalProviderError as e:
+                self._reply(500, {"error": {"message": str(e), "type": "server_error"}})
+                return
+            self._reply(200, _completion(body.get("model", provider.model), prompt, content))
+
+        def _reply(self, status: int, payload: dict):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_server(provider: LocalProvider, host: str = "127.0.0.1", port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve in a background thread; returns the server and its base URL"""
+    server = make_server(provider, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    """Run the stand-in server"""
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in for ForkMonkey")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Chance of an HTTP 500")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    provider = LocalProvider(args.latency, args.jitter, args.error_rate, seed=args.seed)
+    server = make_server(provider, args.host, args.port)
+    print(f"🤖 Local AI stand-in on http://{args.host}:{server.server_address[1]} "
+          f"(latency {args.latency}s ± {args.jitter}s, error rate {args.error_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+ForkMonkey Evolution Fast-Forward
+
+Markov-chain model of GeneticsEngine.evolve for catching up on missed days.
+
+Each day a trait mutates with probability evolution_strength, independently
+per category. _mutate_trait keeps the rarity 70% of the time, otherwise
+shifts it one step up or down (clamped), then picks a value uniformly from
+the new rarity's pool. The value is therefore uniform given the rarity, so
+the chain reduces exactly to a 4x4 rarity transition matrix:
+
+- the number of mutations over N days is Binomial(N, strength)
+- after k mutations the rarity is distributed as row r of MUTATION^k
+
+Powers are built by repeated squaring from a cache, so sampling N days
+costs O(log N) instead of N calls to evolve.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from src.genetics import GeneticsEngine, MonkeyDNA, TRAIT_CATALOG, MUTATION_KEEP_RARITY_CHANCE
+
+
+RARITIES = TRAIT_CATALOG.rarities
+
+
+def _mutation_matrix() -> np.ndarray:
+    """Rarity transition matrix for a single _mutate_trait call"""
+    size = len(RARITIES)
+    matrix = np.zeros((size, size))
+    shift_chance = (1 - MUTATION_KEEP_RARITY_CHANCE) / 2
+    for r in range(size):
+        matrix[r, r] += MUTATION_KEEP_RARITY_CHANCE
+        matrix[r, max(0, r - 1)] += shift_chance
+        matrix[r, min(size - 1, r + 1)] += shift_chance
+    return matrix
+
+
+MUTATION_MATRIX = _mutation_matrix()
+
+
+@lru_cache(maxsize=64)
+def _squared_power(exponent_bit: int) -> np.ndarray:
+    """MUTATION_MATRIX ** (2 ** exponent_bit)"""
+    if exponent_bit == 0:
+        return MUTATION_MATRIX
+    half = _squared_power(exponent_bit - 1)
+    return half @ half
+
+
+@lru_cache(maxsize=1024)
+def mutation_power(k: int) -> np.ndarray:
+    """Rarity transition matrix after k mutations"""
+    result = np.eye(len(RARITIES))
+    bit = 0
+    while k:
+        if k & 1:
+            result = result @ _squared_power(bit)
+        k >>= 1
+        bit += 1
+    return result
+
+
+@lru_cache(maxsize=256)
+def daily_transition(evolution_strength: float, days: int) -> np.ndarray:
+    """
+    Rarity transition matrix after a number of evolve() calls
+
+    Row r gives the rarity distribution after `days` days for a trait that
+    starts at rarity r. Cached per (strength, days).
+    """
+    daily = (1 - evolution_strength) * np.eye(len(RARITIES)) + evolution_strength * MUTATION_MATRIX
+    return np.linalg.matrix_power(daily, days)
+
+
+def fast_forward(
+    dna: MonkeyDNA,
+    days: int,
+    evolution_strength: float = 0.1,
+    rng: Optional[np.random.Generator] = None,
+) -> MonkeyDNA:
+    """
+    Sample the DNA after `days` daily evolutions in one step
+
+    Statistically equivalent to calling GeneticsEngine.evolve `days` times.
+
+    Args:
+        dna: Current DNA
+        days: Number of daily evolutions to apply
+        evolution_strength: Probability of change per trait per day (0-1)
+        rng: NumPy random generator
+    """
+    if days < 0:
+        raise ValueError("days must be non-negative")
+    rng = rng or np.random.default_rng()
+
+    evolved_traits = {}
+    mutations = 0
+    changed = False
+
+    for category, trait in dna.traits.items():
+        k = int(rng.binomial(days, evolution_strength))
+        if k == 0:
+            evolved_traits[category] = trait
+            continue
+
+        row = mutation_power(k)[TRAIT_CATALOG.rarity_index[trait.rarity]]
+        rarity = RARITIES[rng.choice(len(RARITIES), p=row / row.sum())]
+        pool = TRAIT_CATALOG.pool(category, rarity)
+        value = pool[rng.integers(len(pool))]
+
+        evolved_traits[category] = GeneticsEngine.get_trait(category, value, rarity)
+        mutations += k
+        changed = changed or evolved_traits[category] is not trait
+
+    return MonkeyDNA(
+        generation=dna.generation,
+        parent_id=dna.parent_id,
+        traits=evolved_traits,
+        mutation_count=dna.mutation_count + mutations,
+        birth_timestamp=dna.birth_timestamp,
+        dna_hash="" if changed else dna.dna_hash
+    )
+
+
+def main():
+    """Compare fast-forward with day-by-day evolution"""
+    import time
+
+    print("⏩ ForkMonkey Evolution Fast-Forward Test\n")
+    dna = GeneticsEngine.generate_random_dna()
+
+    for days in (10, 365, 100000):
+        start = time.perf_counter()
+        evolved = fast_forward(dna, days)
+        elapsed = time.perf_counter() - start
+        print(f"   {days:>6} days: {evolved.mutation_count} mutations in {elapsed * 1000:.2f}ms")
+
+    print("\n✅ Fast-forward working!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+ForkMonkey AI Call Metrics
+
+Token and latency accounting for EvolutionAgent. Every evolution, story
+and batch call becomes one record:
+
+    {"ts": "2026-01-01T03:00:00+00:00", "kind": "evolution",
+     "provider": "GitHub Models (gpt-4o)", "model": "gpt-4o",
+     "prompt_tokens": 812, "completion_tokens": 95, "wall_ms": 1840.2,
+     "cache_hit": false, "fallback": null}
+
+Records go to an in-process counter API (MetricsSink.counters / summary)
+and, when a path is given (AI_METRICS), are appended to a JSONL file that
+`python src/cli.py metrics` summarizes per day.
+
+Providers fill in the fields they know (token usage from the SDK, cache
+hits, the provider that actually answered) with annotate(), which writes
+to the record of the call in progress, if any. Token counts add up, since
+a hedged call (see src.routing) may pay for several attempts; usage that
+arrives after the call has finished (a losing hedge) is booked as its own
+"hedge" record instead of touching the finished one.
+"""
+
+import contextvars
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+
+DEFAULT_METRICS_FILE = Path("monkey_data/ai_metrics.jsonl")
+
+# USD per million (prompt, completion) tokens, list prices for estimates
+PRICE_PER_MTOK = {
+    "claude-3-5-sonnet-20241022": (3.0, 15.0),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+}
+
+# Fields annotate() adds up instead of overwriting
+USAGE_FIELDS = ("prompt_tokens", "completion_tokens")
+
+
+class _Call:
+    """A record being filled in, shared with the threads and tasks the call starts"""
+
+    def __init__(self, record: dict, sink: "MetricsSink"):
+        self.record = record
+        self.sink = sink
+        self.closed = False
+        self.lock = threading.Lock()
+
+
+_CALL: contextvars.ContextVar[Optional[_Call]] = contextvars.ContextVar("ai_metrics_call", default=None)
+
+
+def annotate(**fields):
+    """Add fields to the record of the call in progress (no-op outside one)"""
+    call = _CALL.get()
+    if call is None:
+        return
+    with call.lock:
+        if not call.closed:
+            for key, value in fields.items():
+                if key in USAGE_FIELDS and value is not None:
+                    value += call.record.get(key) or 0
+                call.record[key] = value
+            return
+        late = {key: fields[key] for key in USAGE_FIELDS if fields.get(key)}
+        record = call.record
+    if late:
+        call.sink.record({
+            "ts": record["ts"],
+            "kind": "hedge",
+            "provider": record["provider"],
+            "model": fields.get("model", record["model"]),
+            "prompt_tokens": None,
+            "completion_tokens": None,
+            "wall_ms": 0.0,
+            "cache_hit": False,
+            "fallback": None,
+            **late,
+        })
+
+
+def fallback_reason(error: Exception) -> str:
+    """Short, stable label for why a call fell back"""
+    from src.resilience import CircuitOpenError, DeadlineExceeded, status_code
+
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, DeadlineExceeded):
+        return "deadline"
+    if type(error).__name__ == "CacheMiss":
+        return "cache_miss"
+    status = status_code(error)
+    if status == 429:
+        return "rate_limited"
+    if status is not None:
+        return "server_error" if status >= 500 else f"http_{status}"
+    if isinstance(error, (ValueError, KeyError, TypeError)):
+        return "bad_response"
+    if isinstance(error, TimeoutError) or "Timeout" in type(error).__name__:
+        return "timeout"
+    if isinstance(error, ConnectionError) or "Connection" in type(error).__name__:
+        return "connection"
+    return type(error).__name__
+
+
+def estimated_cost(record: dict) -> float:
+    """List-price USD estimate of one record (0 for unknown models)"""
+    prompt_price, completion_price = PRICE_PER_MTOK.get(record.get("model") or "", (0.0, 0.0))
+    return (
+        (record.get("prompt_tokens") or 0) * prompt_price
+        + (record.get("completion_tokens") or 0) * completion_price
+    ) / 1_000_000
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(records: Iterable[dict]) -> dict:
+    """Totals, cost, latency percentiles, cache hit rate and fallbacks"""
+    calls = prompt_tokens = completion_tokens = cache_hits = 0
+    cost = 0.0
+    walls = []
+    kinds = Counter()
+    fallbacks = Counter()
+    for record in records:
+        calls += 1
+        kinds[record.get("kind", "?")] += 1
+        prompt_tokens += record.get("prompt_tokens") or 0
+        completion_tokens += record.get("completion_tokens") or 0
+        cache_hits += bool(record.get("cache_hit"))
+        cost += estimated_cost(record)
+        walls.append(record.get("wall_ms") or 0.0)
+        if record.get("fallback"):
+            fallbacks[record["fallback"]] += 1
+    walls.sort()
+    return {
+        "calls": calls,
+        "kinds": dict(kinds),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cost_usd": round(cost, 6),
+        "wall_ms": {
+            "total": round(sum(walls), 1),
+            "p50": round(_percentile(walls, 50), 1),
+            "p95": round(_percentile(walls, 95), 1),
+            "max": round(walls[-1], 1) if walls else 0.0,
+        },
+        "cache_hit_rate": round(cache_hits / calls, 4) if calls else 0.0,
+        "fallbacks": dict(fallbacks),
+    }
+
+
+def read_records(path: Union[str, Path] = DEFAULT_METRICS_FILE) -> List[dict]:
+    """Records from a metrics JSONL file (skips unreadable lines)"""
+    records = []
+    path = Path(path)
+    if not path.exists():
+        return records
+    with open(path) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def daily_summary(records: Iterable[dict]) -> Dict[str, dict]:
+    """summarize() per UTC day, oldest first"""
+    days: Dict[str, List[dict]] = {}
+    for record in records:
+        days.setdefault(str(record.get("ts", ""))[:10], []).append(record)
+    return {day: summarize(days[day]) for day in sorted(days)}
+
+
+class MetricsSink:
+    """Collects call records into counters and, optionally, a JSONL file"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, clock=time.perf_counter):
+        """
+        Args:
+            path: JSONL file to append records to (None = counters only)
+            clock: Timer for wall time (injectable for tests)
+        """
+        self.path = Path(path) if path else None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, kind: str, provider: str = "", model: str = "", **fields):
+        """Record one call; providers and callers annotate() it while it runs"""
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "kind": kind,
+            "provider": provider,
+            "model": model,
+            "prompt_tokens": None,
+            "completion_tokens": None,
+            "wall_ms": 0.0,
+            "cache_hit": False,
+            "fallback": None,
+            **fields,
+        }
+        call = _Call(record, self)
+        token = _CALL.set(call)
+        start = self.clock()
+        try:
+            yield record
+        finally:
+            _CALL.reset(token)
+            with call.lock:
+                # Hedges still running in other threads can no longer write here
+                call.closed = True
+                # Time spent waiting for a concurrency slot is not provider latency
+                record["wall_ms"] = round((self.clock() - start) * 1000 - record.pop("queue_ms", 0.0), 2)
+                finished = dict(record)
+            self.record(finished)
+
+    def record(self, record: dict):
+        """Count a finished record and append it to the file"""
+        with self._lock:
+            self.counters["calls"] += 1
+            self.counters[f"calls.{record['kind']}"] += 1
+            self.counters["prompt_tokens"] += record.get("prompt_tokens") or 0
+            self.counters["completion_tokens"] += record.get("completion_tokens") or 0
+            self.counters["wall_ms"] += record["wall_ms"]
+            self.counters["cache_hits"] += bool(record.get("cache_hit"))
+            if record.get("fallback"):
+                self.counters["fallbacks"] += 1
+                self.counters[f"fallbacks.{record['fallback']}"] += 1
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(record) + "\n")
+
+    def summary(self) -> dict:
+        """Totals for this process"""
+        with self._lock:
+            counters = dict(self.counters)
+        calls = counters.get("calls", 0)
+        return {
+            "calls": calls,
+            "prompt_tokens": counters.get("prompt_tokens", 0),
+            "completion_tokens": counters.get("completion_tokens", 0),
+            "wall_ms": round(counters.get("wall_ms", 0.0), 1),
+            "cache_hit_rate": round(counters.get("cache_hits", 0) / calls, 4) if calls else 0.0,
+            "fallbacks": {
+                key.split(".", 1)[1]: count for key, count in counters.items() if key.startswith("fallbacks.")
+            },
+        }
+
+
+def main():
+    """Record a few calls against the local stand-in and summarize them"""
+    from src.evolution import EvolutionAgent
+    from src.genetics import GeneticsEngine
+    from src.local_provider import LocalProvider
+
+    print("📊 ForkMonkey AI Metrics\n")
+
+    # The agent's own sink: under `python -m` this module is also __main__
+    agent = EvolutionAgent(provider=LocalProvider(latency=0.01, error_rate=0.2, seed=3))
+    agent.evolve_many_with_ai([GeneticsEngine.generate_random_dna() for _ in range(10)])
+
+    summary = agent.metrics.summary()
+    print(f"\n   Calls:    {summary['calls']}")
+    print(f"   Tokens:   {summary['prompt_tokens']:,} prompt + {summary['completion_tokens']:,} completion")
+    print(f"   Wall:     {summary['wall_ms']:.0f}ms")
+    print(f"   Fallback: {summary['fallbacks'] or 'none'}")
+
+    print("\n✅ Metrics working!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+ForkMonkey Evolution Prompts
+
+Evolution prompts are a static prefix plus a short per-request tail.
+
+The prefix (instructions, the trait vocabulary by rarity from the
+TraitCatalog, rarity levels and the response format) is identical for
+every monkey and every request, so it is built once and providers can
+cache it (ClaudeProvider marks it with cache_control, OpenAI-compatible
+endpoints cache identical leading tokens automatically). The tail only
+carries what differs: days passed and each monkey as one compact JSON
+line, with trait rarities omitted where the catalog already implies them.
+"""
+
+import json
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from src.genetics import TRAIT_CATALOG, MonkeyDNA, Rarity, TraitCatalog, TraitCategory
+
+
+def build_prefix(catalog: TraitCatalog) -> str:
+    """Static part of every evolution prompt for a trait catalog"""
+    rarities = " | ".join(
+        f"{rarity.value} {catalog.probabilities[rarity]:.0%}" for rarity in catalog.rarities
+    )
+    options = "\n".join(
+        f"- {category.value}: "
+        + " | ".join(", ".join(catalog.pool(category, rarity)) for rarity in catalog.rarities)
+        for category in TraitCategory
+    )
+    example = json.dumps({
+        "changes": [{"category": "body_color", "new_value": "golden", "new_rarity": "uncommon", "reason": "warmer tone"}],
+        "evolution_story": "Your monkey is maturing, developing a golden sheen...",
+    })
+    return f"""You are an AI evolution agent for ForkMonkey - a digital pet that lives on GitHub.
+Evolve each monkey's appearance in a subtle, aesthetically pleasing way:
+- change 0-2 traits per monkey, keeping its look coherent
+- rarer traits change less often
+- evolve every monkey independently
+- each evolution_story (2-3 sentences) mentions every new trait value of that monkey
+
+Trait options by rarity, with how often a fresh roll gets it ({rarities}):
+{options}
+
+A monkey is a JSON line of its generation and trait values; a value written
+"value (rarity)" has that rarity, otherwise the one listed above.
+
+Answer with JSON ONLY (no markdown). One monkey's evolution looks like:
+{example}
+For several monkeys, answer with a list of these objects, each with the monkey's "id".
+"""
+
+
+EVOLUTION_PREFIX = build_prefix(TRAIT_CATALOG)
+
+
+def monkey_delta(
+    generation: int,
+    traits: Mapping[str, Mapping[str, str]],
+    monkey_id: Optional[str] = None,
+    catalog: TraitCatalog = TRAIT_CATALOG,
+) -> str:
+    """One compact JSON line for a monkey ({category: {"value", "rarity"}} traits)"""
+    compact: Dict[str, str] = {}
+    for category, trait in traits.items():
+        value, rarity = trait["value"], trait["rarity"]
+        try:
+            listed = value in catalog.pool(TraitCategory(category), Rarity(rarity))
+        except (KeyError, ValueError):
+            listed = False
+        # Gen-locked and AI-invented values are not in the prefix: keep their rarity
+        compact[category] = value if listed else f"{value} ({rarity})"
+    entry = {"generation": generation, "traits": compact}
+    if monkey_id is not None:
+        entry = {"id": monkey_id, **entry}
+    return json.dumps(entry, separators=(",", ":"))
+
+
+def dna_traits(dna: MonkeyDNA) -> Dict[str, Dict[str, str]]:
+    """A monkey's traits as {category: {"value", "rarity"}}"""
+    return {
+        category.value: {"value": trait.value, "rarity": trait.rarity.value}
+        for category, trait in dna.traits.items()
+    }
+
+
+def evolution_prompt(traits: Mapping[str, Mapping[str, str]], days: int, generation: int) -> str:
+    """Prompt evolving one monkey"""
+    return f"""{EVOLUTION_PREFIX}
+Days since last evolution: {days}
+Monkey:
+{monkey_delta(generation, traits)}
+
+Respond with one JSON object for this monkey."""
+
+
+def batch_prompt(entries: Iterable[str], days: int) -> str:
+    """Prompt evolving several monkeys, given their monkey_delta lines with ids"""
+    return f"""{EVOLUTION_PREFIX}
+Days since last evolution: {days}
+Monkeys (one JSON object per line):
+{chr(10).join(entries)}
+
+Respond with a JSON array with one object per monkey id."""
+
+
+def split_cached_prefix(prompt: str) -> Tuple[str, str]:
+    """(static prefix, rest) of a prompt; the prefix is empty if there is none"""
+    if prompt.startswith(EVOLUTION_PREFIX):
+        return EVOLUTION_PREFIX, prompt[len(EVOLUTION_PREFIX):]
+    return "", prompt
@@ -0,0 +1,112 @@
+"""
+ForkMonkey Rarity Statistics
+
+Exact probability distribution of rarity scores for freshly rolled monkeys.
+Each category contributes 1/2/5/10 points depending on its rarity; the
+per-category chances (the _roll_rarity split plus the gen-locked roll, which
+is always legendary) are convolved to get the distribution of the total.
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List
+
+from src.genetics import (
+    GeneticsEngine, Rarity, TraitCategory, GEN_LOCK_HORIZON, RARITY_POINTS, RARITY_PROBABILITIES,
+    RANDOM_GEN_LOCKED_CHANCE,
+)
+
+
+# Generations past the last lock all share the same distribution
+LOCK_HORIZON = GEN_LOCK_HORIZON
+
+MAX_POINTS = len(TraitCategory) * RARITY_POINTS[Rarity.LEGENDARY]
+
+
+def category_point_distribution(category: TraitCategory, generation: int) -> Dict[int, float]:
+    """Probability of each point value for one freshly rolled category"""
+    lock_chance = RANDOM_GEN_LOCKED_CHANCE if GeneticsEngine.get_gen_locked_traits(category, generation) else 0.0
+
+    points = {}
+    for rarity, probability in RARITY_PROBABILITIES.items():
+        value = RARITY_POINTS[rarity]
+        points[value] = points.get(value, 0.0) + (1 - lock_chance) * probability
+    legendary = RARITY_POINTS[Rarity.LEGENDARY]
+    points[legendary] = points.get(legendary, 0.0) + lock_chance
+    return points
+
+
+def convolve(left: Dict[int, float], right: Dict[int, float]) -> Dict[int, float]:
+    """Distribution of the sum of two independent point distributions"""
+    total = {}
+    for a, pa in left.items():
+        for b, pb in right.items():
+            total[a + b] = total.get(a + b, 0.0) + pa * pb
+    return total
+
+
+class RarityDistribution:
+    """Discrete distribution of rarity scores with O(log n) percentile lookup"""
+
+    def __init__(self, point_probabilities: Dict[int, float]):
+        totals = sorted(p for p, prob in point_probabilities.items() if prob > 0)
+        self.scores: List[float] = [total / MAX_POINTS * 100 for total in totals]
+        self.probabilities: List[float] = [point_probabilities[total] for total in totals]
+
+        # below[i] = P(score < scores[i])
+        self.below: List[float] = []
+        running = 0.0
+        for probability in self.probabilities:
+            self.below.append(running)
+            running += probability
+
+    def percentile(self, score: float) -> float:
+        """Percentage of monkeys with a strictly lower rarity score (0-100)"""
+        i = bisect_left(self.scores, score - 1e-9)
+        if i >= len(self.scores):
+            return 100.0
+        return self.below[i] * 100
+
+    def mean(self) -> float:
+        """Expected rarity score"""
+        return sum(s * p for s, p in zip(self.scores, self.probabilities))
+
+    def to_dict(self) -> dict:
+        """Serializable form for the web dashboard"""
+        return {
+            "scores": [round(score, 4) for score in self.scores],
+            "probabilities": self.probabilities,
+            "percentiles": [round(below * 100, 4) for below in self.below],
+        }
+
+
+@lru_cache(maxsize=None)
+def _distribution(generation: int) -> RarityDistribution:
+    total = {0: 1.0}
+    for category in TraitCategory:
+        total = convolve(total, category_point_distribution(category, generation))
+    return RarityDistribution(total)
+
+
+def get_distribution(generation: int = 1) -> RarityDistribution:
+    """Cached rarity-score distribution for monkeys rolled at this generation"""
+    return _distribution(min(max(generation, 1), LOCK_HORIZON))
+
+
+def rarity_percentile(score: float, generation: int = 1) -> float:
+    """Percentage of freshly rolled monkeys that this score beats"""
+    return get_distribution(generation).percentile(score)
+
+
+def main():
+    """Print the rarity distribution"""
+    print("📊 ForkMonkey Rarity Distribution\n")
+    for generation in (1, LOCK_HORIZON):
+        distribution = get_distribution(generation)
+        print(f"   Generation {generation}: mean score {distribution.mean():.2f}")
+        for score in (20, 30, 50, 80):
+            print(f"     score {score}: rarer than {distribution.percentile(score):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+ForkMonkey Resilient AI Calls
+
+Retry, backoff, circuit breaking and deadlines around AIProvider calls.
+
+- transient failures (429, 408/409, 5xx, connection errors and timeouts)
+  are retried with full-jitter exponential backoff, waiting at least as
+  long as a Retry-After / retry-after-ms header asks
+- client errors (400, 401, 403, 404, ...) fail immediately
+- each provider has a circuit breaker shared by every agent in the
+  process: after repeated transient failures it opens and calls fail at
+  once with CircuitOpenError; after a cool-down one probe call is let
+  through and its outcome closes or re-opens the circuit
+- `with deadline(seconds):` bounds everything inside it; retries never
+  sleep past the deadline and providers shrink their HTTP timeouts to the
+  remaining time (see remaining_time)
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+from src.evolution import AIProvider
+
+
+RETRYABLE_STATUS = {408, 409, 429}
+
+_DEADLINE: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("ai_deadline", default=None)
+
+
+class CircuitOpenError(RuntimeError):
+    """The provider's circuit is open; the call was not attempted"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """No time left before the current deadline"""
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """Bound all provider calls in this context (and tasks/threads started from it)"""
+    if seconds is None:
+        yield
+        return
+    new = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    token = _DEADLINE.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none"""
+    current = _DEADLINE.get()
+    return None if current is None else max(0.0, current - time.monotonic())
+
+
+def status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an error looks transient (rate limit, server, network)"""
+    if isinstance(error, (CircuitOpenError, DeadlineExceeded)):
+        return False
+    status = status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS or status >= 500
+    name = type(error).__name__
+    return isinstance(error, (ConnectionError, TimeoutError)) or "Connection" in name or "Timeout" in name
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Delay requested by the server via retry-after-ms or Retry-After, in seconds"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Full-jitter exponential backoff"""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        multiplier: float = 2.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.rng = rng or random.Random()
+
+    def delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """Wait before retry number `attempt` (1-based), honoring Retry-After"""
+        cap = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        wait = self.rng.uniform(0, cap)
+        requested = retry_after(error) if error is not None else None
+        if requested is not None:
+            wait = max(wait, min(requested, self.max_delay))
+        return wait
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe -> closed"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now (claims the probe when half-open)"""
+        with self._lock:
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+            self._probing = False
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self.clock() - self.opened_at))
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def breaker_for(provider_name: str) -> CircuitBreaker:
+    """Process-wide circuit breaker for one provider"""
+    with _BREAKERS_LOCK:
+        if provider_name not in _BREAKERS:
+            _BREAKERS[provider_name] = CircuitBreaker()
+        return _BREAKERS[provider_name]
+
+
+class ResilientProvider(AIProvider):
+    """Wraps a provider with retries, a circuit breaker and deadline checks"""
+
+    def __init__(
+        self,
+        provider: AIProvider,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.provider = provider
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or breaker_for(provider.name())
+        self.model = getattr(provider, "model", "")
+        self.sleep = sleep
+        self.retries = 0
+
+    def _before_attempt(self):
+        left = remaining_time()
+        if left is not None and left <= 0:
+            raise DeadlineExceeded(f"Deadline passed before calling {self.provider.name()}")
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"{self.provider.name()} circuit open, retry in {self.breaker.retry_in():.1f}s"
+            )
+
+    def _after_failure(self, error: Exception, attempt: int) -> float:
+        """Record the failure; return the backoff, or re-raise if giving up"""
+        if not is_retryable(error):
+            # The provider answered, so it is up; a client error is the caller's problem
+            self.breaker.record_success()
+            raise error
+        self.breaker.record_failure()
+        if attempt >= self.policy.max_attempts or self.breaker.state == CircuitBreaker.OPEN:
+            raise error
+        wait = self.policy.delay(attempt, error)
+        left = remaining_time()
+        if left is not None and wait >= left:
+            raise error
+        self.retries += 1
+        return wait
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        attempt = 0
+        while True:
+            attempt += 1
+            self._before_attempt()
+            try:
+                response = self.provider.generate_response(prompt, max_tokens)
+            except Exception as e:
+                self.sleep(self._after_failure(e, attempt))
+                continue
+            self.breaker.record_success()
+            return response
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        attempt = 0
+        while True:
+            attempt += 1
+            self._before_attempt()
+            try:
+                response = await self.provider.agenerate_response(prompt, max_tokens)
+            except Exception as e:
+                await asyncio.sleep(self._after_failure(e, attempt))
+                continue
+            self.breaker.record_success()
+            return response
+
+    def name(self) -> str:
+        return self.provider.name()
+
+
+def main():
+    """Show retries and the circuit breaker against a flaky local provider"""
+    from src.local_provider import LocalProvider
+
+    print("🛡️  ForkMonkey Resilient Provider\n")
+
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.2)
+    flaky = ResilientProvider(
+        LocalProvider(error_rate=0.5, seed=1), RetryPolicy(base_delay=0.01), breaker=breaker
+    )
+    ok = failed = 0
+    for _ in range(20):
+        try:
+            flaky.generate_response("Generate a short story\n\nbody_color: brown → golden\n")
+            ok += 1
+        except Exception:
+            failed += 1
+    print(f"   50% flaky provider: {ok} ok, {failed} failed, {flaky.retries} retries, circuit {breaker.state}")
+
+    down = ResilientProvider(
+        LocalProvider(error_rate=1.0), RetryPolicy(base_delay=0.01), CircuitBreaker(failure_threshold=3)
+    )
+    start = time.perf_counter()
+    errors = []
+    for _ in range(10):
+        try:
+            down.generate_response("hi")
+        except Exception as e:
+            errors.append(type(e).__name__)
+    print(f"   Outage: {errors.count('CircuitOpenError')}/10 calls failed fast "
+          f"in {(time.perf_counter() - start) * 1000:.0f}ms total")
+
+    print("\n✅ Resilient provider working!")
+
+
+if __name__ == "__main__":
+    main()
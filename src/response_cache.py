@@ -0,0 +1,250 @@
+"""
+ForkMonkey AI Response Cache
+
+Persistent, content-addressed cache in front of AIProvider.generate_response.
+Identical prompts sent to the same provider/model with the same max_tokens
+return interchangeable answers, so they are served from a SQLite file
+instead of the network.
+
+- entries expire after a TTL
+- the least recently used entries are evicted once the stored responses
+  exceed max_bytes
+- hit/miss/eviction counters for reporting
+- replay-only mode never calls the provider (for offline CI runs); a miss
+  raises CacheMiss, which the agent treats like any provider failure
+- replies the agent cannot use (empty, truncated or unparseable) are
+  dropped again with CachedProvider.forget, so they are not replayed
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from src.evolution import AIProvider
+from src.metrics import annotate
+
+
+DEFAULT_CACHE_FILE = Path("monkey_data/ai_cache.sqlite")
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CacheMiss(LookupError):
+    """Raised in replay-only mode when a prompt has no cached response"""
+
+
+def cache_key(provider: str, model: str, prompt: str, max_tokens: int) -> str:
+    """Content address of one request"""
+    digest = hashlib.sha256(prompt.encode()).hexdigest()
+    return hashlib.sha256(f"{provider}\0{model}\0{max_tokens}\0{digest}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response store with TTL and size-based LRU eviction"""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_FILE,
+        ttl: Optional[float] = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        replay_only: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: SQLite file (":memory:" for a throwaway cache)
+            ttl: Seconds an entry stays valid (None = forever)
+            max_bytes: Total response size kept before LRU eviction
+            replay_only: Serve cached responses only, never call the provider
+            clock: Time source (injectable for tests)
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.replay_only = replay_only
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Async providers call in from worker threads
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                max_tokens INTEGER NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response, or None if missing or expired"""
+        now = self.clock()
+        with self._lock:
+            row = self._db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and self.ttl is not None and now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str, provider: str = "", model: str = "", max_tokens: int = 0):
+        """Store a response and evict least recently used entries past max_bytes"""
+        now = self.clock()
+        size = len(response.encode())
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, max_tokens, response, size, now, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def invalidate(self, key: str) -> bool:
+        """Delete one entry, returning whether it existed"""
+        with self._lock:
+            removed = self._db.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+            self._db.commit()
+        return removed > 0
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def purge_expired(self) -> int:
+        """Delete expired entries, returning how many were removed"""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            removed = self._db.execute(
+                "DELETE FROM responses WHERE created < ?", (self.clock() - self.ttl,)
+            ).rowcount
+            self._db.commit()
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Counters and size for reporting"""
+        with self._lock:
+            count, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "entries": count,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate(), 4),
+            "replay_only": self.replay_only,
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class CachedProvider(AIProvider):
+    """Wraps another provider, answering repeated requests from a ResponseCache"""
+
+    def __init__(self, provider: AIProvider, cache: ResponseCache):
+        self.provider = provider
+        self.cache = cache
+        self.model = getattr(provider, "model", "")
+
+    def _key(self, prompt: str, max_tokens: int) -> str:
+        return cache_key(self.provider.name(), self.model, prompt, max_tokens)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        response = self.cache.get(key)
+        if response is not None:
+            # No provider call: no tokens spent
+            annotate(cache_hit=True, prompt_tokens=0, completion_tokens=0)
+        elif self.cache.replay_only:
+            raise CacheMiss(f"No cached response for {self.provider.name()} (replay-only mode)")
+        return response
+
+    def _store(self, key: str, response: str, max_tokens: int):
+        self.cache.put(key, response, self.provider.name(), self.model, max_tokens)
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        key = self._key(prompt, max_tokens)
+        response = self._lookup(key)
+        if response is None:
+            response = self.provider.generate_response(prompt, max_tokens)
+            self._store(key, response, max_tokens)
+        return response
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        key = self._key(prompt, max_tokens)
+        response = self._lookup(key)
+        if response is None:
+            response = await self.provider.agenerate_response(prompt, max_tokens)
+            self._store(key, response, max_tokens)
+        return response
+
+    def forget(self, prompt: str, max_tokens: int = 1024):
+        """Drop the cached reply to a request, e.g. because it could not be parsed"""
+        self.cache.invalidate(self._key(prompt, max_tokens))
+
+    def name(self) -> str:
+        return f"{self.provider.name()} (cached)"
+
+
+def main():
+    """Show cache behaviour with a canned provider"""
+
+    class EchoProvider(AIProvider):
+        def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+            time.sleep(0.05)
+            return prompt.upper()
+
+        def name(self) -> str:
+            return "Echo"
+
+    print("🗄️  ForkMonkey AI Response Cache\n")
+
+    provider = CachedProvider(EchoProvider(), ResponseCache(":memory:"))
+    for prompt in ["evolve monkey a", "evolve monkey b", "evolve monkey a"]:
+        start = time.perf_counter()
+        provider.generate_response(prompt)
+        print(f"   {prompt!r}: {(time.perf_counter() - start) * 1000:6.1f}ms")
+
+    print(f"\n   Stats: {provider.cache.stats()}")
+    print("\n✅ Response cache working!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+ForkMonkey AI Provider Routing
+
+RoutingProvider spreads requests over several providers (e.g. Claude,
+GitHub Models and the local stand-in) instead of depending on one.
+
+- each provider keeps rolling latency and error-rate stats over its last
+  `window` calls
+- requests go to the fastest healthy provider first; providers with a
+  high error rate or an open circuit breaker are only used as failover
+- a provider with no latency samples yet is ranked as if it took
+  `prior_latency` (a typical model call), so a backup gets tried once
+  the others are slower than that instead of never being measured
+- a request still unanswered after `hedge_delay` seconds is also sent to
+  the next healthy provider and the first answer wins (hedging), which
+  cuts the tail latency of large runs at the cost of a few extra calls
+- a failed request fails over to the next provider at once
+
+Enable it with a comma-separated AI_PROVIDER, e.g.
+AI_PROVIDER=github,claude,local (AI_HEDGE_DELAY sets the hedge delay).
+"""
+
+import asyncio
+import contextvars
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.evolution import AIProvider
+from src.metrics import annotate
+
+
+DEFAULT_HEDGE_DELAY = 5.0
+DEFAULT_WINDOW = 50
+DEFAULT_MAX_ERROR_RATE = 0.5
+# Assumed latency of a provider before its first answer (seconds)
+DEFAULT_PRIOR_LATENCY = 2.0
+# Worker threads shared by the sync path's requests and hedges
+DEFAULT_MAX_WORKERS = 32
+# Calls seen before the error rate can mark a provider unhealthy
+MIN_SAMPLES = 5
+
+
+class ProviderStats:
+    """Rolling latency and error rate of one provider"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record_success(self, seconds: float):
+        with self._lock:
+            self.latencies.append(seconds)
+            self.outcomes.append(True)
+            self.calls += 1
+
+    def record_error(self):
+        with self._lock:
+            self.outcomes.append(False)
+            self.calls += 1
+            self.errors += 1
+
+    def record_abandoned(self, seconds: float):
+        """A hedged call that lost the race: it took at least `seconds`"""
+        with self._lock:
+            self.latencies.append(seconds)
+
+    def latency(self) -> Optional[float]:
+        """Median latency over the window, or None before any answer"""
+        with self._lock:
+            return statistics.median(self.latencies) if self.latencies else None
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def to_dict(self) -> dict:
+        latency = self.latency()
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ms": None if latency is None else round(latency * 1000, 1),
+            "error_rate": round(self.error_rate(), 4),
+        }
+
+
+class RoutingProvider(AIProvider):
+    """Routes each request to the fastest healthy provider, with hedging and failover"""
+
+    def __init__(
+        self,
+        providers: Sequence[AIProvider],
+        hedge_delay: Optional[float] = DEFAULT_HEDGE_DELAY,
+        max_error_rate: float = DEFAULT_MAX_ERROR_RATE,
+        window: int = DEFAULT_WINDOW,
+        prior_latency: float = DEFAULT_PRIOR_LATENCY,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        Args:
+            providers: Providers in order of preference (ties and untried
+                providers keep this order)
+            hedge_delay: Seconds before a slow request is also sent to the
+                next healthy provider (None = failover only, no hedging)
+            max_error_rate: Rolling error rate above which a provider is
+                only used for failover
+            window: Calls kept for the rolling stats
+            prior_latency: Latency assumed for providers without samples
+            max_workers: Threads for sync requests (see close())
+        """
+        if not providers:
+            raise ValueError("RoutingProvider needs at least one provider")
+        self.providers = list(providers)
+        self.hedge_delay = hedge_delay
+        self.max_error_rate = max_error_rate
+        self.prior_latency = prior_latency
+        self.max_workers = max_workers
+        self.stats = [ProviderStats(window) for _ in self.providers]
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self.model = ",".join(getattr(provider, "model", "") for provider in self.providers)
+        self.hedges = 0
+        self.failovers = 0
+
+    def healthy(self, index: int) -> bool:
+        """Low enough error rate and not behind an open circuit breaker"""
+        breaker = getattr(self.providers[index], "breaker", None)
+        if breaker is not None and breaker.state == breaker.OPEN and breaker.retry_in() > 0:
+            return False
+        stats = self.stats[index]
+        return len(stats.outcomes) < MIN_SAMPLES or stats.error_rate() <= self.max_error_rate
+
+    def ranked(self) -> Tuple[List[int], int]:
+        """Provider indexes, fastest healthy first; and how many are healthy"""
+        healthy = [self.healthy(i) for i in range(len(self.providers))]
+
+        def key(index: int):
+            latency = self.stats[index].latency()
+            return (not healthy[index], self.prior_latency if latency is None else latency, index)
+
+        return sorted(range(len(self.providers)), key=key), sum(healthy)
+
+    def _call(self, index: int, prompt: str, max_tokens: int) -> str:
+        start = time.perf_counter()
+        try:
+            response = self.providers[index].generate_response(prompt, max_tokens)
+        except Exception:
+            self.stats[index].record_error()
+            raise
+        self.stats[index].record_success(time.perf_counter() - start)
+        return response
+
+    async def _acall(self, index: int, prompt: str, max_tokens: int) -> str:
+        start = time.perf_counter()
+        try:
+            response = await self.providers[index].agenerate_response(prompt, max_tokens)
+        except asyncio.CancelledError:
+            self.stats[index].record_abandoned(time.perf_counter() - start)
+            raise
+        except Exception:
+            self.stats[index].record_error()
+            raise
+        self.stats[index].record_success(time.perf_counter() - start)
+        return response
+
+    def _won(self, index: int, response: str) -> str:
+        """Credit the answer to the provider that gave it (not to losing hedges)"""
+        annotate(provider=self.providers[index].name())
+        return response
+
+    def _hedge_wait(self, launched: int, healthy: int) -> Optional[float]:
+        """How long to wait before hedging, or None to wait for a result"""
+        if self.hedge_delay is None or launched >= healthy:
+            return None
+        return self.hedge_delay
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="route")
+            return self._pool
+
+    def close(self):
+        """Shut down the sync path's worker threads (running calls finish in the background)"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        order, healthy = self.ranked()
+        errors: List[Exception] = []
+        # Losing hedges finish in the background and still feed the stats
+        pool = self._executor()
+        pending = {}
+        launched = 0
+
+        def launch():
+            nonlocal launched
+            # Carry the caller's context (e.g. its deadline) into the worker
+            context = contextvars.copy_context()
+            future = pool.submit(context.run, self._call, order[launched], prompt, max_tokens)
+            pending[future] = order[launched]
+            launched += 1
+
+        try:
+            launch()
+            while pending:
+                done, _ = wait(pending, timeout=self._hedge_wait(launched, healthy), return_when=FIRST_COMPLETED)
+                if not done:
+                    self.hedges += 1
+                    launch()
+                    continue
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        return self._won(index, future.result())
+                    except Exception as e:
+                        errors.append(e)
+                if not pending and launched < len(order):
+                    self.failovers += 1
+                    launch()
+        finally:
+            # Hedges that have not started yet are not needed any more
+            for future in pending:
+                future.cancel()
+        raise errors[-1]
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        order, healthy = self.ranked()
+        errors: List[Exception] = []
+        pending = {}
+        launched = 0
+
+        def launch():
+            nonlocal launched
+            pending[asyncio.ensure_future(self._acall(order[launched], prompt, max_tokens))] = order[launched]
+            launched += 1
+
+        try:
+            launch()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=self._hedge_wait(launched, healthy), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.hedges += 1
+                    launch()
+                    continue
+                for task in done:
+                    index = pending.pop(task)
+                    if task.exception() is None:
+                        return self._won(index, task.result())
+                    errors.append(task.exception())
+                if not pending and launched < len(order):
+                    self.failovers += 1
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise errors[-1]
+
+    def report(self) -> Dict[str, dict]:
+        """Per-provider stats keyed by provider name"""
+        return {
+            provider.name(): {**stats.to_dict(), "healthy": self.healthy(i)}
+            for i, (provider, stats) in enumerate(zip(self.providers, self.stats))
+        }
+
+    def name(self) -> str:
+        return f"Routed ({', '.join(provider.name() for provider in self.providers)})"
+
+
+def main():
+    """Route between a fast, a slow and a broken local provider"""
+    from src.local_provider import LocalProvider
+
+    class Named(LocalProvider):
+        def __init__(self, label: str, **kwargs):
+            super().__init__(**kwargs)
+            self.label = label
+
+        def name(self) -> str:
+            return self.label
+
+    print("🔀 ForkMonkey Provider Routing\n")
+
+    router = RoutingProvider(
+        [
+            Named("Broken", error_rate=1.0),
+            Named("Slow", latency=0.08, seed=1),
+            Named("Fast", latency=0.01, jitter=0.005, seed=2),
+        ],
+        hedge_delay=0.03,
+    )
+
+    async def run(wave: int):
+        start = time.perf_counter()
+        await asyncio.gather(*(router.agenerate_response(f"evolve monkey {wave}-{i}") for i in range(20)))
+        return time.perf_counter() - start
+
+    for wave in range(3):
+        hedges, failovers = router.hedges, router.failovers
+        elapsed = asyncio.run(run(wave))
+        print(f"   Wave {wave + 1}: 20 requests in {elapsed * 1000:3.0f}ms, "
+              f"{router.hedges - hedges} hedges, {router.failovers - failovers} failovers")
+    print()
+    for name, stats in router.report().items():
+        state = "healthy" if stats["healthy"] else "unhealthy"
+        median = "-" if stats["latency_ms"] is None else f"{stats['latency_ms']}ms"
+        print(f"   {name:7s} calls {stats['calls']:3d}  errors {stats['error_rate']:4.0%}  "
+              f"median {median:>7s}  ({state})")
+
+    print("\n✅ Routing working!")
+
+
+if __name__ == "__main__":
+    main()
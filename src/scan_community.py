@@ -8,15 +8,26 @@ Generates multiple static JSON files for the web app:
 - web/leaderboard.json - Rarity rankings
 - web/family_tree.json - Fork genealogy
 - web/network_stats.json - Aggregate statistics
+- web/community_dna.json - Compact DNA codes for every fork
+- web/breeding_recommendations.json - Best parents to fork from
 """
 
 import os
+import sys
 import json
 from pathlib import Path
 from datetime import datetime, timezone
-from collections import Counter
 from github import Github, GithubException
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.breeding_planner import generate_recommendations
+from src.genetics import GeneticsEngine
+from src.genome import FORMAT_VERSION, PackedGenome, dna_code_from_dict
+from src.population import TraitStats, record_generation, record_score
+from src.rarity_stats import rarity_percentile
+
 
 def scan_community():
     """Main scanner function that generates all static data files."""
@@ -77,6 +88,8 @@ def scan_community():
         generate_leaderboard(monkeys)
         generate_family_tree(target_repo.full_name, monkeys)
         generate_network_stats(monkeys)
+        generate_dna_dump(monkeys)
+        generate_recommendations(monkeys)
         
         print("\n💾 All data files generated successfully!")
         
@@ -169,7 +182,8 @@ def scan_repo(repo, root_name, degree=0):
             "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
             "monkey_stats": None,
             "monkey_svg": None,
-            "monkey_dna": None
+            "monkey_dna": None,
+            "dna_code": None
         }
         
         # Fetch stats.json
@@ -193,19 +207,24 @@ def scan_repo(repo, root_name, degree=0):
             contents = repo.get_contents("monkey_data/dna.json")
             dna = json.loads(contents.decoded_content.decode())
             monkey_data["monkey_dna"] = dna
+            monkey_data["dna_code"] = dna_code_from_dict(dna)
         except Exception:
             pass
         
+        # Forks without dna.json may still publish a DNA code in stats.json
+        code = (monkey_data["monkey_stats"] or {}).get("dna_code")
+        if not monkey_data["monkey_dna"] and code:
+            try:
+                monkey_data["monkey_dna"] = PackedGenome.from_code(code).to_dict()
+                monkey_data["dna_code"] = code
+            except ValueError:
+                pass
+        
         # Only return if we found at least stats or SVG
         if monkey_data["monkey_stats"] or monkey_data["monkey_svg"]:
             # Ensure basic stats if missing
             if not monkey_data["monkey_stats"]:
-                monkey_data["monkey_stats"] = {
-                    "generation": 1,
-                    "rarity_score": 0,
-                    "age_days": age,
-                    "mutation_count": 0
-                }
+                monkey_data["monkey_stats"] = stats_from_dna(monkey_data["monkey_dna"], age)
             return monkey_data
         
         return None
@@ -215,6 +234,32 @@ def scan_repo(repo, root_name, degree=0):
         return None
 
 
+def stats_from_dna(dna_data, age):
+    """Basic stats for a fork without stats.json, derived from its DNA when present."""
+    stats = {
+        "generation": 1,
+        "rarity_score": 0,
+        "age_days": age,
+        "mutation_count": 0
+    }
+    if not dna_data:
+        return stats
+    
+    try:
+        # Another fork's dna.json is untrusted: validate it (coerces "3" to 3,
+        # rejects garbage) and fall back to defaults if it doesn't decode
+        dna = GeneticsEngine.dict_to_dna(dna_data)
+        stats.update({
+            "generation": dna.generation,
+            "rarity_score": dna.get_rarity_score(),
+            "mutation_count": dna.mutation_count,
+            "dna_hash": dna.dna_hash
+        })
+    except Exception:
+        pass
+    return stats
+
+
 def generate_community_data(source_repo, monkeys):
     """Generate community_data.json with all fork data."""
     data = {
@@ -233,26 +278,50 @@ def generate_community_data(source_repo, monkeys):
     print(f"📊 Generated {output_file}")
 
 
+def generate_dna_dump(monkeys):
+    """Generate community_dna.json mapping each fork to its compact DNA code."""
+    data = {
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+        "format_version": FORMAT_VERSION,
+        "monkeys": {
+            monkey["full_name"]: monkey["dna_code"]
+            for monkey in monkeys
+            if monkey.get("dna_code")
+        }
+    }
+    
+    output_file = Path("web/community_dna.json")
+    output_file.parent.mkdir(exist_ok=True)
+    
+    with open(output_file, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    
+    print(f"🧬 Generated {output_file} ({len(data['monkeys'])} DNA codes)")
+
+
 def generate_leaderboard(monkeys):
     """Generate leaderboard.json with rarity rankings."""
     # Sort by rarity score (descending)
-    sorted_monkeys = sorted(
-        monkeys,
-        key=lambda m: m.get("monkey_stats", {}).get("rarity_score", 0),
-        reverse=True
-    )
+    # Stats come from other forks: coerce them before sorting and ranking
+    scored = []
+    for monkey in monkeys:
+        stats = monkey.get("monkey_stats") or {}
+        generation = record_generation(stats.get("generation", 1))
+        scored.append((record_score(stats.get("rarity_score", 0)), max(generation, 1), monkey))
+    scored.sort(key=lambda entry: entry[0], reverse=True)
     
     rankings = []
-    for rank, monkey in enumerate(sorted_monkeys, start=1):
-        stats = monkey.get("monkey_stats", {})
+    for rank, (score, generation, monkey) in enumerate(scored, start=1):
+        stats = monkey.get("monkey_stats") or {}
         rankings.append({
             "rank": rank,
             "owner": monkey["owner"],
             "repo": monkey["repo"],
             "full_name": monkey["full_name"],
             "url": monkey["url"],
-            "rarity_score": stats.get("rarity_score", 0),
-            "generation": stats.get("generation", 1),
+            "rarity_score": score,
+            "rarity_percentile": round(rarity_percentile(score, generation), 2),
+            "generation": generation,
             "age_days": stats.get("age_days", 0),
             "mutation_count": stats.get("mutation_count", 0),
             "is_root": monkey["is_root"],
@@ -341,24 +410,13 @@ def generate_network_stats(monkeys):
             "trait_distribution": {}
         }
     else:
-        # Count generations
-        generation_counts = Counter()
-        rarity_scores = []
-        trait_counts = Counter()
+        records = []
         active_today = 0
         now = datetime.now(timezone.utc)
         
         for monkey in monkeys:
-            stats = monkey.get("monkey_stats", {})
-            dna = monkey.get("monkey_dna", {})
-            
-            # Generations
-            gen = stats.get("generation", 1)
-            generation_counts[str(gen)] += 1
-            
-            # Rarity
-            rarity = stats.get("rarity_score", 0)
-            rarity_scores.append(rarity)
+            stats = monkey.get("monkey_stats") or {}
+            dna = monkey.get("monkey_dna") or {}
             
             # Active today check
             updated = monkey.get("updated_at")
@@ -370,64 +428,25 @@ def generate_network_stats(monkeys):
                 except Exception:
                     pass
             
-            # Collect traits
-            traits = stats.get("traits", {})
-            if not traits and dna:
-                traits = dna.get("traits", {})
-            
-            for trait_name, trait_data in traits.items():
-                if isinstance(trait_data, dict):
-                    value = trait_data.get("value", "unknown")
-                else:
-                    value = trait_data
-                trait_counts[f"{trait_name}:{value}"] += 1
+            # Traits from stats.json, falling back to dna.json
+            traits = stats.get("traits") or dna.get("traits") or {}
+            records.append((stats.get("generation", 1), stats.get("rarity_score", 0), traits))
         
-        # Calculate stats
-        avg_rarity = sum(rarity_scores) / len(rarity_scores) if rarity_scores else 0
-        
-        # Find rarest and most common traits
-        rarest_trait = None
-        most_common_trait = None
-        
-        if trait_counts:
-            sorted_traits = trait_counts.most_common()
-            most_common = sorted_traits[0]
-            rarest = sorted_traits[-1]
-            
-            most_common_trait = {
-                "trait": most_common[0].split(":")[0],
-                "value": most_common[0].split(":")[1] if ":" in most_common[0] else most_common[0],
-                "count": most_common[1]
-            }
-            
-            rarest_trait = {
-                "trait": rarest[0].split(":")[0],
-                "value": rarest[0].split(":")[1] if ":" in rarest[0] else rarest[0],
-                "count": rarest[1]
-            }
-        
-        # Build trait distribution
-        trait_distribution = {}
-        for trait_key, count in trait_counts.items():
-            parts = trait_key.split(":")
-            trait_name = parts[0]
-            trait_value = parts[1] if len(parts) > 1 else "unknown"
-            
-            if trait_name not in trait_distribution:
-                trait_distribution[trait_name] = {}
-            trait_distribution[trait_name][trait_value] = count
+        # Columnar counts of generations, traits and rarity scores
+        trait_stats = TraitStats.from_records(records)
         
         data = {
             "last_updated": datetime.now(timezone.utc).isoformat(),
             "total_monkeys": len(monkeys),
             "active_today": active_today,
-            "generations": dict(generation_counts),
-            "avg_rarity": round(avg_rarity, 2),
-            "max_rarity": round(max(rarity_scores), 2) if rarity_scores else 0,
-            "min_rarity": round(min(rarity_scores), 2) if rarity_scores else 0,
-            "rarest_trait": rarest_trait,
-            "most_common_trait": most_common_trait,
-            "trait_distribution": trait_distribution
+            "generations": {str(gen): count for gen, count in trait_stats.generations().items()},
+            "avg_rarity": round(trait_stats.score_mean, 2),
+            "rarity_std": round(trait_stats.score_std, 2),
+            "max_rarity": round(trait_stats.score_max, 2),
+            "min_rarity": round(trait_stats.score_min, 2),
+            "rarest_trait": trait_stats.rarest_trait(),
+            "most_common_trait": trait_stats.most_common_trait(),
+            "trait_distribution": trait_stats.value_distribution()
         }
     
     output_file = Path("web/network_stats.json")
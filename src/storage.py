@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from github import Github, GithubException
 from src.genetics import MonkeyDNA, GeneticsEngine
+from src.genome import PackedGenome
+from src.rarity_stats import rarity_percentile
 
 
 class MonkeyStorage:
@@ -79,8 +81,13 @@ class MonkeyStorage:
             print(f"❌ Failed to save DNA: {e}")
             return False
     
-    def load_dna(self) -> Optional[MonkeyDNA]:
-        """Load DNA from local file"""
+    def load_dna(self, trusted: bool = False) -> Optional[MonkeyDNA]:
+        """
+        Load DNA from local file
+        
+        Args:
+            trusted: Skip pydantic validation (see GeneticsEngine.dict_to_dna)
+        """
         try:
             dna_file = self.data_dir / "dna.json"
             
@@ -91,7 +98,7 @@ class MonkeyStorage:
             with open(dna_file, "r") as f:
                 dna_dict = json.load(f)
             
-            dna = GeneticsEngine.dict_to_dna(dna_dict)
+            dna = GeneticsEngine.dict_to_dna(dna_dict, trusted=trusted)
             print(f"✅ DNA loaded from {dna_file}")
             return dna
             
@@ -99,6 +106,44 @@ class MonkeyStorage:
             print(f"❌ Failed to load DNA: {e}")
             return None
     
+    def save_dna_binary(self, dna: MonkeyDNA) -> bool:
+        """Save DNA in the compact binary format (see src.genome)"""
+        try:
+            dna_file = self.data_dir / "dna.bin"
+            dna_file.write_bytes(PackedGenome.from_dna(dna).to_bytes())
+            
+            print(f"✅ DNA saved to {dna_file}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Failed to save binary DNA: {e}")
+            return False
+    
+    def load_dna_binary(self) -> Optional[MonkeyDNA]:
+        """Load DNA saved by save_dna_binary"""
+        try:
+            dna_file = self.data_dir / "dna.bin"
+            
+            if not dna_file.exists():
+                print("ℹ️  No binary DNA file found")
+                return None
+            
+            dna = PackedGenome.from_bytes(dna_file.read_bytes()).to_dna()
+            print(f"✅ DNA loaded from {dna_file}")
+            return dna
+            
+        except Exception as e:
+            print(f"❌ Failed to load binary DNA: {e}")
+            return None
+    
+    @staticmethod
+    def get_dna_code(dna: MonkeyDNA) -> Optional[str]:
+        """URL-safe DNA code, or None if the DNA has traits outside the pool"""
+        try:
+            return PackedGenome.from_dna(dna).to_code()
+        except ValueError:
+            return None
+    
     def save_history_entry(self, dna: MonkeyDNA, story: str = "", svg_filename: Optional[str] = None) -> bool:
         """Add entry to evolution history
         
@@ -178,7 +223,9 @@ class MonkeyStorage:
                 "age_days": age_days,
                 "mutation_count": dna.mutation_count,
                 "rarity_score": dna.get_rarity_score(),
+                "rarity_percentile": round(rarity_percentile(dna.get_rarity_score(), dna.generation), 2),
                 "parent_id": dna.parent_id,
+                "dna_code": self.get_dna_code(dna),
                 "traits": {
                     cat.value: {
                         "value": trait.value,
@@ -200,6 +247,22 @@ class MonkeyStorage:
             print(f"❌ Failed to save stats: {e}")
             return False
     
+    def save_breeding_odds(self, dna: MonkeyDNA, mutation_rate: float = 0.3) -> bool:
+        """Save exact odds for a fork of this monkey (read by the web dashboard)"""
+        try:
+            from src.breeding_odds import breeding_odds
+            
+            odds_file = self.data_dir / "breeding_odds.json"
+            with open(odds_file, "w") as f:
+                json.dump(breeding_odds(dna, mutation_rate).to_dict(), f, indent=2)
+            
+            print(f"✅ Breeding odds saved")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Failed to save breeding odds: {e}")
+            return False
+    
     def _calculate_streak(self, stats_file: Path) -> dict:
         """Calculate evolution streak from history"""
         try:
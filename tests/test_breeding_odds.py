@@ -0,0 +1,88 @@
+"""
+Tests for exact breeding odds
+"""
+
+import json
+from collections import Counter
+
+import pytest
+
+from src.breeding_odds import breeding_odds, category_distribution
+from src.genetics import GeneticsEngine, Rarity, TraitCategory, seeded_rng
+
+
+class TestCategoryDistribution:
+    """Test the per-category child distribution"""
+
+    def test_normalized(self):
+        """Test every category distribution sums to one"""
+        for generation in (2, 6, 20):
+            for category in TraitCategory:
+                dist = category_distribution(category, ("brown", Rarity.COMMON), generation, 0.3)
+                assert sum(dist.values()) == pytest.approx(1.0)
+
+    def test_inheritance_without_mutation(self):
+        """Test a parent trait is kept half the time plus its fresh-roll chance"""
+        dist = category_distribution(TraitCategory.FACE_EXPRESSION, ("happy", Rarity.COMMON), 2, 0.0)
+
+        assert dist[("happy", Rarity.COMMON)] == pytest.approx(0.5 + 0.5 * 0.60 / 4)
+        assert dist[("divine", Rarity.LEGENDARY)] == pytest.approx(0.5 * 0.05 / 4)
+
+    def test_gen_locked_only_while_available(self):
+        """Test gen-locked values appear only for generations that can roll them"""
+        early = category_distribution(TraitCategory.BODY_COLOR, ("brown", Rarity.COMMON), 2, 0.0)
+        late = category_distribution(TraitCategory.BODY_COLOR, ("brown", Rarity.COMMON), 6, 0.0)
+
+        # Gen 2 can roll prismatic or genesis_gold: 3% split between them
+        assert early[("prismatic", Rarity.LEGENDARY)] == pytest.approx(0.015)
+        assert ("prismatic", Rarity.LEGENDARY) not in late
+
+    def test_custom_parent_value(self):
+        """Test parent values outside the pool are inherited as-is"""
+        dist = category_distribution(TraitCategory.SPECIAL, ("ai_invented", Rarity.RARE), 20, 0.0)
+        assert dist[("ai_invented", Rarity.RARE)] == pytest.approx(0.5)
+
+
+class TestBreedingOdds:
+    """Test whole-monkey breeding odds"""
+
+    def test_matches_simulation(self, sample_dna):
+        """Test exact odds agree with repeated GeneticsEngine.breed calls"""
+        odds = breeding_odds(sample_dna, 0.3)
+        rng = seeded_rng(1)
+        trials = 20000
+        rarities = Counter()
+        any_legendary = 0
+
+        for _ in range(trials):
+            child = GeneticsEngine.breed(sample_dna, 0.3, rng=rng)
+            rarities[child.traits[TraitCategory.BODY_COLOR].rarity] += 1
+            any_legendary += any(t.rarity == Rarity.LEGENDARY for t in child.traits.values())
+
+        expected = odds.rarity_probabilities(TraitCategory.BODY_COLOR)
+        for rarity in Rarity:
+            assert rarities[rarity] / trials == pytest.approx(expected[rarity], abs=0.015)
+        assert any_legendary / trials == pytest.approx(odds.any_legendary_chance(), abs=0.015)
+
+    def test_cached_per_parent(self, sample_dna):
+        """Test repeated queries reuse the computed odds"""
+        assert breeding_odds(sample_dna, 0.3) is breeding_odds(sample_dna, 0.3)
+        assert breeding_odds(sample_dna, 0.3) is not breeding_odds(sample_dna, 0.5)
+
+    def test_score_distribution(self, sample_dna):
+        """Test the rarity score distribution is normalized and bounded"""
+        odds = breeding_odds(sample_dna)
+
+        assert sum(odds.score.probabilities) == pytest.approx(1.0)
+        assert 10.0 <= odds.expected_rarity_score() <= 100.0
+
+    def test_to_dict_is_json(self, sample_dna):
+        """Test the web export serializes"""
+        data = json.loads(json.dumps(breeding_odds(sample_dna).to_dict()))
+
+        assert data["parent_hash"] == sample_dna.dna_hash
+        assert set(data["categories"]) == {category.value for category in sample_dna.traits}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
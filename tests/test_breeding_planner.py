@@ -0,0 +1,81 @@
+"""
+Tests for the breeding planner
+"""
+
+import json
+
+import pytest
+
+from src.breeding_odds import breeding_odds
+from src.breeding_planner import child_outlook, generate_recommendations, parent_traits, rank_parents
+from src.genetics import GeneticsEngine, seeded_rng
+from src.genome import encode_dna
+
+
+@pytest.fixture
+def community():
+    rng = seeded_rng(11, "community")
+    monkeys = []
+    for i in range(40):
+        dna = GeneticsEngine.generate_random_dna(generation=rng.randint(1, 12), rng=rng)
+        monkeys.append({"full_name": f"owner{i}/forkMonkey", "monkey_dna": GeneticsEngine.dna_to_dict(dna)})
+    return monkeys
+
+
+class TestParentTraits:
+    """Test reading parents from community entries"""
+
+    def test_sources_agree(self, sample_dna):
+        """Test dna.json, DNA code and stats traits give the same parent"""
+        data = GeneticsEngine.dna_to_dict(sample_dna)
+        stats = {"generation": sample_dna.generation, "traits": data["traits"]}
+
+        from_dna = parent_traits({"monkey_dna": data})
+        from_code = parent_traits({"dna_code": encode_dna(sample_dna)})
+        from_stats = parent_traits({"monkey_stats": stats})
+
+        assert from_dna == from_code == from_stats
+
+    def test_unusable_entries(self):
+        """Test entries without DNA or with unknown names are skipped"""
+        assert parent_traits({"monkey_stats": {"generation": 1, "rarity_score": 0}}) is None
+        assert parent_traits({"dna_code": "not-a-code"}) is None
+        assert parent_traits({"monkey_stats": {"traits": {"tail": {"value": "x", "rarity": "common"}}}}) is None
+
+
+class TestRankParents:
+    """Test parent ranking"""
+
+    def test_matches_breeding_odds(self, sample_dna):
+        """Test the cached summary equals the full breeding odds"""
+        generation, traits = parent_traits({"monkey_dna": GeneticsEngine.dna_to_dict(sample_dna)})
+        expected, legendary = child_outlook(generation, traits, 0.3)
+        odds = breeding_odds(sample_dna, 0.3)
+
+        assert expected == pytest.approx(odds.expected_rarity_score())
+        assert legendary == pytest.approx(odds.any_legendary_chance())
+
+    def test_sorted_and_limited(self, community):
+        """Test recommendations are the top candidates in descending order"""
+        ranked = rank_parents(community, top=5)
+        everyone = rank_parents(community, top=None)
+        scores = [entry["expected_child_rarity"] for entry in everyone]
+
+        assert len(ranked) == 5
+        assert len(everyone) == len(community)
+        assert scores == sorted(scores, reverse=True)
+        assert ranked == everyone[:5]
+        assert [entry["rank"] for entry in ranked] == [1, 2, 3, 4, 5]
+
+    def test_writes_json(self, community, tmp_path):
+        """Test the recommendations file is written"""
+        output = tmp_path / "breeding_recommendations.json"
+        generate_recommendations(community + [{"full_name": "empty/fork"}], top=3, output_file=output)
+        data = json.loads(output.read_text())
+
+        assert data["total_candidates"] == len(community) + 1
+        assert len(data["recommendations"]) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
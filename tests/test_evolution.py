@@ -0,0 +1,266 @@
+"""
+Tests for the AI evolution agent
+"""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+from src.evolution import AIProvider, EvolutionAgent, estimate_tokens
+from src.genetics import GeneticsEngine, Rarity, TraitCategory, seeded_rng
+
+
+EVOLUTION_RESPONSE = json.dumps({
+    "changes": [
+        {"category": "body_color", "new_value": "golden", "new_rarity": "uncommon", "reason": "warmer"}
+    ],
+    "evolution_story": "Your monkey is glowing golden.",
+})
+
+
+class FakeProvider(AIProvider):
+    """Sync provider returning canned responses"""
+
+    def __init__(self, response=EVOLUTION_RESPONSE, story="A golden day!"):
+        self.response = response
+        self.story = story
+        self.prompts = []
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        self.prompts.append(prompt)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.story if prompt.startswith("Generate a short") else self.response
+
+    def name(self) -> str:
+        return "Fake"
+
+
+class SlowAsyncProvider(FakeProvider):
+    """Async provider that records how many calls overlap"""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.generate_response(prompt, max_tokens)
+
+
+class BatchProvider(FakeProvider):
+    """Answers batch prompts with one golden change per monkey id"""
+
+    def __init__(self, drop=0, garbage_above=None):
+        super().__init__()
+        self.drop = drop
+        self.garbage_above = garbage_above
+        self.batch_sizes = []
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        if not prompt.startswith("You are an AI evolution agent") or "JSON array" not in prompt:
+            return super().generate_response(prompt, max_tokens)
+        self.prompts.append(prompt)
+        ids = re.findall(r'^\{"id":\s*"(m\d+)"', prompt, flags=re.MULTILINE)
+        self.batch_sizes.append(len(ids))
+        if self.garbage_above is not None and len(ids) > self.garbage_above:
+            return "Sorry, I cannot help with that."
+        answers = [
+            {
+                "id": monkey_id,
+                "changes": [{"category": "body_color", "new_value": "golden", "new_rarity": "uncommon"}],
+                "evolution_story": "Golden fur for everyone.",
+            }
+            for monkey_id in ids[self.drop:]
+        ]
+        return json.dumps(answers)
+
+
+@pytest.fixture
+def plain_dna():
+    """A monkey the canned responses are guaranteed to change"""
+    rng = seeded_rng(5, "plain")
+    while True:
+        dna = GeneticsEngine.generate_random_dna(rng=rng)
+        if (dna.traits[TraitCategory.BODY_COLOR].value != "golden"
+                and dna.traits[TraitCategory.ACCESSORY].value != "laser_eyes"):
+            return dna
+
+
+@pytest.fixture
+def herd():
+    rng = seeded_rng(17, "herd")
+    return [GeneticsEngine.generate_random_dna(rng=rng) for _ in range(8)]
+
+
+class TestEvolutionAgent:
+    """Test the synchronous agent"""
+
+    def test_applies_ai_changes(self, plain_dna):
+        """Test suggested changes are applied and the hash is refreshed"""
+        agent = EvolutionAgent(provider=FakeProvider())
+        evolved = agent.evolve_with_ai(plain_dna)
+
+        assert evolved.traits[TraitCategory.BODY_COLOR].value == "golden"
+        assert evolved.traits[TraitCategory.BODY_COLOR].rarity == Rarity.UNCOMMON
+        assert evolved.mutation_count == plain_dna.mutation_count + 1
+
+    def test_prompt_lists_catalog_options(self, sample_dna):
+        """Test the prompt carries the current traits and trait options"""
+        provider = FakeProvider()
+        EvolutionAgent(provider=provider).evolve_with_ai(sample_dna)
+
+        assert sample_dna.traits[TraitCategory.ACCESSORY].value in provider.prompts[0]
+        assert "- body_color: brown, tan" in provider.prompts[0]
+
+    def test_falls_back_on_error(self, sample_dna):
+        """Test provider errors fall back to random evolution"""
+        agent = EvolutionAgent(provider=FakeProvider(response=RuntimeError("down")))
+        evolved = agent.evolve_with_ai(sample_dna)
+
+        assert evolved.generation == sample_dna.generation
+
+
+class TestSingleCallStory:
+    """Test reusing the story from the evolution response"""
+
+    def test_consistent_story_reused(self, plain_dna):
+        """Test one call is enough when the story names the new values"""
+        provider = FakeProvider()
+        evolved, story = EvolutionAgent(provider=provider).evolve_with_story(plain_dna)
+
+        assert evolved.traits[TraitCategory.BODY_COLOR].value == "golden"
+        assert story == "Your monkey is glowing golden."
+        assert len(provider.prompts) == 1
+
+    def test_inconsistent_story_regenerated(self, plain_dna):
+        """Test a story that misses a change triggers a second call"""
+        response = json.loads(EVOLUTION_RESPONSE)
+        response["evolution_story"] = "Your monkey grew a fancy hat."
+        provider = FakeProvider(response=json.dumps(response))
+        _, story = EvolutionAgent(provider=provider).evolve_with_story(plain_dna)
+
+        assert story == "A golden day!"
+        assert len(provider.prompts) == 2
+
+    def test_underscored_values_match_spaces(self, plain_dna):
+        """Test 'laser eyes' in the story counts as mentioning laser_eyes"""
+        response = {
+            "changes": [{"category": "accessory", "new_value": "laser_eyes", "new_rarity": "rare"}],
+            "evolution_story": "Laser eyes! Your monkey now sees through walls.",
+        }
+        provider = FakeProvider(response=json.dumps(response))
+        _, story = EvolutionAgent(provider=provider).evolve_with_story(plain_dna)
+
+        assert story.startswith("Laser eyes")
+        assert len(provider.prompts) == 1
+
+    def test_no_changes_rested_without_second_call(self, sample_dna):
+        """Test unchanged monkeys get the rested message from one call"""
+        provider = FakeProvider(response=json.dumps({"changes": [], "evolution_story": "Nothing."}))
+        evolved, story = EvolutionAgent(provider=provider).evolve_with_story(sample_dna)
+
+        assert evolved.dna_hash == sample_dna.dna_hash
+        assert story == "Your monkey rested today. No visible changes."
+        assert len(provider.prompts) == 1
+
+    def test_async_reuses_story(self, plain_dna):
+        """Test the async path also skips the story call"""
+        provider = FakeProvider()
+        _, story = asyncio.run(EvolutionAgent(provider=provider).aevolve_with_story(plain_dna))
+
+        assert story == "Your monkey is glowing golden."
+        assert len(provider.prompts) == 1
+
+
+class TestBatchEvolution:
+    """Test multi-monkey batch prompts"""
+
+    def test_one_prompt_for_small_batch(self, herd):
+        """Test a small herd is evolved with a single request"""
+        provider = BatchProvider()
+        results = EvolutionAgent(provider=provider).evolve_batch(herd)
+
+        assert provider.batch_sizes == [len(herd)]
+        for dna, (evolved, story) in zip(herd, results):
+            assert evolved.traits[TraitCategory.BODY_COLOR].value == "golden"
+            if dna.traits[TraitCategory.BODY_COLOR].value != "golden":
+                assert story == "Golden fur for everyone."
+
+    def test_token_budget_splits_batches(self, herd):
+        """Test prompts are split to stay within the token budget"""
+        provider = BatchProvider()
+        agent = EvolutionAgent(provider=provider)
+        base = estimate_tokens(agent._create_batch_prompt([], 1))
+        results = agent.evolve_batch(herd, token_budget=base + 3 * 300)
+
+        assert sum(provider.batch_sizes) == len(herd)
+        assert len(provider.batch_sizes) > 1
+        assert all(len(result) == 2 for result in results)
+
+    def test_missing_ids_retried(self, herd):
+        """Test monkeys left out of a truncated reply are asked again"""
+        provider = BatchProvider(drop=1)
+        results = EvolutionAgent(provider=provider).evolve_batch(herd)
+
+        assert provider.batch_sizes[0] == len(herd)
+        assert all(evolved.traits[TraitCategory.BODY_COLOR].value == "golden" for evolved, _ in results)
+
+    def test_unparseable_reply_splits(self, herd):
+        """Test garbage replies halve the batch until it succeeds"""
+        provider = BatchProvider(garbage_above=2)
+        results = EvolutionAgent(provider=provider).evolve_batch(herd)
+
+        assert provider.batch_sizes[0] == len(herd)
+        assert max(provider.batch_sizes[1:]) <= len(herd) // 2
+        assert [evolved.birth_timestamp for evolved, _ in results] == [dna.birth_timestamp for dna in herd]
+        assert all(evolved.traits[TraitCategory.BODY_COLOR].value == "golden" for evolved, _ in results)
+
+
+class TestAsyncEvolution:
+    """Test the async provider path"""
+
+    def test_default_runs_sync_provider_in_thread(self):
+        """Test providers without a native async client still work"""
+        provider = FakeProvider()
+        assert asyncio.run(provider.agenerate_response("hello")) == EVOLUTION_RESPONSE
+
+    def test_async_matches_sync(self, plain_dna):
+        """Test the async path makes the same changes and story"""
+        dna = plain_dna
+        agent = EvolutionAgent(provider=FakeProvider())
+        sync_evolved = agent.evolve_with_ai(dna)
+        async_evolved = asyncio.run(agent.aevolve_with_ai(dna))
+
+        assert async_evolved.dna_hash == sync_evolved.dna_hash
+        assert asyncio.run(agent.agenerate_evolution_story(dna, async_evolved)) == "A golden day!"
+
+    def test_evolve_many_bounded(self, herd):
+        """Test batches run concurrently without exceeding max_concurrency"""
+        provider = SlowAsyncProvider()
+        agent = EvolutionAgent(provider=provider, max_concurrency=3)
+        results = agent.evolve_many_with_ai(herd)
+
+        assert len(results) == len(herd)
+        assert 1 < provider.peak <= 3
+        for dna, (evolved, story) in zip(herd, results):
+            assert evolved.birth_timestamp == dna.birth_timestamp
+            assert story
+
+    def test_evolve_many_without_story(self, herd):
+        """Test story requests can be skipped"""
+        provider = SlowAsyncProvider()
+        results = EvolutionAgent(provider=provider).evolve_many_with_ai(herd, with_story=False)
+
+        assert all(story is None for _, story in results)
+        assert len(provider.prompts) == len(herd)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,9 +2,13 @@
 Tests for genetics system
 """
 
+import subprocess
+import sys
+
 import pytest
 from src.genetics import (
-    GeneticsEngine, MonkeyDNA, Trait, TraitCategory, Rarity
+    GeneticsEngine, MonkeyDNA, Trait, TraitCategory, Rarity,
+    TRAIT_CATALOG, TRAIT_VALUES, derive_seed, seeded_rng
 )
 
 
@@ -161,6 +165,57 @@ class TestTrait:
         
         assert trait1.gene_sequence == trait2.gene_sequence
 
+    def test_trait_is_immutable(self, common_trait):
+        """Test traits cannot be modified in place"""
+        with pytest.raises(Exception):
+            common_trait.value = "tan"
+
+
+class TestTraitRegistry:
+    """Test interned trait instances"""
+
+    def test_get_trait_is_interned(self):
+        """Test pool traits are shared instances"""
+        trait1 = GeneticsEngine.get_trait(TraitCategory.BODY_COLOR, "golden", Rarity.UNCOMMON)
+        trait2 = GeneticsEngine.get_trait(TraitCategory.BODY_COLOR, "golden", Rarity.UNCOMMON)
+
+        assert trait1 is trait2
+        assert trait1 == Trait(
+            category=TraitCategory.BODY_COLOR,
+            value="golden",
+            rarity=Rarity.UNCOMMON
+        )
+
+    def test_get_trait_covers_gen_locked(self):
+        """Test gen-locked traits are interned as legendary"""
+        trait = GeneticsEngine.get_trait(TraitCategory.SPECIAL, "pioneer_glow", Rarity.LEGENDARY)
+        assert trait is GeneticsEngine.get_trait(TraitCategory.SPECIAL, "pioneer_glow", Rarity.LEGENDARY)
+
+    def test_get_trait_outside_pool(self):
+        """Test unknown combinations still produce a valid trait"""
+        trait = GeneticsEngine.get_trait(TraitCategory.BODY_COLOR, "plaid", Rarity.RARE)
+
+        assert trait.value == "plaid"
+        assert len(trait.gene_sequence) == 8
+
+    def test_operations_share_traits(self, sample_dna):
+        """Test generated, evolved and loaded DNA reuse interned traits"""
+        for cat, trait in sample_dna.traits.items():
+            assert trait is GeneticsEngine.get_trait(cat, trait.value, trait.rarity)
+
+        unchanged = GeneticsEngine.evolve(sample_dna, evolution_strength=0.0)
+        restored = GeneticsEngine.dict_to_dna(GeneticsEngine.dna_to_dict(sample_dna))
+        for cat in TraitCategory:
+            assert unchanged.traits[cat] is sample_dna.traits[cat]
+            assert restored.traits[cat] is sample_dna.traits[cat]
+
+    def test_dict_to_dna_keeps_custom_gene_sequence(self, dna_dict):
+        """Test non-standard gene sequences survive loading"""
+        dna_dict["traits"]["body_color"]["gene_sequence"] = "regen_00"
+
+        dna = GeneticsEngine.dict_to_dna(dna_dict)
+        assert dna.traits[TraitCategory.BODY_COLOR].gene_sequence == "regen_00"
+
 
 class TestMonkeyDNA:
     """Test MonkeyDNA model"""
@@ -198,6 +253,31 @@ class TestMonkeyDNA:
         
         # Same traits should give same hash
         assert dna1.dna_hash == dna2.dna_hash
+    
+    def test_dna_hash_matches_legacy_format(self, sample_dna):
+        """Test the memoized hash is bit-compatible with stored hashes"""
+        import hashlib
+        trait_string = "".join(
+            f"{cat.value}:{trait.gene_sequence}" for cat, trait in sorted(sample_dna.traits.items())
+        )
+        
+        assert sample_dna.dna_hash == hashlib.sha256(trait_string.encode()).hexdigest()[:16]
+    
+    def test_unchanged_evolution_keeps_hash(self, sample_dna):
+        """Test evolving without changes reuses the hash instead of recomputing it"""
+        from unittest.mock import patch
+        
+        with patch.object(MonkeyDNA, "_calculate_hash") as calculate:
+            evolved = GeneticsEngine.evolve(sample_dna, evolution_strength=0.0)
+        
+        calculate.assert_not_called()
+        assert evolved.dna_hash == sample_dna.dna_hash
+    
+    def test_changed_evolution_rehashes(self, sample_dna):
+        """Test evolving with changes gives the hash of the new traits"""
+        evolved = GeneticsEngine.evolve(sample_dna, evolution_strength=1.0, rng=seeded_rng(2))
+        
+        assert evolved.dna_hash == MonkeyDNA(traits=evolved.traits).dna_hash
 
 
 class TestGenLockedTraits:
@@ -282,6 +362,32 @@ class TestGenLockedTraits:
                 # (unless inherited from parent)
                 pass  # Allow inheritance
     
+    def test_lookup_table_matches_definitions(self):
+        """Test the precomputed table agrees with GEN_LOCKED_TRAITS for every generation"""
+        for category in TraitCategory:
+            for generation in range(0, 20):
+                expected = [
+                    value
+                    for max_gen, values in GeneticsEngine.GEN_LOCKED_TRAITS.get(category, {}).items()
+                    if generation <= max_gen
+                    for value in values
+                ]
+                assert list(GeneticsEngine.get_gen_locked_traits(category, generation)) == expected
+    
+    def test_lock_generation_reverse_index(self):
+        """Test trait -> max generation lookup"""
+        assert GeneticsEngine.get_gen_lock_generation(TraitCategory.BODY_COLOR, "prismatic") == 5
+        assert GeneticsEngine.get_gen_lock_generation(TraitCategory.SPECIAL, "pioneer_glow") == 10
+        assert GeneticsEngine.get_gen_lock_generation(TraitCategory.BODY_COLOR, "brown") is None
+    
+    def test_extinct_traits(self):
+        """Test extinct traits grow with generation until all are gone"""
+        total = sum(len(values) for locks in GeneticsEngine.GEN_LOCKED_TRAITS.values() for values in locks.values())
+        
+        assert GeneticsEngine.get_extinct_traits(1) == ()
+        assert (TraitCategory.BODY_COLOR, "origin_white") in GeneticsEngine.get_extinct_traits(2)
+        assert len(GeneticsEngine.get_extinct_traits(100)) == total
+    
     def test_category_without_gen_locked(self):
         """Test categories without gen-locked traits return empty"""
         # FACE_EXPRESSION has no gen-locked traits
@@ -289,5 +395,131 @@ class TestGenLockedTraits:
         assert len(locked) == 0
 
 
+class TestTrustedCodec:
+    """Test the unvalidated dict_to_dna fast path"""
+    
+    def test_matches_validated(self, dna_dict):
+        """Test trusted and validated decoding agree"""
+        trusted = GeneticsEngine.dict_to_dna(dna_dict, trusted=True)
+        
+        assert trusted == GeneticsEngine.dict_to_dna(dna_dict)
+        assert GeneticsEngine.dna_to_dict(trusted) == GeneticsEngine.dna_to_dict(
+            GeneticsEngine.dict_to_dna(dna_dict)
+        )
+    
+    def test_uses_interned_traits(self, sample_dna):
+        """Test pool traits decode to the shared instances"""
+        trusted = GeneticsEngine.dict_to_dna(GeneticsEngine.dna_to_dict(sample_dna), trusted=True)
+        
+        for category, trait in trusted.traits.items():
+            assert trait is GeneticsEngine.get_trait(category, trait.value, trait.rarity)
+    
+    def test_custom_gene_sequence_and_missing_hash(self, dna_dict):
+        """Test custom gene sequences are kept and a missing hash is computed"""
+        data = dict(dna_dict, dna_hash="")
+        data["traits"] = dict(data["traits"], body_color=dict(data["traits"]["body_color"], gene_sequence="custom01"))
+        
+        trusted = GeneticsEngine.dict_to_dna(data, trusted=True)
+        validated = GeneticsEngine.dict_to_dna(data)
+        
+        assert trusted.traits[TraitCategory.BODY_COLOR].gene_sequence == "custom01"
+        assert trusted.dna_hash == validated.dna_hash
+    
+    def test_rejects_unknown_rarity(self, dna_dict):
+        """Test enum names are still checked"""
+        data = dict(dna_dict)
+        data["traits"] = dict(data["traits"], body_color=dict(data["traits"]["body_color"], rarity="mythic"))
+        
+        with pytest.raises(ValueError):
+            GeneticsEngine.dict_to_dna(data, trusted=True)
+
+
+class TestTraitCatalog:
+    """Test the compiled trait lookup tables"""
+
+    def test_pools_match_trait_pool(self):
+        """Test per-rarity pools mirror GeneticsEngine.TRAIT_POOL"""
+        for category in TraitCategory:
+            for rarity in Rarity:
+                assert TRAIT_CATALOG.pool(category, rarity) == tuple(GeneticsEngine.TRAIT_POOL[category][rarity])
+
+    def test_rarity_of(self):
+        """Test value lookups, including gen-locked and unknown values"""
+        assert TRAIT_CATALOG.rarity_of(TraitCategory.BODY_COLOR, "brown") == Rarity.COMMON
+        assert TRAIT_CATALOG.rarity_of(TraitCategory.BODY_COLOR, "crystal") == Rarity.LEGENDARY
+        assert TRAIT_CATALOG.rarity_of(TraitCategory.BODY_COLOR, "prismatic") == Rarity.LEGENDARY
+        assert TRAIT_CATALOG.rarity_of(TraitCategory.BODY_COLOR, "not_a_color") is None
+
+    def test_index_matches_trait_values(self):
+        """Test index_of agrees with TRAIT_VALUES positions"""
+        assert TRAIT_VALUES is TRAIT_CATALOG.values
+        for category, values in TRAIT_VALUES.items():
+            for index, value in enumerate(values):
+                assert TRAIT_CATALOG.index_of(category, value) == index
+
+    def test_roll_rarity_boundaries(self):
+        """Test rolls map onto the 60/25/10/5 split at exact boundaries"""
+        assert TRAIT_CATALOG.roll_rarity(0.0) == Rarity.COMMON
+        assert TRAIT_CATALOG.roll_rarity(0.5999999) == Rarity.COMMON
+        assert TRAIT_CATALOG.roll_rarity(0.6) == Rarity.UNCOMMON
+        assert TRAIT_CATALOG.roll_rarity(0.85) == Rarity.RARE
+        assert TRAIT_CATALOG.roll_rarity(0.95) == Rarity.LEGENDARY
+        assert TRAIT_CATALOG.roll_rarity(0.9999999999) == Rarity.LEGENDARY
+
+    def test_shift_rarity_clamped(self):
+        """Test rarity shifts stop at common and legendary"""
+        assert TRAIT_CATALOG.shift_rarity(Rarity.COMMON, -1) == Rarity.COMMON
+        assert TRAIT_CATALOG.shift_rarity(Rarity.COMMON, 1) == Rarity.UNCOMMON
+        assert TRAIT_CATALOG.shift_rarity(Rarity.LEGENDARY, 1) == Rarity.LEGENDARY
+
+    def test_immutable(self):
+        """Test the compiled tables cannot be modified"""
+        with pytest.raises(TypeError):
+            TRAIT_CATALOG.values[TraitCategory.BODY_COLOR] = ()
+        with pytest.raises(TypeError):
+            TRAIT_CATALOG.pools[TraitCategory.BODY_COLOR][Rarity.COMMON] = ()
+
+
+class TestSeededRng:
+    """Test deterministic RNG streams"""
+    
+    def _lineage(self, rng):
+        dna = GeneticsEngine.generate_random_dna(rng=rng)
+        for _ in range(5):
+            dna = GeneticsEngine.evolve(GeneticsEngine.breed(dna, rng=rng), 0.5, rng=rng)
+        return GeneticsEngine.dna_to_dict(dna)
+    
+    def test_same_seed_same_lineage(self):
+        """Test the same seed reproduces generate/breed/evolve exactly"""
+        assert self._lineage(seeded_rng(7)) == self._lineage(seeded_rng(7))
+    
+    def test_split_streams_differ(self):
+        """Test streams split by key are independent of each other"""
+        assert derive_seed(7, "worker", 0) != derive_seed(7, "worker", 1)
+        assert self._lineage(seeded_rng(7, "a")) != self._lineage(seeded_rng(7, "b"))
+    
+    def test_seeded_rng_leaves_global_state(self):
+        """Test passing an rng does not consume the global random stream"""
+        import random
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        self._lineage(seeded_rng(3))
+        assert random.random() == expected
+    
+    def test_stable_across_processes(self):
+        """Test a fresh interpreter derives the same lineage"""
+        code = (
+            "from src.genetics import GeneticsEngine, seeded_rng;"
+            "rng = seeded_rng(11, 'abc');"
+            "print(GeneticsEngine.breed(GeneticsEngine.generate_random_dna(rng=rng), rng=rng).dna_hash)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        
+        rng = seeded_rng(11, "abc")
+        child = GeneticsEngine.breed(GeneticsEngine.generate_random_dna(rng=rng), rng=rng)
+        assert result.stdout.strip() == child.dna_hash
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,169 @@
+"""
+Tests for the packed genome representation
+"""
+
+import pytest
+
+from src.genetics import GeneticsEngine, Rarity, Trait, TraitCategory
+from src.genome import FORMAT_VERSION, PackedGenome, decode_dna, dna_code_from_dict, encode_dna, pack_community
+
+
+class TestPackedGenome:
+    """Test packing and unpacking MonkeyDNA"""
+
+    def test_dna_round_trip(self, sample_dna):
+        """Test MonkeyDNA survives packing losslessly"""
+        packed = PackedGenome.from_dna(sample_dna)
+        restored = packed.to_dna()
+
+        assert restored.dna_hash == sample_dna.dna_hash
+        assert GeneticsEngine.dna_to_dict(restored) == GeneticsEngine.dna_to_dict(sample_dna)
+
+    def test_dict_round_trip(self, parent_child_pair):
+        """Test dna_to_dict output survives packing losslessly"""
+        for dna in parent_child_pair:
+            data = GeneticsEngine.dna_to_dict(dna)
+            packed = PackedGenome.from_dict(data)
+
+            assert packed.to_dict() == data
+            assert packed == PackedGenome.from_dna(dna)
+
+    def test_genes_fit_in_64_bits(self):
+        """Test all six traits pack into a single 64-bit integer"""
+        for _ in range(100):
+            packed = PackedGenome.from_dna(GeneticsEngine.generate_random_dna())
+            assert 0 <= packed.genes < 1 << 64
+
+    def test_gen_locked_traits_pack(self, legendary_trait):
+        """Test gen-locked traits are part of the packed vocabulary"""
+        dna = GeneticsEngine.generate_random_dna()
+        dna.traits[TraitCategory.SPECIAL] = legendary_trait
+        dna.dna_hash = dna._calculate_hash()
+
+        packed = PackedGenome.from_dna(dna)
+        assert packed.trait(TraitCategory.SPECIAL) == ("genesis_blessing", Rarity.LEGENDARY)
+        assert packed.get_rarity_score() == pytest.approx(dna.get_rarity_score())
+
+    def test_custom_gene_sequence_rejected(self, sample_dna):
+        """Test traits that cannot be restored exactly are refused"""
+        sample_dna.traits[TraitCategory.BODY_COLOR] = Trait(
+            category=TraitCategory.BODY_COLOR,
+            value="brown",
+            rarity=Rarity.COMMON,
+            gene_sequence="regen_brown"
+        )
+
+        with pytest.raises(ValueError):
+            PackedGenome.from_dna(sample_dna)
+
+    def test_missing_category_rejected(self, sample_dna):
+        """Test DNA without every category names the missing one"""
+        del sample_dna.traits[TraitCategory.PATTERN]
+
+        with pytest.raises(ValueError, match="pattern"):
+            PackedGenome.from_dna(sample_dna)
+
+        data = GeneticsEngine.dna_to_dict(sample_dna)
+        with pytest.raises(ValueError, match="pattern"):
+            PackedGenome.from_dict(data)
+        assert dna_code_from_dict(data) is None
+
+    def test_shared_traits(self, sample_dna):
+        """Test comparing packed genomes trait by trait"""
+        packed = PackedGenome.from_dna(sample_dna)
+        assert packed.shared_traits(packed) == len(TraitCategory)
+
+        evolved = GeneticsEngine.evolve(sample_dna, evolution_strength=0.0)
+        assert PackedGenome.from_dna(evolved).shared_traits(packed) == len(TraitCategory)
+
+    def test_pack_community(self, sample_dna):
+        """Test packing community data skips forks without DNA"""
+        community = {
+            "forks": [
+                {"full_name": "a/monkey", "monkey_dna": GeneticsEngine.dna_to_dict(sample_dna)},
+                {"full_name": "b/monkey", "monkey_dna": None},
+            ]
+        }
+
+        genomes = pack_community(community)
+        assert list(genomes) == ["a/monkey"]
+        assert genomes["a/monkey"].dna_hash_hex == sample_dna.dna_hash
+
+    def test_pack_community_skips_malformed(self, sample_dna):
+        """Test forks with malformed DNA are skipped, not fatal"""
+        good = GeneticsEngine.dna_to_dict(sample_dna)
+        bad = [
+            {**good, "traits": None},
+            {**good, "traits": {"body_color": "brown"}},
+            {**good, "dna_hash": "0x" + good["dna_hash"][2:]},
+            {**good, "dna_hash": 42},
+        ]
+        community = {"forks": [
+            {"full_name": f"bad/{i}", "monkey_dna": dna} for i, dna in enumerate(bad)
+        ] + [{"full_name": "a/monkey", "monkey_dna": good}]}
+
+        assert list(pack_community(community)) == ["a/monkey"]
+        assert all(dna_code_from_dict(dna) is None for dna in bad)
+
+    def test_hash_must_be_plain_hex(self, sample_dna):
+        """Test hashes int() would accept but that are not canonical are refused"""
+        for dna_hash in ("0x" + "1" * 14, "1_2" + "3" * 13, " " + "a" * 15, "A" * 16):
+            data = {**GeneticsEngine.dna_to_dict(sample_dna), "dna_hash": dna_hash}
+            with pytest.raises(ValueError, match="non-canonical"):
+                PackedGenome.from_dict(data)
+
+    def test_pack_community_from_code(self, sample_dna):
+        """Test forks that only carry a DNA code are packed too"""
+        community = {"forks": [{"full_name": "a/monkey", "dna_code": encode_dna(sample_dna)}]}
+
+        assert pack_community(community)["a/monkey"] == PackedGenome.from_dna(sample_dna)
+
+
+class TestBinaryFormat:
+    """Test the versioned binary DNA encoding"""
+
+    def test_bytes_round_trip(self, parent_child_pair):
+        """Test genomes with and without a parent survive encoding"""
+        parent, child = parent_child_pair
+        for dna in (parent, child):
+            packed = PackedGenome.from_dna(dna)
+            assert PackedGenome.from_bytes(packed.to_bytes()) == packed
+
+        assert len(PackedGenome.from_dna(child).to_bytes()) == len(PackedGenome.from_dna(parent).to_bytes()) + 8
+
+    def test_code_round_trip(self, sample_dna):
+        """Test the DNA code is URL-safe and decodes to the same monkey"""
+        code = encode_dna(sample_dna)
+
+        assert len(code) < 50
+        assert all(c.isalnum() or c in "-_" for c in code)
+        assert GeneticsEngine.dna_to_dict(decode_dna(code)) == GeneticsEngine.dna_to_dict(sample_dna)
+
+    def test_much_smaller_than_json(self, sample_dna):
+        """Test the binary form is an order of magnitude smaller than dna.json"""
+        import json
+        size = len(json.dumps(GeneticsEngine.dna_to_dict(sample_dna), indent=2))
+        assert len(PackedGenome.from_dna(sample_dna).to_bytes()) * 10 < size
+
+    def test_rejects_bad_data(self, sample_dna):
+        """Test wrong version, length and trait indices are rejected"""
+        data = PackedGenome.from_dna(sample_dna).to_bytes()
+
+        with pytest.raises(ValueError, match="version"):
+            PackedGenome.from_bytes(bytes([FORMAT_VERSION + 1]) + data[1:])
+        with pytest.raises(ValueError):
+            PackedGenome.from_bytes(data[:-1])
+        with pytest.raises(ValueError):
+            PackedGenome.from_bytes(data[:2] + b"\xff" * 6 + data[8:])
+        with pytest.raises(ValueError):
+            PackedGenome.from_code("not base64!")
+
+    def test_rejects_out_of_range_fields(self, sample_dna):
+        """Test fields wider than the format raise instead of truncating"""
+        packed = PackedGenome.from_dna(sample_dna)._replace(generation=1 << 16)
+        with pytest.raises(ValueError):
+            packed.to_bytes()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
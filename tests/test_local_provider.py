@@ -0,0 +1,104 @@
+"""
+Tests for the local stand-in AI provider
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.evolution import EvolutionAgent, GitHubProvider
+from src.genetics import TRAIT_CATALOG, GeneticsEngine, TraitCategory, seeded_rng
+from src.local_provider import LocalProvider, LocalProviderError, start_server
+
+
+@pytest.fixture
+def herd_dnas():
+    rng = seeded_rng(2, "local-herd")
+    return [GeneticsEngine.generate_random_dna(rng=rng) for _ in range(6)]
+
+
+class TestLocalProvider:
+    """Test the in-process provider"""
+
+    def test_evolution_reply_is_valid(self, sample_dna):
+        """Test replies parse and only use catalog traits"""
+        agent = EvolutionAgent(provider=LocalProvider())
+        decision = json.loads(agent.provider.generate_response(agent._prompt_for(sample_dna, 1)))
+
+        for change in decision["changes"]:
+            category = TraitCategory(change["category"])
+            assert TRAIT_CATALOG.rarity_of(category, change["new_value"]).value == change["new_rarity"]
+
+    def test_stories_are_reused(self, sample_dna):
+        """Test the stand-in's stories pass the single-call consistency check"""
+        provider = LocalProvider()
+        calls = []
+        original = provider.responder.respond
+        provider.responder.respond = lambda prompt: calls.append(prompt) or original(prompt)
+
+        EvolutionAgent(provider=provider).evolve_with_story(sample_dna)
+        assert len(calls) == 1
+
+    def test_batch_reply_covers_ids(self, herd_dnas):
+        """Test batch prompts get one decision per monkey id"""
+        results = EvolutionAgent(provider=LocalProvider()).evolve_batch(herd_dnas)
+        assert len(results) == len(herd_dnas)
+
+    def test_error_rate(self):
+        """Test failures are injected at the configured rate"""
+        provider = LocalProvider(error_rate=1.0)
+        with pytest.raises(LocalProviderError):
+            provider.generate_response("hi")
+        with pytest.raises(LocalProviderError):
+            asyncio.run(provider.agenerate_response("hi"))
+
+    def test_custom_templates(self):
+        """Test story templates can be overridden"""
+        provider = LocalProvider(templates={"retold_story": "NEW: {values}"})
+        reply = provider.generate_response("Generate a short story\n\nbody_color: brown → laser_eyes\n")
+        assert reply == "NEW: laser eyes"
+
+
+class TestLocalServer:
+    """Test the OpenAI-compatible HTTP stand-in"""
+
+    def test_github_provider_round_trip(self, sample_dna):
+        """Test GitHubProvider works against the local server via base_url"""
+        server, base_url = start_server(LocalProvider())
+        try:
+            provider = GitHubProvider("local", model="local", base_url=base_url)
+            agent = EvolutionAgent(provider=provider)
+            evolved, story = agent.evolve_with_story(sample_dna)
+        finally:
+            server.shutdown()
+
+        assert agent.fallbacks == 0
+        assert evolved.birth_timestamp == sample_dna.birth_timestamp
+        assert story
+
+    def test_errors_become_http_500(self, sample_dna):
+        """Test injected failures surface as provider errors and fall back"""
+        server, base_url = start_server(LocalProvider(error_rate=1.0))
+        try:
+            provider = GitHubProvider("local", model="local", base_url=base_url)
+            provider.client = provider.client.with_options(max_retries=0)
+            agent = EvolutionAgent(provider=provider)
+            agent.evolve_with_ai(sample_dna)
+        finally:
+            server.shutdown()
+
+        assert agent.fallbacks == 1
+
+    def test_fallbacks_counted_across_threads(self, sample_dna):
+        """Test concurrent fallbacks are all counted"""
+        agent = EvolutionAgent(provider=LocalProvider(error_rate=1.0))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: agent.evolve_with_ai(sample_dna), range(40)))
+
+        assert agent.fallbacks == 40
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
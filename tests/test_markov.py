@@ -0,0 +1,100 @@
+"""
+Tests for the Markov-chain evolution fast-forward
+"""
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from src.genetics import GeneticsEngine, Rarity, TraitCategory
+from src.markov import (
+    MUTATION_MATRIX,
+    RARITIES,
+    daily_transition,
+    fast_forward,
+    mutation_power,
+)
+
+
+class TestTransitionMatrices:
+    """Test the rarity transition matrices"""
+
+    def test_rows_are_stochastic(self):
+        """Test every row of the mutation matrix and its powers sums to one"""
+        for k in (1, 2, 7, 1000):
+            assert mutation_power(k).sum(axis=1) == pytest.approx(np.ones(len(RARITIES)))
+
+    def test_power_matches_repeated_multiplication(self):
+        """Test cached binary powers equal plain matrix powers"""
+        for k in (0, 1, 5, 13, 64):
+            assert np.allclose(mutation_power(k), np.linalg.matrix_power(MUTATION_MATRIX, k))
+
+    def test_zero_strength_is_identity(self):
+        """Test no evolution leaves rarities unchanged"""
+        assert np.allclose(daily_transition(0.0, 30), np.eye(len(RARITIES)))
+
+
+class TestFastForward:
+    """Test sampling the DNA after many days"""
+
+    def test_zero_days_is_unchanged(self, sample_dna):
+        """Test zero days returns the same traits and mutation count"""
+        evolved = fast_forward(sample_dna, 0, rng=np.random.default_rng(0))
+
+        assert evolved.dna_hash == sample_dna.dna_hash
+        assert evolved.mutation_count == sample_dna.mutation_count
+
+    def test_negative_days_rejected(self, sample_dna):
+        """Test negative days raise"""
+        with pytest.raises(ValueError):
+            fast_forward(sample_dna, -1)
+
+    def test_preserves_lineage(self, sample_dna):
+        """Test generation, parent and birth time carry over"""
+        evolved = fast_forward(sample_dna, 365, 0.5, rng=np.random.default_rng(1))
+
+        assert evolved.generation == sample_dna.generation
+        assert evolved.parent_id == sample_dna.parent_id
+        assert evolved.birth_timestamp == sample_dna.birth_timestamp
+        assert evolved.mutation_count > sample_dna.mutation_count
+
+    def test_traits_are_canonical(self, sample_dna):
+        """Test mutated traits come from the rarity pool they claim"""
+        evolved = fast_forward(sample_dna, 1000, 0.5, rng=np.random.default_rng(2))
+
+        for category, trait in evolved.traits.items():
+            assert trait.value in GeneticsEngine.TRAIT_POOL[category][trait.rarity]
+
+    def test_matches_day_by_day_evolution(self, sample_dna):
+        """Test rarity frequencies agree with repeated evolve calls"""
+        random.seed(3)
+        rng = np.random.default_rng(3)
+        category = TraitCategory.BODY_COLOR
+        days, strength, trials = 15, 0.3, 2000
+
+        stepped = Counter()
+        jumped = Counter()
+        for _ in range(trials):
+            dna = sample_dna
+            for _ in range(days):
+                dna = GeneticsEngine.evolve(dna, strength)
+            stepped[dna.traits[category].rarity] += 1
+            jumped[fast_forward(sample_dna, days, strength, rng).traits[category].rarity] += 1
+
+        expected = daily_transition(strength, days)[RARITIES.index(sample_dna.traits[category].rarity)]
+        for i, rarity in enumerate(RARITIES):
+            assert stepped[rarity] / trials == pytest.approx(expected[i], abs=0.04)
+            assert jumped[rarity] / trials == pytest.approx(expected[i], abs=0.04)
+
+    def test_engine_wrapper(self, sample_dna):
+        """Test GeneticsEngine.evolve_days delegates to the fast-forward"""
+        evolved = GeneticsEngine.evolve_days(sample_dna, 10, rng=np.random.default_rng(4))
+
+        assert set(evolved.traits) == set(sample_dna.traits)
+        assert all(isinstance(t.rarity, Rarity) for t in evolved.traits.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
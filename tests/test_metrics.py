@@ -0,0 +1,172 @@
+"""
+Tests for AI call metrics
+"""
+
+import contextvars
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.evolution import AIProvider, EvolutionAgent
+from src.local_provider import LocalProvider, LocalProviderError
+from src.metrics import (
+    MetricsSink,
+    annotate,
+    daily_summary,
+    estimated_cost,
+    fallback_reason,
+    read_records,
+    summarize,
+)
+from src.resilience import CircuitOpenError
+from src.response_cache import CachedProvider, ResponseCache
+
+
+class BrokenProvider(AIProvider):
+    def __init__(self, error):
+        self.error = error
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        raise self.error
+
+    def name(self) -> str:
+        return "Broken"
+
+
+class TestMetricsSink:
+    """Test recording and counters"""
+
+    def test_track_collects_annotations(self, tmp_path):
+        """Test annotate() fills the current record, which lands in the file"""
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(path)
+        with sink.track("evolution", "Fake", "gpt-4o"):
+            annotate(prompt_tokens=100, completion_tokens=20)
+        annotate(prompt_tokens=999)  # outside any call: ignored
+
+        records = read_records(path)
+        assert len(records) == 1
+        assert records[0]["prompt_tokens"] == 100
+        assert records[0]["completion_tokens"] == 20
+        assert sink.counters["prompt_tokens"] == 100
+        assert sink.summary()["calls"] == 1
+
+    def test_usage_adds_up(self):
+        """Test several attempts within one call add their tokens"""
+        sink = MetricsSink()
+        with sink.track("evolution") as record:
+            annotate(prompt_tokens=100, completion_tokens=20)
+            annotate(prompt_tokens=100, completion_tokens=30, model="gpt-4o")
+        assert (record["prompt_tokens"], record["completion_tokens"]) == (200, 50)
+        assert sink.counters["prompt_tokens"] == 200
+
+    def test_late_usage_is_its_own_record(self, tmp_path):
+        """Test a hedge finishing after the call cannot change its record"""
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(path)
+        context = {}
+        with sink.track("evolution", "Routed", "gpt-4o"):
+            annotate(prompt_tokens=100, completion_tokens=20)
+            context["late"] = contextvars.copy_context()
+        context["late"].run(annotate, prompt_tokens=100, completion_tokens=10, provider="Slow")
+
+        first, hedge = read_records(path)
+        assert (first["prompt_tokens"], first["provider"]) == (100, "Routed")
+        assert hedge["kind"] == "hedge"
+        assert (hedge["prompt_tokens"], hedge["completion_tokens"]) == (100, 10)
+        assert sink.counters["prompt_tokens"] == 200
+
+    def test_queue_time_excluded(self):
+        """Test time spent waiting for a slot is not counted as latency"""
+        ticks = iter([0.0, 1.0])
+        sink = MetricsSink(clock=lambda: next(ticks))
+        with sink.track("evolution") as record:
+            annotate(queue_ms=400.0)
+        assert sink.counters["wall_ms"] == 600.0
+        assert "queue_ms" not in record
+
+    def test_fallback_reasons(self):
+        """Test errors map to stable labels"""
+        assert fallback_reason(LocalProviderError("boom")) == "server_error"
+        assert fallback_reason(CircuitOpenError()) == "circuit_open"
+        assert fallback_reason(ValueError("no json")) == "bad_response"
+        assert fallback_reason(ConnectionError()) == "connection"
+
+
+class TestAgentMetrics:
+    """Test EvolutionAgent instrumentation"""
+
+    def test_tokens_and_kinds(self, sample_dna):
+        """Test evolution and story calls are recorded with token usage"""
+        agent = EvolutionAgent(provider=LocalProvider(seed=1), metrics=MetricsSink())
+        agent.evolve_with_ai(sample_dna)
+        agent.evolve_many_with_ai([sample_dna] * 3, with_story=False)
+
+        assert agent.metrics.counters["calls.evolution"] == 4
+        assert agent.metrics.counters["prompt_tokens"] > 0
+        assert agent.metrics.counters["completion_tokens"] > 0
+
+    def test_fallback_recorded(self, sample_dna):
+        """Test a failed call records why it fell back"""
+        agent = EvolutionAgent(provider=BrokenProvider(LocalProviderError("down")), metrics=MetricsSink())
+        agent.evolve_with_ai(sample_dna)
+        assert agent.metrics.summary()["fallbacks"] == {"server_error": 1}
+
+    def test_cache_hit_recorded(self, sample_dna):
+        """Test cache hits are flagged and spend no tokens"""
+        agent = EvolutionAgent(
+            provider=LocalProvider(seed=1), cache=ResponseCache(":memory:"), metrics=MetricsSink()
+        )
+        agent.evolve_with_ai(sample_dna)
+        tokens = agent.metrics.counters["prompt_tokens"]
+        agent.evolve_with_ai(sample_dna)
+
+        assert agent.metrics.counters["cache_hits"] == 1
+        assert agent.metrics.counters["prompt_tokens"] == tokens
+
+
+class TestReport:
+    """Test summaries and the CLI report"""
+
+    @pytest.fixture
+    def records(self):
+        return [
+            {"ts": "2026-01-01T03:00:00+00:00", "kind": "evolution", "model": "gpt-4o",
+             "prompt_tokens": 1_000_000, "completion_tokens": 0, "wall_ms": 100.0},
+            {"ts": "2026-01-01T03:00:01+00:00", "kind": "story", "model": "gpt-4o",
+             "prompt_tokens": 0, "completion_tokens": 100_000, "wall_ms": 300.0, "fallback": "timeout"},
+            {"ts": "2026-01-02T03:00:00+00:00", "kind": "evolution", "model": "local",
+             "prompt_tokens": 10, "completion_tokens": 5, "wall_ms": 50.0, "cache_hit": True},
+        ]
+
+    def test_summarize(self, records):
+        """Test totals, cost and fallbacks"""
+        summary = summarize(records)
+        assert summary["calls"] == 3
+        assert summary["cost_usd"] == pytest.approx(2.5 + 1.0)
+        assert summary["fallbacks"] == {"timeout": 1}
+        assert summary["cache_hit_rate"] == 0.3333
+        assert estimated_cost(records[2]) == 0
+
+    def test_daily(self, records):
+        """Test records are grouped per day in order"""
+        daily = daily_summary(records)
+        assert list(daily) == ["2026-01-01", "2026-01-02"]
+        assert daily["2026-01-01"]["wall_ms"]["p95"] == 300.0
+
+    def test_cli_report(self, records, tmp_path):
+        """Test the metrics command prints a row per day"""
+        path = tmp_path / "metrics.jsonl"
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+        result = CliRunner().invoke(cli, ["metrics", "--file", str(path)])
+
+        assert result.exit_code == 0
+        assert "2026-01-01" in result.output
+        assert "2026-01-02" in result.output
+        assert "$3.50" in result.output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
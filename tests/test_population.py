@@ -0,0 +1,240 @@
+"""
+Tests for the vectorized population engine
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.genetics import GeneticsEngine, MonkeyDNA, Rarity, Trait, TraitCategory
+from src.population import (
+    Population,
+    TraitStats,
+    breed_many,
+    evolve_many,
+    generate_many,
+    trait_stats,
+)
+
+
+def _rarity_frequencies(rarities: np.ndarray) -> np.ndarray:
+    """Share of each rarity level across all traits"""
+    return np.bincount(rarities.ravel(), minlength=len(Rarity)) / rarities.size
+
+
+@pytest.fixture
+def fixed_parent() -> MonkeyDNA:
+    """A Gen 1 parent with one trait of every rarity level"""
+    chosen = {
+        TraitCategory.BODY_COLOR: ("brown", Rarity.COMMON),
+        TraitCategory.FACE_EXPRESSION: ("wise", Rarity.UNCOMMON),
+        TraitCategory.ACCESSORY: ("halo", Rarity.RARE),
+        TraitCategory.PATTERN: ("void", Rarity.LEGENDARY),
+        TraitCategory.BACKGROUND: ("white", Rarity.COMMON),
+        TraitCategory.SPECIAL: ("genesis_blessing", Rarity.LEGENDARY),
+    }
+    traits = {
+        cat: Trait(category=cat, value=value, rarity=rarity)
+        for cat, (value, rarity) in chosen.items()
+    }
+    return MonkeyDNA(generation=1, traits=traits)
+
+
+class TestPopulationConversion:
+    """Test conversion between Population and MonkeyDNA"""
+
+    def test_round_trip(self):
+        """Test MonkeyDNA survives a round trip through Population"""
+        dnas = [GeneticsEngine.generate_random_dna() for _ in range(20)]
+        population = Population.from_dna(dnas)
+
+        assert len(population) == 20
+        for i, dna in enumerate(dnas):
+            restored = population.to_dna(i)
+            assert restored.dna_hash == dna.dna_hash
+            assert population.dna_hash(i) == dna.dna_hash
+            assert GeneticsEngine.dna_to_dict(restored) == GeneticsEngine.dna_to_dict(dna)
+
+    def test_rarity_scores_match_scalar(self):
+        """Test vectorized rarity scores match MonkeyDNA.get_rarity_score"""
+        dnas = [GeneticsEngine.generate_random_dna() for _ in range(50)]
+        scores = Population.from_dna(dnas).rarity_scores()
+
+        assert scores == pytest.approx([dna.get_rarity_score() for dna in dnas])
+
+    def test_unknown_trait_rejected(self, fixed_parent):
+        """Test traits outside the trait pool cannot be packed"""
+        fixed_parent.traits[TraitCategory.BODY_COLOR] = Trait(
+            category=TraitCategory.BODY_COLOR, value="plaid", rarity=Rarity.COMMON
+        )
+
+        with pytest.raises(ValueError):
+            Population.from_dna([fixed_parent])
+
+
+class TestPopulationOperations:
+    """Test vectorized breeding and evolution"""
+
+    def test_breed_many_layout(self, fixed_parent):
+        """Test children are laid out parent-major with lineage info"""
+        other = GeneticsEngine.generate_random_dna(generation=3)
+        children = GeneticsEngine.breed_many([fixed_parent, other], n=4, rng=np.random.default_rng(1))
+
+        assert len(children) == 8
+        assert list(children.parent_index) == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert list(children.generation) == [2] * 4 + [4] * 4
+        assert children.to_dna(0).parent_id == fixed_parent.dna_hash
+        assert children.to_dna(7).parent_id == other.dna_hash
+
+    def test_generation_locks_respected(self):
+        """Test late generations never roll extinct gen-locked traits"""
+        population = generate_many(20000, generation=20, rng=np.random.default_rng(2))
+        dnas = [population.to_dna(i) for i in range(0, 20000, 97)]
+
+        for dna in dnas:
+            for cat, trait in dna.traits.items():
+                assert trait.value in GeneticsEngine.TRAIT_POOL[cat][trait.rarity]
+
+    def test_evolve_many_counts_mutations(self):
+        """Test mutation counts track the traits that were re-rolled"""
+        population = generate_many(1000, rng=np.random.default_rng(3))
+        evolved = evolve_many(population, evolution_strength=1.0, rng=np.random.default_rng(4))
+
+        assert (evolved.mutation_count == len(TraitCategory)).all()
+
+        unchanged = evolve_many(population, evolution_strength=0.0, rng=np.random.default_rng(5))
+        assert (unchanged.values == population.values).all()
+        assert (unchanged.mutation_count == 0).all()
+
+    def test_generate_many_matches_scalar(self):
+        """Test vectorized generation matches generate_random_dna statistically"""
+        random.seed(6)
+        scalar = Population.from_dna([GeneticsEngine.generate_random_dna() for _ in range(4000)])
+        vector = generate_many(40000, rng=np.random.default_rng(7))
+
+        assert _rarity_frequencies(vector.rarities) == pytest.approx(
+            _rarity_frequencies(scalar.rarities), abs=0.02
+        )
+
+    def test_breed_many_matches_scalar(self, fixed_parent):
+        """Test vectorized breeding matches breed statistically"""
+        random.seed(8)
+        scalar = Population.from_dna([GeneticsEngine.breed(fixed_parent) for _ in range(4000)])
+        vector = breed_many([fixed_parent], n=40000, rng=np.random.default_rng(9))
+
+        for c in range(len(TraitCategory)):
+            scalar_freq = np.bincount(scalar.values[:, c], minlength=20) / len(scalar)
+            vector_freq = np.bincount(vector.values[:, c], minlength=20) / len(vector)
+            assert vector_freq == pytest.approx(scalar_freq, abs=0.03)
+
+    def test_evolve_many_matches_scalar(self, fixed_parent):
+        """Test vectorized evolution matches evolve statistically"""
+        random.seed(10)
+        scalar = Population.from_dna(
+            [GeneticsEngine.evolve(fixed_parent, evolution_strength=0.5) for _ in range(4000)]
+        )
+        vector = evolve_many([fixed_parent] * 40000, evolution_strength=0.5, rng=np.random.default_rng(11))
+
+        assert _rarity_frequencies(vector.rarities) == pytest.approx(
+            _rarity_frequencies(scalar.rarities), abs=0.02
+        )
+        assert vector.mutation_count.mean() == pytest.approx(scalar.mutation_count.mean(), abs=0.1)
+
+
+class TestTraitStats:
+    """Test the bincount trait aggregator"""
+
+    def test_counts_match_python(self):
+        """Test counts and moments agree with a plain Python tally"""
+        dnas = generate_many(300, generation=2, rng=np.random.default_rng(3)).to_dna_list()
+        stats = trait_stats(dnas)
+        scores = np.array([dna.get_rarity_score() for dna in dnas])
+
+        for category in TraitCategory:
+            expected = {}
+            for dna in dnas:
+                value = dna.traits[category].value
+                expected[value] = expected.get(value, 0) + 1
+            assert stats.value_distribution()[category.value] == expected
+            assert sum(stats.rarity_distribution()[category.value].values()) == len(dnas)
+
+        assert stats.generations() == {2: 300}
+        assert stats.score_mean == pytest.approx(scores.mean())
+        assert stats.score_std == pytest.approx(scores.std())
+        assert stats.score_max == scores.max()
+
+    def test_packed_and_records_agree(self):
+        """Test PackedGenome and raw dict input give the same aggregates"""
+        from src.genome import PackedGenome
+
+        dnas = generate_many(50, rng=np.random.default_rng(4)).to_dna_list()
+        records = [
+            (dna.generation, dna.get_rarity_score(), GeneticsEngine.dna_to_dict(dna)["traits"])
+            for dna in dnas
+        ]
+
+        expected = trait_stats(dnas).to_dict()
+        assert trait_stats([PackedGenome.from_dna(dna) for dna in dnas]).to_dict() == expected
+        assert TraitStats.from_records(records).to_dict() == expected
+
+    def test_records_with_custom_traits(self):
+        """Test values and categories outside the catalog are still counted"""
+        stats = TraitStats.from_records([
+            (1, 10.0, {"body_color": {"value": "ai_teal", "rarity": "rare"}}),
+            (3, 20.0, {"body_color": "brown", "tail": "curly"}),
+            (3, 30.0, {"body_color": {"value": "ai_teal", "rarity": "rare"}}),
+        ])
+
+        assert stats.value_distribution() == {
+            "body_color": {"brown": 1, "ai_teal": 2},
+            "tail": {"curly": 1},
+        }
+        assert stats.rarity_distribution()["body_color"]["rare"] == 2
+        assert stats.generations() == {1: 1, 3: 2}
+        assert stats.most_common_trait() == {"trait": "body_color", "value": "ai_teal", "count": 2}
+        assert stats.rarest_trait()["count"] == 1
+        assert stats.score_mean == pytest.approx(20.0)
+
+    def test_records_with_invalid_numbers(self):
+        """Test garbage generations and scores from forks are not fed to NumPy"""
+        stats = TraitStats.from_records([
+            (None, None, {}),
+            ("garbage", "high", {}),
+            (10**12, float("nan"), {}),
+            (-3, 250, {}),
+            ("2", "40.5", {}),
+            (2.0, 10, {}),
+            (1.5, -5, {}),
+        ])
+
+        assert stats.count == 7
+        assert stats.generations() == {2: 2}
+        assert stats.score_max == 100.0
+        assert stats.score_min == 0.0
+        assert stats.score_mean == pytest.approx((100.0 + 40.5 + 10) / 7)
+
+    def test_records_with_unhashable_traits(self):
+        """Test list or dict values and rarities from forks are skipped"""
+        stats = TraitStats.from_records([
+            (1, 10, {"body_color": {"value": ["brown"], "rarity": "common"}}),
+            (1, 10, {"body_color": {"value": "brown", "rarity": {"x": 1}}}),
+            (1, 10, {"pattern": {"value": {"nested": True}}, "tail": ["curly"]}),
+            (1, 10, ["not", "a", "dict"]),
+        ])
+
+        assert stats.count == 4
+        assert stats.value_distribution() == {"body_color": {"brown": 1}}
+        assert sum(stats.rarity_distribution()["body_color"].values()) == 0
+
+    def test_empty(self):
+        """Test an empty collection aggregates to zeros"""
+        stats = TraitStats.from_records([])
+
+        assert stats.count == 0
+        assert stats.most_common_trait() is None
+        assert stats.generations() == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
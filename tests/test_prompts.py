@@ -0,0 +1,119 @@
+"""
+Tests for the evolution prompt builder
+"""
+
+import json
+
+import pytest
+
+from src.evolution import _chat_messages, _claude_request
+from src.genetics import TRAIT_CATALOG, GeneticsEngine, TraitCategory, seeded_rng
+from src.local_provider import LocalResponder
+from src.prompts import (
+    EVOLUTION_PREFIX,
+    batch_prompt,
+    dna_traits,
+    evolution_prompt,
+    monkey_delta,
+    split_cached_prefix,
+)
+
+
+class TestPrefix:
+    """Test the static prefix"""
+
+    def test_lists_whole_catalog(self):
+        """Test every rollable value is in the prefix, grouped by rarity"""
+        for category in TraitCategory:
+            line = next(l for l in EVOLUTION_PREFIX.splitlines() if l.startswith(f"- {category.value}:"))
+            groups = line.split(": ", 1)[1].split(" | ")
+            assert len(groups) == len(TRAIT_CATALOG.rarities)
+            for rarity, group in zip(TRAIT_CATALOG.rarities, groups):
+                assert group.split(", ") == list(TRAIT_CATALOG.pool(category, rarity))
+
+    def test_shared_by_every_prompt(self, sample_dna):
+        """Test single and batch prompts start with the same prefix"""
+        traits = dna_traits(sample_dna)
+        single = evolution_prompt(traits, 3, sample_dna.generation)
+        batch = batch_prompt([monkey_delta(1, traits, "m1")], 3)
+
+        for prompt in (single, batch):
+            prefix, rest = split_cached_prefix(prompt)
+            assert prefix == EVOLUTION_PREFIX
+            assert "Days since last evolution: 3" in rest
+        assert split_cached_prefix("Generate a short story") == ("", "Generate a short story")
+
+
+class TestDelta:
+    """Test the per-monkey line"""
+
+    def test_omits_catalog_rarities(self, sample_dna):
+        """Test values listed in the prefix are sent without their rarity"""
+        line = json.loads(monkey_delta(sample_dna.generation, dna_traits(sample_dna)))
+
+        assert line["generation"] == sample_dna.generation
+        for category, trait in sample_dna.traits.items():
+            assert line["traits"][category.value] == trait.value
+
+    def test_keeps_unlisted_rarities(self):
+        """Test gen-locked and invented values carry their rarity"""
+        traits = {
+            "special": {"value": "genesis_blessing", "rarity": "legendary"},
+            "pattern": {"value": "plaid", "rarity": "rare"},
+            "body_color": {"value": "golden", "rarity": "rare"},
+        }
+        line = json.loads(monkey_delta(1, traits, "m4"))
+
+        assert line["id"] == "m4"
+        assert line["traits"] == {
+            "special": "genesis_blessing (legendary)",
+            "pattern": "plaid (rare)",
+            "body_color": "golden (rare)",
+        }
+
+    def test_smaller_than_full_traits(self):
+        """Test the delta is much shorter than the indented trait dump"""
+        rng = seeded_rng(2, "delta")
+        for _ in range(20):
+            dna = GeneticsEngine.generate_random_dna(rng=rng)
+            full = json.dumps(dna_traits(dna), indent=2)
+            assert len(monkey_delta(dna.generation, dna_traits(dna))) < len(full) / 2
+
+
+class TestProviderRequests:
+    """Test how the prefix is handed to the SDKs"""
+
+    def test_claude_caches_prefix(self, sample_dna):
+        """Test the prefix becomes a cache_control system block"""
+        prompt = evolution_prompt(dna_traits(sample_dna), 1, 1)
+        request = _claude_request(prompt)
+
+        assert request["system"] == [
+            {"type": "text", "text": EVOLUTION_PREFIX, "cache_control": {"type": "ephemeral"}}
+        ]
+        assert EVOLUTION_PREFIX + request["messages"][0]["content"] == prompt
+
+    def test_chat_messages(self, sample_dna):
+        """Test OpenAI-style requests lead with the same system message"""
+        prompt = evolution_prompt(dna_traits(sample_dna), 1, 1)
+        messages = _chat_messages(prompt)
+
+        assert messages[0] == {"role": "system", "content": EVOLUTION_PREFIX}
+        assert _chat_messages("Generate a short story") == [{"role": "user", "content": "Generate a short story"}]
+
+    def test_local_responder_understands_prompts(self, sample_dna):
+        """Test the stand-in still tells single and batch prompts apart"""
+        traits = dna_traits(sample_dna)
+        responder = LocalResponder()
+
+        single = json.loads(responder.respond(evolution_prompt(traits, 1, 1)))
+        batch = json.loads(responder.respond(batch_prompt(
+            [monkey_delta(1, traits, "m1"), monkey_delta(2, traits, "m2")], 1
+        )))
+
+        assert isinstance(single, dict)
+        assert [entry["id"] for entry in batch] == ["m1", "m2"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
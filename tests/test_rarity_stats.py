@@ -0,0 +1,66 @@
+"""
+Tests for the exact rarity-score distribution
+"""
+
+import numpy as np
+import pytest
+
+from src.genetics import TraitCategory
+from src.population import generate_many
+from src.rarity_stats import (
+    LOCK_HORIZON,
+    category_point_distribution,
+    get_distribution,
+    rarity_percentile,
+)
+
+
+class TestRarityDistribution:
+    """Test rarity-score distribution and percentiles"""
+
+    def test_probabilities_sum_to_one(self):
+        """Test the distribution is normalized for every generation"""
+        for generation in (1, 3, 5, 10, 50):
+            assert sum(get_distribution(generation).probabilities) == pytest.approx(1.0)
+
+    def test_category_gen_locked_boost(self):
+        """Test gen-locked rolls add legendary weight only while available"""
+        gen1 = category_point_distribution(TraitCategory.SPECIAL, 1)
+        late = category_point_distribution(TraitCategory.SPECIAL, 20)
+        face = category_point_distribution(TraitCategory.FACE_EXPRESSION, 1)
+
+        assert gen1[10] == pytest.approx(0.05 + 0.95 * 0.05)
+        assert late[10] == pytest.approx(0.05)
+        assert face[10] == pytest.approx(0.05)
+
+    def test_percentile_bounds(self):
+        """Test the lowest score beats nobody and the highest beats almost everyone"""
+        distribution = get_distribution(1)
+
+        assert distribution.percentile(10.0) == 0.0
+        assert distribution.percentile(100.0) > 99.99
+        assert distribution.percentile(101.0) == 100.0
+
+    def test_percentile_monotonic(self):
+        """Test higher scores never have a lower percentile"""
+        previous = -1.0
+        for score in range(0, 101, 5):
+            current = rarity_percentile(score, generation=2)
+            assert current >= previous
+            previous = current
+
+    def test_late_generations_share_cache(self):
+        """Test generations past every lock reuse one distribution"""
+        assert get_distribution(LOCK_HORIZON) is get_distribution(LOCK_HORIZON + 100)
+
+    def test_matches_simulation(self):
+        """Test exact percentiles agree with simulated monkeys"""
+        scores = generate_many(100000, rng=np.random.default_rng(0)).rarity_scores()
+
+        for score in (15, 20, 30, 50):
+            simulated = (scores < score - 1e-9).mean() * 100
+            assert rarity_percentile(score, generation=1) == pytest.approx(simulated, abs=0.7)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
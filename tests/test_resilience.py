@@ -0,0 +1,248 @@
+"""
+Tests for retries, backoff, circuit breaking and deadlines
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from src.evolution import AIProvider, EvolutionAgent
+from src.local_provider import LocalProviderError
+from src.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    ResilientProvider,
+    RetryPolicy,
+    deadline,
+    is_retryable,
+    remaining_time,
+    retry_after,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class APIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code, headers)
+
+
+class ScriptedProvider(AIProvider):
+    """Raises the scripted errors in order, then answers"""
+
+    def __init__(self, errors=(), answer="ok"):
+        self.errors = list(errors)
+        self.answer = answer
+        self.calls = 0
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.answer
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        return self.generate_response(prompt, max_tokens)
+
+    def name(self) -> str:
+        return "Scripted"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def resilient(provider, breaker=None, sleeps=None, **policy):
+    policy.setdefault("base_delay", 0.01)
+    return ResilientProvider(
+        provider,
+        RetryPolicy(rng=random.Random(0), **policy),
+        breaker or CircuitBreaker(),
+        sleep=(sleeps.append if sleeps is not None else lambda seconds: None),
+    )
+
+
+class TestClassification:
+    """Test which errors are retried"""
+
+    def test_retryable(self):
+        """Test rate limits, server errors and network errors are transient"""
+        assert is_retryable(APIError(429))
+        assert is_retryable(APIError(503))
+        assert is_retryable(APIError(408))
+        assert is_retryable(ConnectionError())
+        assert is_retryable(LocalProviderError("boom"))
+
+    def test_not_retryable(self):
+        """Test client errors and our own fail-fast errors are final"""
+        assert not is_retryable(APIError(400))
+        assert not is_retryable(APIError(401))
+        assert not is_retryable(ValueError("bad json"))
+        assert not is_retryable(CircuitOpenError())
+        assert not is_retryable(DeadlineExceeded())
+
+    def test_retry_after(self):
+        """Test Retry-After and retry-after-ms headers"""
+        assert retry_after(APIError(429, {"retry-after": "3"})) == 3.0
+        assert retry_after(APIError(429, {"retry-after-ms": "250"})) == 0.25
+        assert retry_after(APIError(429)) is None
+
+
+class TestRetries:
+    """Test the retry loop"""
+
+    def test_retries_then_succeeds(self):
+        """Test transient failures are retried until an answer arrives"""
+        provider = ScriptedProvider([APIError(503), APIError(429)])
+        wrapped = resilient(provider)
+
+        assert wrapped.generate_response("hi") == "ok"
+        assert provider.calls == 3
+        assert wrapped.retries == 2
+
+    def test_client_error_not_retried(self):
+        """Test a 400 is raised on the first attempt"""
+        provider = ScriptedProvider([APIError(400)])
+        with pytest.raises(APIError):
+            resilient(provider).generate_response("hi")
+        assert provider.calls == 1
+
+    def test_gives_up_after_max_attempts(self):
+        """Test the last error surfaces once attempts run out"""
+        provider = ScriptedProvider([APIError(500)] * 10)
+        with pytest.raises(APIError):
+            resilient(provider, max_attempts=3).generate_response("hi")
+        assert provider.calls == 3
+
+    def test_backoff_honours_retry_after(self):
+        """Test the wait is at least what the server asked for"""
+        sleeps = []
+        provider = ScriptedProvider([APIError(429, {"retry-after": "2"})])
+        resilient(provider, sleeps=sleeps).generate_response("hi")
+        assert sleeps == [2.0]
+
+    def test_backoff_grows_and_is_capped(self):
+        """Test full-jitter delays stay under the exponential cap"""
+        policy = RetryPolicy(base_delay=1, max_delay=5, rng=random.Random(1))
+        for attempt in range(1, 8):
+            assert 0 <= policy.delay(attempt) <= min(5, 2 ** (attempt - 1))
+
+    def test_async_path(self):
+        """Test agenerate_response retries the same way"""
+        provider = ScriptedProvider([ConnectionError(), APIError(502)])
+        wrapped = resilient(provider)
+        assert asyncio.run(wrapped.agenerate_response("hi")) == "ok"
+        assert provider.calls == 3
+
+
+class TestCircuitBreaker:
+    """Test the per-provider circuit breaker"""
+
+    def test_opens_and_fails_fast(self):
+        """Test an outage stops reaching the provider"""
+        provider = ScriptedProvider([APIError(500)] * 100)
+        wrapped = resilient(provider, CircuitBreaker(failure_threshold=3), max_attempts=10)
+
+        with pytest.raises(APIError):
+            wrapped.generate_response("hi")
+        assert provider.calls == 3
+        with pytest.raises(CircuitOpenError):
+            wrapped.generate_response("hi")
+        assert provider.calls == 3
+
+    def test_half_open_probe(self):
+        """Test one probe after the cool-down closes or re-opens the circuit"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now = 20
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_client_error_ends_probe(self):
+        """Test a probe answered with a client error still closes the circuit"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 1
+
+        with pytest.raises(APIError):
+            resilient(ScriptedProvider([APIError(404)]), breaker).generate_response("hi")
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestDeadline:
+    """Test deadline propagation"""
+
+    def test_nested_deadlines_keep_the_earliest(self):
+        """Test an inner deadline cannot extend an outer one"""
+        assert remaining_time() is None
+        with deadline(1):
+            with deadline(60):
+                assert remaining_time() <= 1
+        assert remaining_time() is None
+
+    def test_expired_deadline_skips_call(self):
+        """Test nothing is sent once the deadline has passed"""
+        provider = ScriptedProvider()
+        with deadline(0):
+            with pytest.raises(DeadlineExceeded):
+                resilient(provider).generate_response("hi")
+        assert provider.calls == 0
+
+    def test_no_backoff_past_deadline(self):
+        """Test a retry that would overrun the deadline is abandoned"""
+        provider = ScriptedProvider([APIError(429, {"retry-after": "30"})])
+        with deadline(1):
+            with pytest.raises(APIError):
+                resilient(provider, max_delay=60).generate_response("hi")
+        assert provider.calls == 1
+
+    def test_batch_timeout_falls_back(self, sample_dna):
+        """Test a timed-out batch still returns every monkey"""
+
+        class Stalled(AIProvider):
+            async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+                await asyncio.sleep(0.05)
+                raise APIError(503)
+
+            def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+                raise APIError(503)
+
+            def name(self) -> str:
+                return "Stalled"
+
+        agent = EvolutionAgent(provider=resilient(Stalled(), base_delay=10))
+        start = time.perf_counter()
+        results = agent.evolve_many_with_ai([sample_dna] * 4, with_story=False, timeout=0.5)
+
+        assert len(results) == 4
+        assert agent.fallbacks == 4
+        assert time.perf_counter() - start < 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,176 @@
+"""
+Tests for the AI response cache
+"""
+
+import asyncio
+
+import pytest
+
+from src.evolution import AIProvider, EvolutionAgent
+from src.genetics import GeneticsEngine, seeded_rng
+from src.response_cache import CacheMiss, CachedProvider, ResponseCache, cache_key
+
+
+class CountingProvider(AIProvider):
+    """Returns the prompt reversed (or a fixed reply) and counts real calls"""
+
+    def __init__(self, model="m1", reply=None):
+        self.model = model
+        self.reply = reply
+        self.calls = 0
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        self.calls += 1
+        return prompt[::-1] if self.reply is None else self.reply
+
+    def name(self) -> str:
+        return "Counting"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    """Test the SQLite store"""
+
+    def test_key_covers_request(self):
+        """Test provider, model, prompt and max_tokens all change the key"""
+        base = cache_key("p", "m", "prompt", 100)
+        assert base == cache_key("p", "m", "prompt", 100)
+        assert len({base, cache_key("q", "m", "prompt", 100), cache_key("p", "n", "prompt", 100),
+                    cache_key("p", "m", "other", 100), cache_key("p", "m", "prompt", 200)}) == 5
+
+    def test_ttl_expiry(self):
+        """Test entries older than the TTL are misses"""
+        clock = FakeClock()
+        cache = ResponseCache(":memory:", ttl=60, clock=clock)
+        cache.put("k", "value")
+
+        clock.now += 30
+        assert cache.get("k") == "value"
+        clock.now += 31
+        assert cache.get("k") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction_by_size(self):
+        """Test the least recently used entries go first once over max_bytes"""
+        clock = FakeClock()
+        cache = ResponseCache(":memory:", max_bytes=20, clock=clock)
+        for key in "abc":
+            clock.now += 1
+            cache.put(key, "x" * 8)
+            if key == "b":
+                clock.now += 1
+                cache.get("a")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 8
+        assert cache.get("c") == "x" * 8
+        assert cache.evictions == 1
+
+    def test_invalidate(self):
+        """Test a single entry can be dropped"""
+        cache = ResponseCache(":memory:")
+        cache.put("k", "value")
+
+        assert cache.invalidate("k") is True
+        assert cache.invalidate("k") is False
+        assert cache.get("k") is None
+
+    def test_persistent(self, tmp_path):
+        """Test responses survive reopening the file"""
+        path = tmp_path / "cache.sqlite"
+        cache = ResponseCache(path)
+        cache.put("k", "value")
+        cache.close()
+
+        assert ResponseCache(path).get("k") == "value"
+
+
+class TestCachedProvider:
+    """Test the provider wrapper"""
+
+    def test_repeats_served_from_cache(self):
+        """Test identical requests reach the provider once"""
+        inner = CountingProvider()
+        provider = CachedProvider(inner, ResponseCache(":memory:"))
+
+        assert provider.generate_response("abc") == "cba"
+        assert provider.generate_response("abc") == "cba"
+        provider.generate_response("abc", max_tokens=10)
+
+        assert inner.calls == 2
+        assert provider.cache.stats()["hits"] == 1
+
+    def test_async_shares_cache(self):
+        """Test the async path reads and fills the same cache"""
+        inner = CountingProvider()
+        provider = CachedProvider(inner, ResponseCache(":memory:"))
+        provider.generate_response("abc")
+
+        assert asyncio.run(provider.agenerate_response("abc")) == "cba"
+        assert asyncio.run(provider.agenerate_response("xyz")) == "zyx"
+        assert inner.calls == 2
+
+    def test_replay_only(self):
+        """Test replay-only mode never calls the provider"""
+        cache = ResponseCache(":memory:")
+        CachedProvider(CountingProvider(), cache).generate_response("abc")
+        cache.replay_only = True
+        inner = CountingProvider()
+        provider = CachedProvider(inner, cache)
+
+        assert provider.generate_response("abc") == "cba"
+        with pytest.raises(CacheMiss):
+            provider.generate_response("new prompt")
+        assert inner.calls == 0
+
+    def test_agent_uses_cache(self, sample_dna):
+        """Test the evolution agent wraps its provider and replays offline"""
+        cache = ResponseCache(":memory:")
+        inner = CountingProvider(reply='{"changes": [], "evolution_story": "Resting."}')
+        agent = EvolutionAgent(provider=inner, cache=cache)
+        agent.evolve_with_ai(sample_dna)
+        agent.evolve_with_ai(sample_dna)
+
+        assert inner.calls == 1
+        assert agent.provider.name() == "Counting (cached)"
+
+    @pytest.mark.parametrize("reply", ["", "not json", '{"changes": [{"category": "body'])
+    def test_agent_skips_malformed_reply(self, sample_dna, reply):
+        """Test empty, garbled or truncated replies are not replayed"""
+        cache = ResponseCache(":memory:")
+        inner = CountingProvider(reply=reply)
+        agent = EvolutionAgent(provider=inner, cache=cache)
+        agent.evolve_with_ai(sample_dna)
+        asyncio.run(agent.aevolve_with_ai(sample_dna))
+
+        assert inner.calls == 2
+        assert len(cache) == 0
+
+    def test_agent_skips_incomplete_batch(self, sample_dna):
+        """Test a batch reply missing monkeys is not replayed"""
+        cache = ResponseCache(":memory:")
+        agent = EvolutionAgent(provider=CountingProvider(reply="[]"), cache=cache)
+        agent.evolve_batch([sample_dna, sample_dna])
+
+        assert len(cache) == 0
+
+    def test_agent_skips_empty_story(self):
+        """Test an empty story reply falls back and is not cached"""
+        rng = seeded_rng(1, "story")
+        old, new = GeneticsEngine.generate_random_dna(rng=rng), GeneticsEngine.generate_random_dna(rng=rng)
+        cache = ResponseCache(":memory:")
+        agent = EvolutionAgent(provider=CountingProvider(reply="  "), cache=cache)
+
+        assert agent.generate_evolution_story(old, new).startswith("Your monkey evolved!")
+        assert len(cache) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
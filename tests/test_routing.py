@@ -0,0 +1,194 @@
+"""
+Tests for latency-aware provider routing
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.evolution import AIProvider, EvolutionAgent
+from src.metrics import MetricsSink, annotate
+from src.resilience import CircuitBreaker, ResilientProvider
+from src.routing import MIN_SAMPLES, RoutingProvider
+
+
+class TimedProvider(AIProvider):
+    """Answers with its label after a fixed delay, or fails"""
+
+    def __init__(self, label, delay=0.0, fail=False, tokens=None):
+        self.label = label
+        self.delay = delay
+        self.fail = fail
+        self.tokens = tokens
+        self.calls = 0
+
+    def generate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.label} down")
+        if self.tokens is not None:
+            annotate(prompt_tokens=self.tokens)
+        return self.label
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 1024) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.label} down")
+        return self.label
+
+    def name(self) -> str:
+        return self.label
+
+
+class TestRouting:
+    """Test provider choice"""
+
+    def test_prefers_fastest(self):
+        """Test traffic moves to the provider with the lowest rolling latency"""
+        slow, fast = TimedProvider("slow", 0.03), TimedProvider("fast", 0.001)
+        router = RoutingProvider([slow, fast], hedge_delay=None)
+        router.stats[0].record_success(0.03)
+        router.stats[1].record_success(0.001)
+
+        assert [router.generate_response("hi") for _ in range(5)] == ["fast"] * 5
+        assert slow.calls == 0
+
+    def test_untried_providers_keep_order(self):
+        """Test the first configured provider is used before any stats exist"""
+        first, second = TimedProvider("first"), TimedProvider("second")
+        router = RoutingProvider([first, second], hedge_delay=None)
+        assert router.generate_response("hi") == "first"
+
+    def test_untried_provider_gets_prior(self):
+        """Test a never-tried backup is preferred over a provider slower than the prior"""
+        primary, backup = TimedProvider("primary"), TimedProvider("backup")
+        router = RoutingProvider([primary, backup], hedge_delay=None, prior_latency=1.0)
+        router.stats[0].record_success(3.0)
+
+        assert router.ranked() == ([1, 0], 2)
+        assert router.generate_response("hi") == "backup"
+        assert router.report()["backup"]["latency_ms"] is not None
+
+    def test_failover(self):
+        """Test a failed request moves on to the next provider"""
+        router = RoutingProvider([TimedProvider("down", fail=True), TimedProvider("up")], hedge_delay=None)
+        assert router.generate_response("hi") == "up"
+        assert router.failovers == 1
+        assert asyncio.run(router.agenerate_response("hi")) == "up"
+
+    def test_all_fail(self):
+        """Test the last error surfaces when every provider fails"""
+        router = RoutingProvider([TimedProvider("a", fail=True), TimedProvider("b", fail=True)])
+        with pytest.raises(ConnectionError, match="b down"):
+            router.generate_response("hi")
+
+    def test_high_error_rate_is_unhealthy(self):
+        """Test a failing provider drops behind slower healthy ones"""
+        flaky, steady = TimedProvider("flaky"), TimedProvider("steady")
+        router = RoutingProvider([flaky, steady], hedge_delay=None)
+        router.stats[0].record_success(0.001)
+        router.stats[1].record_success(0.5)
+        for _ in range(MIN_SAMPLES):
+            router.stats[0].record_error()
+
+        assert not router.healthy(0)
+        assert router.ranked() == ([1, 0], 1)
+        assert router.generate_response("hi") == "steady"
+
+    def test_open_circuit_is_unhealthy(self):
+        """Test a provider behind an open breaker is only a fallback"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        wrapped = ResilientProvider(TimedProvider("tripped"), breaker=breaker)
+        router = RoutingProvider([wrapped, TimedProvider("other")], hedge_delay=None)
+
+        assert router.ranked() == ([1, 0], 1)
+
+
+class TestHedging:
+    """Test hedged requests"""
+
+    def test_hedge_wins_sync(self):
+        """Test a stalled request is overtaken by the hedge"""
+        stalled, backup = TimedProvider("stalled", 0.5), TimedProvider("backup", 0.01)
+        router = RoutingProvider([stalled, backup], hedge_delay=0.02)
+
+        start = time.perf_counter()
+        assert router.generate_response("hi") == "backup"
+        assert time.perf_counter() - start < 0.3
+        assert router.hedges == 1
+
+    def test_hedge_wins_async(self):
+        """Test the async path hedges and cancels the loser"""
+        stalled, backup = TimedProvider("stalled", 0.5), TimedProvider("backup", 0.01)
+        router = RoutingProvider([stalled, backup], hedge_delay=0.02)
+
+        assert asyncio.run(router.agenerate_response("hi")) == "backup"
+        assert router.hedges == 1
+        # The abandoned call counts as at least as slow as it ran
+        assert router.stats[0].latency() >= 0.02
+        assert router.stats[0].calls == 0
+
+    def test_losing_hedge_metrics(self):
+        """Test the winner is credited and a late loser's tokens get their own record"""
+        stalled, backup = TimedProvider("stalled", 0.15, tokens=7), TimedProvider("backup", 0.01, tokens=5)
+        router = RoutingProvider([stalled, backup], hedge_delay=0.02)
+        sink = MetricsSink()
+        with sink.track("evolution", router.name()) as record:
+            assert router.generate_response("hi") == "backup"
+        time.sleep(0.3)
+
+        assert (record["provider"], record["prompt_tokens"]) == ("backup", 5)
+        assert sink.counters["calls.hedge"] == 1
+        assert sink.counters["prompt_tokens"] == 12
+
+    def test_executor_reused(self):
+        """Test sync requests share one thread pool until close()"""
+        router = RoutingProvider([TimedProvider("a")], hedge_delay=None)
+        router.generate_response("hi")
+        pool = router._pool
+        router.generate_response("hi")
+
+        assert router._pool is pool
+        router.close()
+        assert router._pool is None
+        assert router.generate_response("hi") == "a"
+        router.close()
+
+    def test_no_hedge_when_fast(self):
+        """Test quick answers do not trigger extra calls"""
+        primary, backup = TimedProvider("primary"), TimedProvider("backup")
+        router = RoutingProvider([primary, backup], hedge_delay=0.2)
+        for _ in range(3):
+            assert asyncio.run(router.agenerate_response("hi")) == "primary"
+        assert backup.calls == 0
+        assert router.hedges == 0
+
+
+class TestAgentSetup:
+    """Test AI_PROVIDER lists"""
+
+    def test_comma_list_routes(self, monkeypatch):
+        """Test unusable providers are skipped and the rest are routed"""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.delenv("AI_CACHE", raising=False)
+        monkeypatch.setenv("AI_HEDGE_DELAY", "1.5")
+        agent = EvolutionAgent(provider_type="claude,local")
+
+        assert isinstance(agent.provider, RoutingProvider)
+        assert agent.provider.name() == "Routed (Local)"
+        assert agent.provider.hedge_delay == 1.5
+
+    def test_no_usable_provider(self, monkeypatch):
+        """Test a list with no usable provider is an error"""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with pytest.raises(ValueError):
+            EvolutionAgent(provider_type="claude,github")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -15,7 +15,9 @@ from src.scan_community import (
     generate_community_data,
     generate_leaderboard,
     generate_family_tree,
-    generate_network_stats
+    generate_network_stats,
+    generate_dna_dump,
+    stats_from_dna
 )
 
 
@@ -179,6 +181,28 @@ class TestCollectRepos:
         assert names.count("user1/fork1") == 1
 
 
+class TestStatsFromDna:
+    """Test fallback stats for forks without stats.json"""
+    
+    def test_derived_from_dna(self, dna_dict, sample_dna):
+        """Test stats come from the fork's DNA"""
+        stats = stats_from_dna(dna_dict, age=3)
+        
+        assert stats["generation"] == sample_dna.generation
+        assert stats["rarity_score"] == sample_dna.get_rarity_score()
+        assert stats["age_days"] == 3
+    
+    def test_defaults_without_valid_dna(self):
+        """Test missing or malformed DNA falls back to defaults"""
+        assert stats_from_dna(None, age=1)["rarity_score"] == 0
+        assert stats_from_dna({"traits": {"body_color": {}}}, age=1)["generation"] == 1
+    
+    def test_fetched_dna_is_validated(self, dna_dict):
+        """Test DNA from other forks is coerced, not trusted as-is"""
+        assert stats_from_dna({**dna_dict, "generation": "3"}, age=1)["generation"] == 3
+        assert stats_from_dna({**dna_dict, "generation": "three"}, age=1)["generation"] == 1
+
+
 class TestScanRepo:
     """Test individual repo scanning"""
     
@@ -327,6 +351,78 @@ class TestGenerators:
             generate_family_tree("owner/root", monkeys)
             
             assert mock_file.write.called or mock_open.called
+    
+    def test_generate_dna_dump(self, tmp_path, monkeypatch, sample_dna):
+        """Test the compact DNA dump only lists forks with a DNA code"""
+        from src.genome import decode_dna, encode_dna
+        monkeypatch.chdir(tmp_path)
+        code = encode_dna(sample_dna)
+        
+        generate_dna_dump([
+            {"full_name": "a/monkey", "dna_code": code},
+            {"full_name": "b/monkey", "dna_code": None},
+        ])
+        
+        import json
+        data = json.loads((tmp_path / "web" / "community_dna.json").read_text())
+        assert data["monkeys"] == {"a/monkey": code}
+        assert decode_dna(data["monkeys"]["a/monkey"]).dna_hash == sample_dna.dna_hash
+    
+    def test_generate_network_stats(self, tmp_path, monkeypatch, dna_dict):
+        """Test aggregates mix stats.json traits with dna.json fallbacks"""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "web").mkdir()
+        
+        generate_network_stats([
+            {"monkey_stats": {"generation": 1, "rarity_score": 20.0,
+                              "traits": {"body_color": {"value": "brown", "rarity": "common"}}}},
+            {"monkey_stats": {"generation": 2, "rarity_score": 40.0}, "monkey_dna": dna_dict},
+            {"monkey_stats": None, "monkey_dna": None},
+        ])
+        
+        import json
+        data = json.loads((tmp_path / "web" / "network_stats.json").read_text())
+        assert data["total_monkeys"] == 3
+        assert data["generations"] == {"1": 2, "2": 1}
+        assert data["avg_rarity"] == 20.0
+        assert data["trait_distribution"]["body_color"]["brown"] >= 1
+        assert set(data["trait_distribution"]) == set(dna_dict["traits"])
+    
+    def test_generate_network_stats_invalid_generation(self, tmp_path, monkeypatch):
+        """Test null or garbage generations from forks don't break the scan"""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "web").mkdir()
+        
+        generate_network_stats([
+            {"monkey_stats": {"generation": None, "rarity_score": 10, "traits": {}}},
+            {"monkey_stats": {"generation": "ten", "rarity_score": None, "traits": {}}},
+            {"monkey_stats": {"generation": 10**15, "rarity_score": 30, "traits": {}}},
+            {"monkey_stats": {"generation": 3, "rarity_score": 20, "traits": {}}},
+        ])
+        
+        import json
+        data = json.loads((tmp_path / "web" / "network_stats.json").read_text())
+        assert data["total_monkeys"] == 4
+        assert data["generations"] == {"3": 1}
+        assert data["avg_rarity"] == 15.0
+    
+    def test_generate_leaderboard_invalid_stats(self, tmp_path, monkeypatch):
+        """Test null or string generations and scores from forks still rank"""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "web").mkdir()
+        monkeys = self._create_sample_monkeys()
+        monkeys[0]["monkey_stats"].update({"generation": None, "rarity_score": None})
+        monkeys[1]["monkey_stats"].update({"generation": "2", "rarity_score": "80"})
+        monkeys[2]["monkey_stats"].update({"generation": "three", "rarity_score": [60]})
+        
+        generate_leaderboard(monkeys)
+        
+        import json
+        rankings = json.loads((tmp_path / "web" / "leaderboard.json").read_text())["rankings"]
+        assert [r["full_name"] for r in rankings] == ["user1/fork1", "owner/root", "user2/fork_of_fork"]
+        assert [r["generation"] for r in rankings] == [2, 1, 1]
+        assert rankings[0]["rarity_score"] == 80.0
+        assert rankings[0]["rarity_percentile"] > rankings[1]["rarity_percentile"]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Tests for the lineage simulator
+"""
+
+import json
+
+import pytest
+
+from src.genetics import GeneticsEngine, seeded_rng
+from src.simulate import GenerationStats, simulate
+
+
+@pytest.fixture
+def genesis():
+    return GeneticsEngine.generate_random_dna(rng=seeded_rng(5))
+
+
+class TestGenerationStats:
+    """Test per-generation aggregates"""
+
+    def test_add_and_merge(self, sample_dna):
+        """Test merging two shards equals counting everything in one"""
+        left = GenerationStats(1)
+        left.add(sample_dna)
+        right = GenerationStats(1)
+        right.add(sample_dna)
+        right.add(sample_dna)
+        left.merge(right)
+
+        assert left.count == 3
+        assert left.trait_count(sample_dna.traits[next(iter(sample_dna.traits))].value) >= 3
+        assert sum(left.rarities.values()) == 3 * len(sample_dna.traits)
+        assert left.mean_rarity() == pytest.approx(sample_dna.get_rarity_score())
+
+    def test_dict_round_trip(self, sample_dna):
+        """Test aggregates survive the trip through a worker process"""
+        stats = GenerationStats(2)
+        stats.add(sample_dna)
+        restored = GenerationStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+
+        assert restored.to_dict() == stats.to_dict()
+
+
+class TestSimulate:
+    """Test fork-tree simulation"""
+
+    def test_generation_sizes(self, genesis):
+        """Test the tree grows by the branching factor until capped"""
+        result = simulate(genesis, generations=4, branching=2, shards=2, max_width=4, workers=1)
+        counts = [stats.count for stats in result.generations.values()]
+
+        assert counts == [1, 2, 4, 8, 8]
+        assert result.total_monkeys == sum(counts)
+        assert result.monkeys_per_second > 0
+
+    def test_same_seed_any_worker_count(self, genesis):
+        """Test aggregates do not depend on how shards are scheduled"""
+        serial = simulate(genesis, generations=3, shards=3, seed=9, workers=1)
+        parallel = simulate(genesis, generations=3, shards=3, seed=9, workers=2)
+
+        for generation, stats in serial.generations.items():
+            other = parallel.generations[generation]
+            assert other.count == stats.count
+            assert other.rarities == stats.rarities
+            assert other.traits == stats.traits
+            assert other.mean_rarity() == pytest.approx(stats.mean_rarity())
+
+    def test_streams_records(self, genesis, tmp_path):
+        """Test one JSONL record is written per shard and generation"""
+        output = tmp_path / "sim.jsonl"
+        simulate(genesis, generations=3, shards=2, workers=1, output=output)
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+
+        assert len(records) == 2 * 3
+        assert {record["shard"] for record in records} == {0, 1}
+
+    def test_last_seen(self, genesis):
+        """Test trait survival lookup across generations"""
+        result = simulate(genesis, generations=3, shards=2, workers=1, seed=1)
+        carried = genesis.traits[next(iter(genesis.traits))].value
+
+        assert result.last_seen(carried) >= genesis.generation
+        assert result.last_seen("not_a_trait") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
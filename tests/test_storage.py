@@ -48,6 +48,21 @@ class TestMonkeyStorage:
         assert loaded.dna_hash == dna.dna_hash
         assert loaded.generation == dna.generation
     
+    def test_load_dna_trusted(self, temp_storage):
+        """Test the trusted loader returns the same DNA as the validated one"""
+        dna = GeneticsEngine.generate_random_dna()
+        temp_storage.save_dna_locally(dna)
+        
+        assert temp_storage.load_dna(trusted=True) == temp_storage.load_dna()
+    
+    def test_save_and_load_dna_binary(self, temp_storage):
+        """Test the compact binary DNA file round-trips"""
+        dna = GeneticsEngine.generate_random_dna()
+        
+        assert temp_storage.save_dna_binary(dna)
+        assert (temp_storage.data_dir / "dna.bin").stat().st_size < 40
+        assert temp_storage.load_dna_binary().dna_hash == dna.dna_hash
+    
     def test_load_nonexistent_dna(self, temp_storage):
         """Test loading when no DNA exists"""
         dna = temp_storage.load_dna()
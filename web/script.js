@@ -164,6 +164,7 @@ const ForkMonkey = {
             ['dna', `${basePath}monkey_data/dna.json`],
             ['stats', `${basePath}monkey_data/stats.json`],
             ['history', `${basePath}monkey_data/history.json`],
+            ['breedingOdds', `${basePath}monkey_data/breeding_odds.json`],
             // Files in web/ (same folder as index.html)
             ['community', 'community_data.json'],
             ['leaderboard', 'leaderboard.json'],
@@ -321,6 +322,17 @@ const ForkMonkey = {
             document.getElementById('stat-generation').textContent = stats.generation || 1;
             document.getElementById('stat-age').textContent = `${stats.age_days || 0} days`;
             document.getElementById('stat-rarity').textContent = `${(stats.rarity_score || 0).toFixed(1)}%`;
+            const rarityHints = [];
+            if (stats.rarity_percentile !== undefined) {
+                rarityHints.push(`Rarer than ${stats.rarity_percentile.toFixed(1)}% of monkeys`);
+            }
+            const odds = this.data.breedingOdds;
+            if (odds && odds.parent_hash === stats.dna_hash) {
+                rarityHints.push(`A fork has a ${(odds.any_legendary_chance * 100).toFixed(1)}% chance of a legendary trait`);
+            }
+            if (rarityHints.length) {
+                document.getElementById('stat-rarity').title = rarityHints.join('\n');
+            }
             document.getElementById('stat-mutations').textContent = stats.mutation_count || 0;
             document.getElementById('stat-parent').textContent = stats.parent_id || 'Genesis';
 
@@ -897,7 +909,7 @@ const ForkMonkey = {
                         </a>
                     </td>
                     <td class="rarity-col">
-                        <span class="rarity-display">${(entry.rarity_score || 0).toFixed(1)}%</span>
+                        <span class="rarity-display"${entry.rarity_percentile !== undefined ? ` title="Rarer than ${entry.rarity_percentile.toFixed(1)}% of monkeys"` : ''}>${(entry.rarity_score || 0).toFixed(1)}%</span>
                     </td>
                     <td class="gen-col">${entry.generation || 1}</td>
                     <td class="age-col">${entry.age_days || 0} days</td>
@@ -1179,7 +1191,11 @@ const ForkMonkey = {
             return;
         }
 
-        const blob = new Blob([JSON.stringify(dna, null, 2)], { type: 'application/json' });
+        // Include the compact, URL-safe DNA code when stats.json provides one
+        const dnaCode = this.data.stats?.dna_code;
+        const exported = dnaCode ? { ...dna, dna_code: dnaCode } : dna;
+
+        const blob = new Blob([JSON.stringify(exported, null, 2)], { type: 'application/json' });
         const url = URL.createObjectURL(blob);
 
         const link = document.createElement('a');